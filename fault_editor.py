@@ -1,21 +1,28 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import math
+import os
+import pickle
+from collections import deque
+from contextlib import contextmanager
 from enum import Enum, auto
 
 from PyQt6.QtCore import (
     Qt, QPointF, QRectF, QLineF, QSize, QEvent, QTimer,
-    pyqtSignal, QSignalBlocker, 
+    pyqtSignal, 
 )
 from PyQt6.QtGui import (
     QAction, QActionGroup,
     QPixmap, QPen, QBrush, 
     QPainterPath, QPainterPathStroker,
     QFont, QTransform,
-    QPolygonF, QPainter, QIcon, QColor
+    QPolygonF, QPainter, QIcon, QColor, QPixmapCache,
+    QDoubleValidator, QIntValidator, QValidator
 )
 from PyQt6.QtWidgets import (
-    QStyle, QDialog, QFrame,
+    QDialog, QFrame,
     QMenuBar, QMenu,
     QGraphicsObject, 
     QGraphicsView, QGraphicsScene,
@@ -25,8 +32,9 @@ from PyQt6.QtWidgets import (
     QGraphicsTextItem, QGraphicsSimpleTextItem,
     QLabel, QWidget, QVBoxLayout, QHBoxLayout, QMessageBox,   
     QListWidget, QListWidgetItem, 
-    QLineEdit, QTextEdit, QCheckBox,
-    QGraphicsLineItem
+    QLineEdit, QPlainTextEdit, QCheckBox,
+    QGraphicsLineItem, QGraphicsProxyWidget,
+    QStyledItemDelegate, QListView
 )
 
 # =====================================================
@@ -45,10 +53,89 @@ class DragMode(Enum):
     MOVE = auto()
     MOVE_ANCHOR = auto()
 
+# =====================================================
+# 공유 pen / brush / font (도형마다 새로 만들지 않음)
+# =====================================================
+def _make_pen(color, width, style=Qt.PenStyle.SolidLine) -> QPen:
+    pen = QPen(color, width)
+    pen.setStyle(style)
+    # cosmetic: 줌과 무관하게 화면 px 두께 유지 (확대 시 캐시 무효화 방지)
+    pen.setCosmetic(True)
+    return pen
+
+RED_PEN_1 = _make_pen(Qt.GlobalColor.red, 1)
+RED_PEN_2 = _make_pen(Qt.GlobalColor.red, 2)
+RED_PEN_3 = _make_pen(Qt.GlobalColor.red, 3)
+RED_BRUSH = QBrush(Qt.GlobalColor.red)
+WHITE_BRUSH = QBrush(Qt.GlobalColor.white)
+NO_BRUSH = QBrush(Qt.BrushStyle.NoBrush)
+BLUE_PEN_2 = _make_pen(Qt.GlobalColor.blue, 2)   # 도형 패널 아이콘 (memo)
+
+MEMO_PEN = _make_pen(QColor(30, 144, 255), 2)
+MEMO_SELECTED_PEN = _make_pen(QColor(255, 80, 80), 3, Qt.PenStyle.DashLine)
+ARROW_SELECTED_PEN = _make_pen(QColor(255, 80, 80), 4, Qt.PenStyle.DashLine)
+
+# memo 선 hit-test 영역 (시각적 선보다 넓게)
+_HIT_STROKER = QPainterPathStroker()
+_HIT_STROKER.setWidth(10)
+
+_FONT_CACHE: dict[tuple, QFont] = {}
+
+def shared_font(family: str, size: int, weight=QFont.Weight.Normal) -> QFont:
+    """QFont는 QApplication 생성 이후에 만들어야 하므로 최초 사용 시 생성 후 공유"""
+    key = (family, size, weight)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = QFont(family, size, weight)
+        _FONT_CACHE[key] = font
+    return font
+
+_ICON_CACHE: dict[str, QIcon] = {}
+
+def _cached_icon(fn):
+    """도형 패널 아이콘은 내용이 고정 → 처음 한 번만 그려 QIcon으로 모든 편집기가 공유 (QApplication 이후 생성)"""
+    @functools.wraps(fn)
+    def wrapper(self):
+        icon = _ICON_CACHE.get(fn.__name__)
+        if icon is None:
+            icon = QIcon(fn(self))
+            _ICON_CACHE[fn.__name__] = icon
+        return icon
+    return wrapper
+
+# 도면 이미지: 같은 파일을 다시 열 때 디코딩 생략 (수정 시각이 바뀌면 새로 읽음)
+PLAN_PIXMAP_CACHE_KB = 256 * 1024   # 기본 10MB로는 큰 도면 한 장도 못 담음
+
+def _load_plan_pixmap(path: str) -> QPixmap:
+    try:
+        key = f"{path}:{os.path.getmtime(path)}"
+    except OSError:
+        return QPixmap(path)
+
+    pix = QPixmapCache.find(key)
+    if pix is None:
+        pix = QPixmap(path)
+        if not pix.isNull():
+            if QPixmapCache.cacheLimit() < PLAN_PIXMAP_CACHE_KB:
+                QPixmapCache.setCacheLimit(PLAN_PIXMAP_CACHE_KB)
+            QPixmapCache.insert(key, pix)
+    return pix
+
 # =====================================================
 # 공통 베이스
 # =====================================================
+# 도형(저장 대상) 표식: hit-test 때 hasattr 대신 item.data() 로 판별
+SHAPE_TAG_KEY = 0
+SHAPE_TAG = 1
+
+def _is_shape(item) -> bool:
+    return item.data(SHAPE_TAG_KEY) == SHAPE_TAG
+
 class BaseMarkMixin:
+    # 외곽선 캐시 무효화용 (도형 자체 geometry가 바뀔 때 증가)
+    _geom_version = 0
+    _min_base_cache: tuple[int, float] | None = None   # (geom_version, 긴 변)
+
     def setup_flags(self):
         self.setFlags(
             QGraphicsItem.GraphicsItemFlag.ItemIsSelectable |
@@ -56,6 +143,7 @@ class BaseMarkMixin:
             QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges
         )
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemClipsChildrenToShape, False)
+        self.setData(SHAPE_TAG_KEY, SHAPE_TAG)
         self._attached_line = None
 
     def itemChange(self, change, value):
@@ -68,7 +156,20 @@ class BaseMarkMixin:
             self._update_defect_label_pos()
 
         return QGraphicsItem.itemChange(self, change, value)
-        
+
+    def _bump_geom_version(self):
+        self._geom_version += 1
+
+    def min_base_size(self) -> float:
+        # boundingRect의 긴 변 (geometry가 바뀔 때만 다시 계산)
+        cached = self._min_base_cache
+        if cached is not None and cached[0] == self._geom_version:
+            return cached[1]
+        rect = self.boundingRect()
+        base = max(rect.width(), rect.height())
+        self._min_base_cache = (self._geom_version, base)
+        return base
+
     def _update_attached_line_geometry(self):
         anchor_scene = getattr(self, "_line_anchor_scene_pos", None)
         line = getattr(self, "_attached_line", None)
@@ -94,6 +195,7 @@ class DirtyMixin:
 
 class DefectLabelMixin:
     _defect_label: QGraphicsSimpleTextItem | None = None
+    _last_label_pos: tuple[float, float] | None = None
 
     def enable_defect_label(self, text: str):
         if self._defect_label is not None:
@@ -104,22 +206,13 @@ class DefectLabelMixin:
 
         label = DefectLabelItem(text, self)
         self._defect_label = label
+        self._last_label_pos = None
+        # Z / 색 / 마우스 버튼은 DefectLabelItem.__init__ 에서 이미 설정됨
         self._update_defect_label_pos()
-        label.setZValue(10)
-        label.setDefaultTextColor(Qt.GlobalColor.red)
-        label.setTextInteractionFlags(
-            Qt.TextInteractionFlag.NoTextInteraction
-        )
-        label.setAcceptedMouseButtons(Qt.MouseButton.LeftButton)    
-        
-        self._update_defect_label_pos()       
 
     def _enable_label_edit(self):
         if self._defect_label:
-            self._defect_label.setTextInteractionFlags(
-                Qt.TextInteractionFlag.TextEditorInteraction
-            )
-            self._defect_label.setFocus()
+            self._defect_label.begin_edit()
 
     def update_defect_label(self, text: str):
         if self._defect_label:
@@ -132,9 +225,14 @@ class DefectLabelMixin:
         if self._defect_label:
             self.scene().removeItem(self._defect_label)
             self._defect_label = None
+            self._last_label_pos = None
 
     def _update_defect_label_pos(self):
-        if not self._defect_label:
+        label = self._defect_label
+        if not label:
+            return
+        # 화면에 안 보이는 도형/라벨은 계산 생략
+        if self.scene() is None or not self.isVisible() or not label.isVisible():
             return
 
         rect = self.boundingRect()
@@ -147,96 +245,271 @@ class DefectLabelMixin:
 
         x = rect.right() + MARGIN_X
         y = rect.bottom() - label_rect.height() + MARGIN_Y
+
+        # 위치 변화가 0.5px 미만이면 setPos 생략
+        last = self._last_label_pos
+        if last is not None and abs(last[0] - x) < 0.5 and abs(last[1] - y) < 0.5:
+            return
+        self._last_label_pos = (x, y)
         self._defect_label.setPos(x, y)
         
-class DefectLabelItem(QGraphicsTextItem):
+class DefectLabelItem(QGraphicsSimpleTextItem):
+    """
+    도형 옆 부재 텍스트.
+    평소에는 가벼운 SimpleText로 표시만 하고,
+    더블클릭 시에만 QLineEdit(proxy)를 띄워 편집한다.
+    """
     def __init__(self, text: str, owner_mark):
         super().__init__(text, owner_mark)
         self._owner = owner_mark
+        self._edit_proxy: QGraphicsProxyWidget | None = None
         self.setZValue(10)
-        self.setDefaultTextColor(Qt.GlobalColor.red)
-        font = QFont("Malgun Gothic", 14, QFont.Weight.Medium)
-        self.setFont(font)
-        self.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+        self.setBrush(RED_BRUSH)
+        self.setFont(shared_font("Malgun Gothic", 14, QFont.Weight.Medium))
         self.setAcceptedMouseButtons(Qt.MouseButton.LeftButton)
 
     # 안전한 텍스트 설정 API
     def set_text(self, text: str):
-        self.setPlainText(text)
+        self.setText(text)
+
+    def toPlainText(self) -> str:
+        return self.text()
 
     def mouseDoubleClickEvent(self, event):
         # 텍스트 더블클릭 → 텍스트 편집만
-        self.setTextInteractionFlags(
-            Qt.TextInteractionFlag.TextEditorInteraction
-        )
-        self.setFocus(Qt.FocusReason.MouseFocusReason)
-
+        self.begin_edit()
         event.accept()   # 중요: 부모로 이벤트 전파 차단
 
-    def focusOutEvent(self, event):
+    def begin_edit(self):
+        if self._edit_proxy is not None:
+            return
+
+        edit = QLineEdit(self.text())
+        edit.setFont(self.font())
+        edit.setMinimumWidth(int(self.boundingRect().width()) + 40)
+        edit.editingFinished.connect(self._finish_edit)
+
+        # 라벨을 숨기므로 proxy는 라벨이 아니라 owner의 자식으로 둔다
+        proxy = QGraphicsProxyWidget(self._owner)
+        proxy.setWidget(edit)
+        proxy.setZValue(self.zValue() + 1)
+        proxy.setPos(self.pos())
+        self._edit_proxy = proxy
+
+        self.hide()
+        edit.selectAll()
+        edit.setFocus(Qt.FocusReason.MouseFocusReason)
+
+    def _finish_edit(self):
+        # Enter + focus out 으로 두 번 올 수 있음
+        proxy = self._edit_proxy
+        if proxy is None:
+            return
+        self._edit_proxy = None
+
+        self.setText(proxy.widget().text())
+        self.show()
+
         # 편집 종료 → owner에 저장
         if hasattr(self._owner, "defect_info"):
-            self._owner.defect_info["member"] = self.toPlainText()
+            self._owner.defect_info["member"] = self.text()
         if hasattr(self._owner, "_mark_dirty"):
             self._owner._mark_dirty()
 
-        self.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
-        super().focusOutEvent(event)        
+        # 시그널 처리 중이므로 위젯 삭제는 이벤트 루프로 미룬다
+        proxy.hide()
+        proxy.deleteLater()
 
 class IdTextItem(QGraphicsSimpleTextItem):
     def set_text(self, text: str):
         self.setText(text)
 
+# -----------------------------------------------------
+# ray / 외곽선 계산 (Qt 객체 없이 float 만 사용하는 순수 함수)
+# -----------------------------------------------------
+def _bounding_circle(coords: list[tuple[float, float, float, float]]) -> tuple[float, float, float]:
+    """빠른 배제용 bounding circle (AABB 중심 + 가장 먼 꼭짓점까지 거리)"""
+    if not coords:
+        return 0.0, 0.0, 0.0
+
+    min_x = max_x = coords[0][0]
+    min_y = max_y = coords[0][1]
+    for x, y, _ex, _ey in coords:
+        if x < min_x:
+            min_x = x
+        elif x > max_x:
+            max_x = x
+        if y < min_y:
+            min_y = y
+        elif y > max_y:
+            max_y = y
+
+    cx = (min_x + max_x) / 2
+    cy = (min_y + max_y) / 2
+    r2 = 0.0
+    for x, y, _ex, _ey in coords:
+        d2 = (x - cx) * (x - cx) + (y - cy) * (y - cy)
+        if d2 > r2:
+            r2 = d2
+    return cx, cy, math.sqrt(r2)
+
+def _closest_ray_hit(coords, ox, oy, dx, dy, t_min2, t_max2) -> float | None:
+    """
+    ray: O + t*D, edge: P1 + u*E (0 <= u <= 1) 중 가장 가까운 교차의 t.
+    t = cross(W, E) / cross(D, E), u = cross(W, D) / cross(D, E), W = P1 - O
+    t_min2 < t^2 <= t_max2 범위만 인정 (D 길이 기준으로 미리 환산된 값)
+    """
+    best_t = None
+    for x1, y1, ex, ey in coords:
+        denom = dx * ey - dy * ex
+        if denom == 0.0:
+            continue  # 평행
+        wx = x1 - ox
+        wy = y1 - oy
+        t = (wx * ey - wy * ex) / denom
+        if t <= 0.0 or t * t <= t_min2 or t * t > t_max2:
+            continue
+        u = (wx * dy - wy * dx) / denom
+        if u < 0.0 or u > 1.0:
+            continue
+        if best_t is None or t < best_t:
+            best_t = t
+    return best_t
+
+def _rdp(points: list[tuple[float, float]], eps: float) -> list[tuple[float, float]]:
+    """Ramer–Douglas–Peucker 단순화 (재귀 대신 stack, 거리는 제곱 비교)"""
+    n = len(points)
+    if n < 3 or eps <= 0.0:
+        return list(points)
+
+    keep = [False] * n
+    keep[0] = keep[-1] = True
+    eps2 = eps * eps
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        ax, ay = points[first]
+        bx, by = points[last]
+        ex = bx - ax
+        ey = by - ay
+        len2 = ex * ex + ey * ey
+
+        best_i = -1
+        best_d2 = 0.0
+        for i in range(first + 1, last):
+            px, py = points[i]
+            wx = px - ax
+            wy = py - ay
+            if len2 > 0.0:
+                # 선분까지 거리² = cross² / |b-a|²  →  비교는 cross² 와 eps²·|b-a|²
+                cross = wx * ey - wy * ex
+                d2 = cross * cross / len2
+            else:
+                d2 = wx * wx + wy * wy
+            if d2 > best_d2:
+                best_i = i
+                best_d2 = d2
+
+        if best_i >= 0 and best_d2 > eps2:
+            keep[best_i] = True
+            stack.append((first, best_i))
+            stack.append((best_i, last))
+
+    return [p for p, k in zip(points, keep) if k]
+
 class GeometryRayMixin:
+    # scene 좌표 외곽선 캐시 (pos/rotation/scale/geometry 가 그대로면 재사용)
+    _outline_coords: list[tuple[float, float, float, float]] | None = None
+    _outline_cache_key: tuple | None = None
+    _bound_center_scene: tuple[float, float] = (0.0, 0.0)
+    _bound_radius_scene: float = 0.0
+
+    RAY_LENGTH = 10000.0
+    _RAY_LENGTH2 = RAY_LENGTH * RAY_LENGTH
+
     def _outline_segments_scene(self) -> list[QLineF]:
-        segments: list[QLineF] = []
+        return [
+            QLineF(x1, y1, x1 + ex, y1 + ey)
+            for x1, y1, ex, ey in self._outline_coords_scene()
+        ]
 
-        if isinstance(self, QGraphicsPolygonItem):
-            poly = self.polygon()
-            scene_poly = self.mapToScene(poly)
-            n = len(scene_poly)
-            for i in range(n):
-                segments.append(QLineF(scene_poly[i], scene_poly[(i + 1) % n]))
-            return segments
+    def _outline_polys_scene(self) -> list[QPolygonF]:
+        # 기본: shape() 외곽 (다각형 도형은 override)
+        return self.mapToScene(self.shape()).toSubpathPolygons()
 
-        scene_path = self.mapToScene(self.shape())
-        polys = scene_path.toSubpathPolygons()
-        for poly in polys:
-            n = len(poly)
+    def _outline_coords_scene(self) -> list[tuple[float, float, float, float]]:
+        key = (
+            self.pos().x(), self.pos().y(),
+            self.rotation(), self.scale(),
+            self.transformOriginPoint().x(), self.transformOriginPoint().y(),
+            getattr(self, "_geom_version", 0),
+        )
+        if self._outline_coords is not None and self._outline_cache_key == key:
+            return self._outline_coords
+
+        # 교차 계산용 float 좌표 (x1, y1, dx, dy) - 꼭짓점에서 바로 계산 (QLineF 생성 없음)
+        coords: list[tuple[float, float, float, float]] = []
+        for poly in self._outline_polys_scene():
+            pts = [(p.x(), p.y()) for p in poly]
+            n = len(pts)
             for i in range(n):
-                segments.append(QLineF(poly[i], poly[(i + 1) % n]))
-        return segments
+                x1, y1 = pts[i]
+                x2, y2 = pts[(i + 1) % n]
+                coords.append((x1, y1, x2 - x1, y2 - y1))
+
+        cx, cy, radius = _bounding_circle(coords)
+        self._bound_center_scene = (cx, cy)
+        self._bound_radius_scene = radius
+
+        self._outline_coords = coords
+        self._outline_cache_key = key
+        return coords
 
     def ray_intersection_point(self, start_scene: QPointF, toward_scene: QPointF) -> QPointF | None:
-        direction = toward_scene - start_scene
-        if direction.manhattanLength() < 2:
+        # 모든 거리 비교는 제곱 거리로 (sqrt 없이, D는 정규화하지 않음)
+        ox, oy = start_scene.x(), start_scene.y()
+        dx = toward_scene.x() - ox
+        dy = toward_scene.y() - oy
+        if abs(dx) + abs(dy) < 2:
             center_scene = self.mapToScene(self.boundingRect().center())
-            direction = center_scene - start_scene
+            dx = center_scene.x() - ox
+            dy = center_scene.y() - oy
 
-        length = math.hypot(direction.x(), direction.y())
-        if length < 1e-6:
+        len2 = dx * dx + dy * dy
+        if len2 < 1e-12:
             return None
 
-        direction /= length
-        ray = QLineF(start_scene, start_scene + direction * 10000)
+        coords = self._outline_coords_scene()
+        if not coords:
+            return None
 
-        candidates: list[QPointF] = []
-        for edge in self._outline_segments_scene():
-            itype, ip = ray.intersects(edge)
-            if itype == QLineF.IntersectionType.BoundedIntersection:
-                if QLineF(start_scene, ip).length() > 1e-6:
-                    candidates.append(ip)
+        # bounding circle 빠른 배제: ray가 원을 스치지도 않으면 edge 순회 생략
+        cx, cy = self._bound_center_scene
+        radius = self._bound_radius_scene
+        tcx = cx - ox
+        tcy = cy - oy
+        cross = tcx * dy - tcy * dx
+        if cross * cross > radius * radius * len2:
+            return None
+        if tcx * dx + tcy * dy < 0 and tcx * tcx + tcy * tcy > radius * radius:
+            # 시작점이 원 밖이고 반대 방향을 향함
+            return None
 
-        if not candidates:
+        best_t = _closest_ray_hit(
+            coords, ox, oy, dx, dy,
+            1e-12 / len2,
+            self._RAY_LENGTH2 / len2,
+        )
+        if best_t is None:
             return None
 
-        return min(candidates, key=lambda p: QLineF(start_scene, p).length())
+        return QPointF(ox + dx * best_t, oy + dy * best_t)
         
 class AttachLineMixin:
     def begin_attach(self, scene, anchor_scene: QPointF):
         # 실선은 반드시 scene item
         line = QGraphicsLineItem(QLineF(anchor_scene, anchor_scene))
-        line.setPen(QPen(Qt.GlobalColor.red, 2))
+        line.setPen(RED_PEN_2)
         line.setAcceptedMouseButtons(Qt.MouseButton.NoButton)
         line.setZValue(-1)
         line.setOpacity(0.4)  # preview
@@ -252,6 +525,10 @@ class AttachLineMixin:
         if not line or anchor is None:
             return
 
+        # 끝점이 사실상 그대로면 setLine(=영역 invalidate) 생략
+        if (line.line().p2() - target_scene).manhattanLength() < 0.5:
+            return
+
         # drag 중에는 교차점 계산 없이 anchor → 마우스
         line.setLine(QLineF(anchor, target_scene))
 
@@ -283,23 +560,30 @@ class AttachLineMixin:
         self._line_anchor_scene_pos = None
                   
 class SerializableMixin:
+    # 인스턴스에 설정돼 있을 때만 저장하는 필드
+    _SERIALIZE_FIELDS = ("internal_id", "display_id", "defect_info")
+
     def to_dict(self):
+        pos = self.pos()
         d = {
             "type": self.__class__.__name__,
-            "x": self.pos().x(),
-            "y": self.pos().y(),
+            "x": pos.x(),
+            "y": pos.y(),
             "scale": self.scale(),
             "rotation": self.rotation(),
         }
 
-        line = getattr(self, "_attached_line", None)
-        if line:
+        # hasattr/getattr 대신 인스턴스 dict를 직접 조회
+        attrs = self.__dict__
+
+        line = attrs.get("_attached_line")
+        if line is not None:
             l = line.line()
-            d["line"] = {"p1": [l.p1().x(), l.p1().y()], "p2": [l.p2().x(), l.p2().y()]}
+            d["line"] = {"p1": [l.x1(), l.y1()], "p2": [l.x2(), l.y2()]}
 
-        for k in ("internal_id", "display_id", "defect_info"):
-            if hasattr(self, k):
-                d[k] = getattr(self, k)
+        for k in self._SERIALIZE_FIELDS:
+            if k in attrs:
+                d[k] = attrs[k]
         return d
 
     @classmethod
@@ -309,28 +593,36 @@ class SerializableMixin:
         )
                       
 class MemoLine(QGraphicsLineItem):
+    _normal_pen = MEMO_PEN
+    _selected_pen = MEMO_SELECTED_PEN
+
     def __init__(self, p1, p2):
         super().__init__(QLineF(p1, p2))
         self.is_memo = True
 
-        self._normal_pen = QPen(QColor(30, 144, 255), 2)
-        self._selected_pen = QPen(QColor(255, 80, 80), 3)
-        self._selected_pen.setStyle(Qt.PenStyle.DashLine)
-
         self.setPen(self._normal_pen)
         self.setFlags(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable)
 
+    _cached_shape: QPainterPath | None = None
+    _shape_key: tuple | None = None
+
     def shape(self):
         """
         선택(hit-test) 영역을 시각적 선보다 넓게 만든다
+        (hover 마다 호출되므로 선이 바뀔 때만 다시 계산)
         """
+        l = self.line()
+        key = (l.x1(), l.y1(), l.x2(), l.y2())
+        if self._cached_shape is not None and self._shape_key == key:
+            return self._cached_shape
+
         path = QPainterPath()
-        path.moveTo(self.line().p1())
-        path.lineTo(self.line().p2())
+        path.moveTo(l.p1())
+        path.lineTo(l.p2())
 
-        stroker = QPainterPathStroker()
-        stroker.setWidth(10)  # ← 핵심 (픽셀 단위, 취향에 따라 8~12)
-        return stroker.createStroke(path)
+        self._cached_shape = _HIT_STROKER.createStroke(path)
+        self._shape_key = key
+        return self._cached_shape
 
     def itemChange(self, change, value):
         if change == QGraphicsItem.GraphicsItemChange.ItemSelectedChange:
@@ -338,28 +630,111 @@ class MemoLine(QGraphicsLineItem):
         return super().itemChange(change, value)
 
 class MemoFreePath(QGraphicsPathItem):
+    _normal_pen = MEMO_PEN
+    _selected_pen = MEMO_SELECTED_PEN
+    _cached_shape: QPainterPath | None = None
+    _shape_key: int | None = None
+
+    MIN_POINT_GAP = 2.0       # 이보다 가까운 점은 버림 (화면 px 기준, 누를 때 scene 단위로 환산)
+    FLUSH_INTERVAL_MS = 16    # 점 묶어서 setPath (약 60fps)
+    SIMPLIFY_CHUNK = 32       # 새 점이 이만큼 쌓이면 꼬리 구간을 RDP 단순화
+
     def __init__(self, start):
         super().__init__()
         self.is_memo = True
 
-        self._normal_pen = QPen(QColor(30, 144, 255), 2)
-        self._selected_pen = QPen(QColor(255, 80, 80), 3)
-        self._selected_pen.setStyle(Qt.PenStyle.DashLine)
-
         self._path = QPainterPath(start)
         self.setPath(self._path)
         self.setPen(self._normal_pen)
 
         self.setFlags(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable)
 
+        self._pending: list[QPointF] = []
+        self._flush_timer: QTimer | None = None
+
+        # 단순화용 좌표 (앞쪽 _tail_start 까지는 이미 단순화 완료)
+        self._pts: list[tuple[float, float]] = [(start.x(), start.y())]
+        self._tail_start = 0
+        self.simplify_epsilon = 1.0   # scene 단위 허용 오차 (0 이면 단순화 안 함)
+        self.min_point_gap = self.MIN_POINT_GAP   # scene 단위 (편집기가 줌에 맞춰 다시 지정)
+
     def add_point(self, p):
-        self._path.lineTo(p)
+        # 마우스 이벤트마다 setPath 하지 않고 모았다가 한 번에 반영
+        last = self._pending[-1] if self._pending else self._path.currentPosition()
+        if (p - last).manhattanLength() < self.min_point_gap:
+            return
+        self._pending.append(QPointF(p))
+
+        if self._flush_timer is None:
+            self._flush_timer = QTimer()
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+            self._flush_timer.timeout.connect(self.flush_points)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush_points(self):
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+        if not self._pending:
+            return
+
+        pts = self._pts
+        for p in self._pending:
+            pts.append((p.x(), p.y()))
+
+        if self.simplify_epsilon > 0.0 and len(pts) - self._tail_start >= self.SIMPLIFY_CHUNK:
+            # 거의 일직선인 점들을 걷어내고 path 재구성
+            self._simplify_tail()
+        else:
+            for p in self._pending:
+                self._path.lineTo(p)
+        self._pending.clear()
+
         self.setPath(self._path)
+        self._cached_shape = None
+
+    def _simplify_tail(self):
+        pts = self._pts
+        tail = _rdp(pts[self._tail_start:], self.simplify_epsilon)
+        del pts[self._tail_start:]
+        pts.extend(tail)
+        # 마지막 점은 다음 구간의 시작점으로 남긴다
+        self._tail_start = len(pts) - 1
+
+        path = QPainterPath(QPointF(*pts[0]))
+        for x, y in pts[1:]:
+            path.lineTo(x, y)
+        self._path = path
+
+    def finish(self):
+        """그리기 종료: 남은 점 반영 + 마지막 구간까지 단순화"""
+        self.flush_points()
+        if self.simplify_epsilon > 0.0 and len(self._pts) - self._tail_start > 2:
+            self._simplify_tail()
+            self.setPath(self._path)
+            self._cached_shape = None
+
+    def set_points(self, pts):
+        """저장된 좌표로 path를 한 번에 구성 (undo 복원용, 단순화/간격 필터 없음)"""
+        self._pts = [(float(x), float(y)) for x, y in pts]
+        self._tail_start = len(self._pts) - 1
+        self._pending.clear()
+
+        path = QPainterPath()
+        path.addPolygon(QPolygonF([QPointF(x, y) for x, y in self._pts]))
+        self._path = path
+        self.setPath(path)
+        self._cached_shape = None
 
     def shape(self):
-        stroker = QPainterPathStroker()
-        stroker.setWidth(10)
-        return stroker.createStroke(self.path())
+        key = self._path.elementCount()
+        if self._cached_shape is not None and self._shape_key == key:
+            return self._cached_shape
+
+        self._cached_shape = _HIT_STROKER.createStroke(self.path())
+        self._shape_key = key
+        return self._cached_shape
         
     def itemChange(self, change, value):
         if change == QGraphicsItem.GraphicsItemChange.ItemSelectedChange:
@@ -368,6 +743,9 @@ class MemoFreePath(QGraphicsPathItem):
 
 class ElbowArrow(QGraphicsPathItem):
     """수직으로 꺾인 화살표 지시선 (L자 모양)"""
+    _normal_pen = RED_PEN_3
+    _selected_pen = ARROW_SELECTED_PEN
+
     def __init__(self, start: QPointF, number: int = 1):
         super().__init__()
         self.is_memo = True
@@ -376,10 +754,6 @@ class ElbowArrow(QGraphicsPathItem):
         self._end = start    # 끝점
         self.number = number  # 끝점 동그라미 안 숫자
         
-        self._normal_pen = QPen(Qt.GlobalColor.red, 3)
-        self._selected_pen = QPen(QColor(255, 80, 80), 4)
-        self._selected_pen.setStyle(Qt.PenStyle.DashLine)
-        
         self.setPen(self._normal_pen)
         self.setFlags(
             QGraphicsItem.GraphicsItemFlag.ItemIsSelectable |
@@ -388,13 +762,13 @@ class ElbowArrow(QGraphicsPathItem):
         
         # 끝점 동그라미 + 숫자
         self._end_circle = QGraphicsEllipseItem(-18, -18, 36, 36, self)
-        self._end_circle.setPen(QPen(Qt.GlobalColor.red, 3))
-        self._end_circle.setBrush(QBrush(Qt.GlobalColor.white))
+        self._end_circle.setPen(RED_PEN_3)
+        self._end_circle.setBrush(WHITE_BRUSH)
         self._end_circle.setZValue(1)
         
         self._number_text = QGraphicsSimpleTextItem(str(number), self)
-        self._number_text.setBrush(QBrush(Qt.GlobalColor.red))
-        self._number_text.setFont(QFont("Malgun Gothic", 15, QFont.Weight.Bold))
+        self._number_text.setBrush(RED_BRUSH)
+        self._number_text.setFont(shared_font("Malgun Gothic", 15, QFont.Weight.Bold))
         self._number_text.setZValue(2)
         
         self._update_path()
@@ -470,6 +844,9 @@ class ElbowArrow(QGraphicsPathItem):
 
 class ElbowArrowHorizontal(QGraphicsPathItem):
     """수평으로 꺾인 화살표 지시선 (ㄱ자 모양)"""
+    _normal_pen = RED_PEN_3
+    _selected_pen = ARROW_SELECTED_PEN
+
     def __init__(self, start: QPointF, number: int = 1):
         super().__init__()
         self.is_memo = True
@@ -478,10 +855,6 @@ class ElbowArrowHorizontal(QGraphicsPathItem):
         self._end = start    # 끝점
         self.number = number  # 끝점 동그라미 안 숫자
         
-        self._normal_pen = QPen(Qt.GlobalColor.red, 3)
-        self._selected_pen = QPen(QColor(255, 80, 80), 4)
-        self._selected_pen.setStyle(Qt.PenStyle.DashLine)
-        
         self.setPen(self._normal_pen)
         self.setFlags(
             QGraphicsItem.GraphicsItemFlag.ItemIsSelectable |
@@ -490,13 +863,13 @@ class ElbowArrowHorizontal(QGraphicsPathItem):
         
         # 끝점 동그라미 + 숫자
         self._end_circle = QGraphicsEllipseItem(-18, -18, 36, 36, self)
-        self._end_circle.setPen(QPen(Qt.GlobalColor.red, 3))
-        self._end_circle.setBrush(QBrush(Qt.GlobalColor.white))
+        self._end_circle.setPen(RED_PEN_3)
+        self._end_circle.setBrush(WHITE_BRUSH)
         self._end_circle.setZValue(1)
         
         self._number_text = QGraphicsSimpleTextItem(str(number), self)
-        self._number_text.setBrush(QBrush(Qt.GlobalColor.red))
-        self._number_text.setFont(QFont("Malgun Gothic", 15, QFont.Weight.Bold))
+        self._number_text.setBrush(RED_BRUSH)
+        self._number_text.setFont(shared_font("Malgun Gothic", 15, QFont.Weight.Bold))
         self._number_text.setZValue(2)
         
         self._update_path()
@@ -572,6 +945,9 @@ class ElbowArrowHorizontal(QGraphicsPathItem):
 
 class FunnelArrow(QGraphicsPathItem):
     """깔때기 모양 화살표 지시선 (수직으로 꺾임)"""
+    _normal_pen = RED_PEN_3
+    _selected_pen = ARROW_SELECTED_PEN
+
     def __init__(self, start: QPointF, number: int = 1):
         super().__init__()
         self.is_memo = True
@@ -580,10 +956,6 @@ class FunnelArrow(QGraphicsPathItem):
         self._end = start    # 끝점
         self.number = number  # 끝점 동그라미 안 숫자
         
-        self._normal_pen = QPen(Qt.GlobalColor.red, 3)
-        self._selected_pen = QPen(QColor(255, 80, 80), 4)
-        self._selected_pen.setStyle(Qt.PenStyle.DashLine)
-        
         self.setPen(self._normal_pen)
         self.setFlags(
             QGraphicsItem.GraphicsItemFlag.ItemIsSelectable |
@@ -592,13 +964,13 @@ class FunnelArrow(QGraphicsPathItem):
         
         # 끝점 동그라미 + 숫자
         self._end_circle = QGraphicsEllipseItem(-18, -18, 36, 36, self)
-        self._end_circle.setPen(QPen(Qt.GlobalColor.red, 3))
-        self._end_circle.setBrush(QBrush(Qt.GlobalColor.white))
+        self._end_circle.setPen(RED_PEN_3)
+        self._end_circle.setBrush(WHITE_BRUSH)
         self._end_circle.setZValue(1)
         
         self._number_text = QGraphicsSimpleTextItem(str(number), self)
-        self._number_text.setBrush(QBrush(Qt.GlobalColor.red))
-        self._number_text.setFont(QFont("Malgun Gothic", 15, QFont.Weight.Bold))
+        self._number_text.setBrush(RED_BRUSH)
+        self._number_text.setFont(shared_font("Malgun Gothic", 15, QFont.Weight.Bold))
         self._number_text.setZValue(2)
         
         self._update_path()
@@ -698,6 +1070,9 @@ class FunnelArrow(QGraphicsPathItem):
 
 class FunnelArrowHorizontal(QGraphicsPathItem):
     """깔때기 모양 화살표 지시선 (수평으로 꺾임)"""
+    _normal_pen = RED_PEN_3
+    _selected_pen = ARROW_SELECTED_PEN
+
     def __init__(self, start: QPointF, number: int = 1):
         super().__init__()
         self.is_memo = True
@@ -706,10 +1081,6 @@ class FunnelArrowHorizontal(QGraphicsPathItem):
         self._end = start    # 끝점
         self.number = number  # 끝점 동그라미 안 숫자
         
-        self._normal_pen = QPen(Qt.GlobalColor.red, 3)
-        self._selected_pen = QPen(QColor(255, 80, 80), 4)
-        self._selected_pen.setStyle(Qt.PenStyle.DashLine)
-        
         self.setPen(self._normal_pen)
         self.setFlags(
             QGraphicsItem.GraphicsItemFlag.ItemIsSelectable |
@@ -718,13 +1089,13 @@ class FunnelArrowHorizontal(QGraphicsPathItem):
         
         # 끝점 동그라미 + 숫자
         self._end_circle = QGraphicsEllipseItem(-18, -18, 36, 36, self)
-        self._end_circle.setPen(QPen(Qt.GlobalColor.red, 3))
-        self._end_circle.setBrush(QBrush(Qt.GlobalColor.white))
+        self._end_circle.setPen(RED_PEN_3)
+        self._end_circle.setBrush(WHITE_BRUSH)
         self._end_circle.setZValue(1)
         
         self._number_text = QGraphicsSimpleTextItem(str(number), self)
-        self._number_text.setBrush(QBrush(Qt.GlobalColor.red))
-        self._number_text.setFont(QFont("Malgun Gothic", 15, QFont.Weight.Bold))
+        self._number_text.setBrush(RED_BRUSH)
+        self._number_text.setFont(shared_font("Malgun Gothic", 15, QFont.Weight.Bold))
         self._number_text.setZValue(2)
         
         self._update_path()
@@ -822,6 +1193,11 @@ class FunnelArrowHorizontal(QGraphicsPathItem):
         if change == QGraphicsItem.GraphicsItemChange.ItemSelectedChange:
             self.setPen(self._selected_pen if value else self._normal_pen)
         return super().itemChange(change, value)       
+
+# 드래그 분기용 (하위 클래스가 없는 구체 타입 → isinstance 대신 type() 비교)
+_MEMO_TYPES = frozenset({MemoLine, MemoFreePath})
+_ARROW_TYPES = frozenset({ElbowArrow, ElbowArrowHorizontal, FunnelArrow, FunnelArrowHorizontal})
+_DRAW_TYPES = _MEMO_TYPES | _ARROW_TYPES
                               
 # =====================================================
 # 도형 정의
@@ -829,61 +1205,64 @@ class FunnelArrowHorizontal(QGraphicsPathItem):
 class CircleMark(QGraphicsObject, BaseMarkMixin, SerializableMixin, AttachLineMixin, GeometryRayMixin, DefectLabelMixin, DirtyMixin):
     requestOpenDefectDetail = pyqtSignal(object)
 
+    # pen 분리 (핵심) - 모든 원이 공유
+    _normal_pen = RED_PEN_3
+    _selected_pen = _make_pen(Qt.GlobalColor.red, 4, Qt.PenStyle.DashLine)
+    _select_box_pen = _make_pen(Qt.GlobalColor.black, 0, Qt.PenStyle.DashLine)  # width=0 => cosmetic pen(줌에도 일정)
+    _brush = NO_BRUSH
+
+    # 번호 자릿수 -> 중앙 정렬 오프셋 (폰트가 고정이라 자릿수별로 한 번만 계산)
+    _ID_OFFSETS: dict[int, tuple[float, float]] = {}
+
     def __init__(self, center: QPointF, r=18):
         super().__init__()
         self._rect = QRectF(-r, -r, r * 2, r * 2)
         self.setup_flags()
+        # 편집 사이에는 모양이 고정 → pan/zoom 시 paint() 생략
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.setPos(center)
 
-        # pen 분리 (핵심)
-        self._normal_pen = QPen(Qt.GlobalColor.red, 3)
-        self._selected_pen = QPen(Qt.GlobalColor.red, 4)
-        self._selected_pen.setStyle(Qt.PenStyle.DashLine)
-
-        self._select_box_pen = QPen(Qt.GlobalColor.black, 0)  # width=0 => cosmetic pen(줌에도 일정)
-        self._select_box_pen.setStyle(Qt.PenStyle.DashLine)
-
         self._pen = self._normal_pen
-        self._brush = QBrush(Qt.BrushStyle.NoBrush)
+
+        # 선택 박스 (선택 시에만 보이는 자식 아이템 → paint() 분기 제거)
+        self._sel_box = QGraphicsRectItem(self._rect, self)
+        self._sel_box.setPen(self._select_box_pen)
+        self._sel_box.setBrush(self._brush)
+        self._sel_box.setFlag(QGraphicsItem.GraphicsItemFlag.ItemStacksBehindParent, False)
+        self._sel_box.setAcceptedMouseButtons(Qt.MouseButton.NoButton)
+        self._sel_box.setVisible(False)
 
         # ID 텍스트
         self._id_text_item = IdTextItem("", self)
-        self._id_text_item.setBrush(QBrush(Qt.GlobalColor.red))
+        self._id_text_item.setBrush(RED_BRUSH)
+        self._id_text_item.setFont(shared_font("Malgun Gothic", 10, QFont.Weight.Bold))
         self._id_text_item.setZValue(20)   # 원/실선보다 항상 위
         self._id_text_item.setFlag(
             QGraphicsItem.GraphicsItemFlag.ItemIgnoresTransformations, True
         )
 
     def paint(self, painter, option, widget=None):
-        # 1) 원은 항상 동일하게 그린다 (선택 여부로 원 테두리 스타일을 바꾸지 않음)
+        # 원은 항상 동일하게 그린다 (선택 박스는 _sel_box 자식 아이템이 담당)
         painter.setPen(self._pen)
         painter.setBrush(self._brush)
         painter.drawEllipse(self._rect)
 
-        # 2) 선택 상태면, 다른 도형과 동일한 "점선 사각 선택 박스"를 boundingRect 기준으로 추가
-        if option.state & QStyle.StateFlag.State_Selected:
-            painter.save()
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.setPen(self._select_box_pen)
-            painter.drawRect(self.boundingRect())
-            painter.restore()
-
     def boundingRect(self):
         return self._rect
       
     def set_circle_id(self, n: int):
         self.display_id = n
-        self._id_text_item.set_text(str(n))
-
-        font = QFont("Malgun Gothic", 10, QFont.Weight.Bold)
-        self._id_text_item.setFont(font)
-
-        # 중앙 정렬
-        br = self._id_text_item.boundingRect()
-        self._id_text_item.setPos(
-            -br.width() / 2,
-            -br.height() / 2
-        )
+        text = str(n)
+        self._id_text_item.set_text(text)
+
+        # 중앙 정렬 (자릿수별 캐시)
+        key = len(text)
+        offset = CircleMark._ID_OFFSETS.get(key)
+        if offset is None:
+            br = self._id_text_item.boundingRect()
+            offset = (-br.width() / 2, -br.height() / 2)
+            CircleMark._ID_OFFSETS[key] = offset
+        self._id_text_item.setPos(*offset)
         
     MIN_SCALE = 0.6
     MAX_SCALE = 2.5
@@ -895,6 +1274,10 @@ class CircleMark(QGraphicsObject, BaseMarkMixin, SerializableMixin, AttachLineMi
             if s > self.MAX_SCALE:
                 return self.MAX_SCALE
 
+        if change == QGraphicsItem.GraphicsItemChange.ItemSelectedHasChanged:
+            # 선택 박스 표시만 토글 (원 자체의 캐시는 그대로)
+            self._sel_box.setVisible(bool(value))
+
         return super().itemChange(change, value)
             
     def mouseDoubleClickEvent(self, event):
@@ -912,11 +1295,8 @@ class CircleMark(QGraphicsObject, BaseMarkMixin, SerializableMixin, AttachLineMi
         
     def _commit_label_edit(self):
         if self._defect_label:
-            text = self._defect_label.toPlainText()
+            text = self._defect_label.text()
             self.defect_info["member"] = text
-            self._defect_label.setTextInteractionFlags(
-                Qt.TextInteractionFlag.NoTextInteraction
-            )
             self._mark_dirty()
                
     def to_dict(self):
@@ -938,9 +1318,11 @@ class SquareMark(QGraphicsRectItem, BaseMarkMixin, SerializableMixin, DefectLabe
     def __init__(self, center: QPointF, size=36):
         super().__init__(-size/2, -size/2, size, size)
         self.setup_flags()
+        # 편집 사이에는 모양이 고정 → pan/zoom 시 paint() 생략
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.setPos(center)
-        self.setPen(QPen(Qt.GlobalColor.red, 2))
-        self.setBrush(QBrush(Qt.GlobalColor.red))
+        self.setPen(RED_PEN_2)
+        self.setBrush(RED_BRUSH)
        
     def to_dict(self):
         d = super().to_dict()
@@ -959,6 +1341,7 @@ class SquareMark(QGraphicsRectItem, BaseMarkMixin, SerializableMixin, DefectLabe
     def set_new_rect(self, rect):
         self.prepareGeometryChange()
         self.setRect(rect)
+        self._bump_geom_version()
         self.update()
         self._mark_dirty()        
 
@@ -972,9 +1355,11 @@ class TriangleMark(QGraphicsPolygonItem, BaseMarkMixin, SerializableMixin, Defec
         ])
         super().__init__(polygon)
         self.setup_flags()
+        # 편집 사이에는 모양이 고정 → pan/zoom 시 paint() 생략
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.setPos(center)
-        self.setPen(QPen(Qt.GlobalColor.red, 2))
-        self.setBrush(QBrush(Qt.GlobalColor.red))
+        self.setPen(RED_PEN_2)
+        self.setBrush(RED_BRUSH)
         
     def to_dict(self):
         d = super().to_dict()
@@ -989,10 +1374,38 @@ class TriangleMark(QGraphicsPolygonItem, BaseMarkMixin, SerializableMixin, Defec
 
         item = cls(QPointF(x, y), size=size)
         return item
+
+    def _outline_polys_scene(self) -> list[QPolygonF]:
+        # ray 교차 계산용 외곽선: shape() 대신 다각형 그대로
+        return [self.mapToScene(self.polygon())]
                  
 class SCurveWithMidCircle(QGraphicsPathItem, BaseMarkMixin, SerializableMixin, DefectLabelMixin, DirtyMixin):
+    # (w, h, curve) -> S 곡선 path (동일 크기 도형끼리 공유)
+    _path_cache: dict[tuple, QPainterPath] = {}
+    _curve_pen = RED_PEN_3
+
     def __init__(self, center: QPointF,
                  w=43, h=55, mid_r=8, curve=0.9):
+        super().__init__(QPainterPath(self._curve_path(w, h, curve)))
+        self.setup_flags()
+        # 편집 사이에는 모양이 고정 → pan/zoom 시 paint() 생략
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        self.setPos(center)
+        self.setPen(self._curve_pen)
+
+        self.mid = QGraphicsEllipseItem(
+            -mid_r, -mid_r, mid_r * 2, mid_r * 2, parent=self
+        )
+        self.mid.setPen(RED_PEN_3)
+        self.mid.setBrush(WHITE_BRUSH)
+
+    @classmethod
+    def _curve_path(cls, w, h, curve) -> QPainterPath:
+        key = (w, h, curve)
+        path = cls._path_cache.get(key)
+        if path is not None:
+            return path
+
         path = QPainterPath()
 
         top = -h / 2
@@ -1006,17 +1419,8 @@ class SCurveWithMidCircle(QGraphicsPathItem, BaseMarkMixin, SerializableMixin, D
              0, bottom
         )
 
-        super().__init__(path)
-        self.setup_flags()
-        self.setPos(center)
-        self.setPen(QPen(Qt.GlobalColor.red, 3))
-
-        self.mid = QGraphicsEllipseItem(
-            -mid_r, -mid_r, mid_r * 2, mid_r * 2, parent=self
-        )
-        self.mid.setPen(QPen(Qt.GlobalColor.red, 3))
-        self.mid.setBrush(QBrush(Qt.GlobalColor.white))
-
+        cls._path_cache[key] = path
+        return path
            
     def to_dict(self):
         d = super().to_dict()
@@ -1039,6 +1443,12 @@ class SCurveWithMidCircle(QGraphicsPathItem, BaseMarkMixin, SerializableMixin, D
 class NoteText(QGraphicsTextItem, BaseMarkMixin, SerializableMixin, DefectLabelMixin, DirtyMixin):
     def __init__(self, center: QPointF, text="하자"):
         super().__init__(text)
+
+        # 연속 타이핑을 한 번의 갱신으로 묶기 (50ms)
+        self._dirty_timer = QTimer(self)
+        self._dirty_timer.setSingleShot(True)
+        self._dirty_timer.setInterval(50)
+        self._dirty_timer.timeout.connect(self._flush_text_change)
         
         # 텍스트 내용이 실제로 바뀔 때마다 호출
         self.document().contentsChanged.connect(
@@ -1048,8 +1458,9 @@ class NoteText(QGraphicsTextItem, BaseMarkMixin, SerializableMixin, DefectLabelM
         self.setup_flags()
         self.setPos(center)
         self.setDefaultTextColor(Qt.GlobalColor.blue)
-        self.setFont(QFont("Malgun Gothic", 12))
+        self.setFont(shared_font("Malgun Gothic", 12))
         self.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+        self._sync_contents_flag()
         
     def to_dict(self):
         d = super().to_dict()
@@ -1069,6 +1480,7 @@ class NoteText(QGraphicsTextItem, BaseMarkMixin, SerializableMixin, DefectLabelM
         self.setTextInteractionFlags(
             Qt.TextInteractionFlag.TextEditorInteraction
         )
+        self._sync_contents_flag()
         self.setFocus(Qt.FocusReason.MouseFocusReason)
         event.accept()
         
@@ -1078,18 +1490,27 @@ class NoteText(QGraphicsTextItem, BaseMarkMixin, SerializableMixin, DefectLabelM
         editor = getattr(dialog, "editor", None) if dialog else None
 
         if editor:
-            editor._begin_edit()
+            # 내용이 실제로 바뀌었을 때만 undo 기록 (focusOut에서 비교)
+            editor._begin_edit(dirty=False)
+            self._text_at_focus = self.toPlainText()
 
         super().focusInEvent(event)
            
     def focusOutEvent(self, event):
         self.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
 
+        # 대기 중인 변경은 편집 종료 전에 반영
+        if self._dirty_timer.isActive():
+            self._flush_text_change()
+        self._sync_contents_flag()
+
         scene = self.scene()
         dialog = getattr(scene, "_editor", None)
         editor = getattr(dialog, "editor", None) if dialog else None
 
         if editor:
+            if self.toPlainText() != getattr(self, "_text_at_focus", None):
+                editor._edit_dirty = True
             editor._end_edit()
 
         super().focusOutEvent(event)
@@ -1098,8 +1519,29 @@ class NoteText(QGraphicsTextItem, BaseMarkMixin, SerializableMixin, DefectLabelM
         super().keyReleaseEvent(event)
         
     def _on_text_contents_changed(self):
+        # 실제 처리는 타이머 만료 시 한 번만
+        self._dirty_timer.start()
+        self._sync_contents_flag()
+
+    def _sync_contents_flag(self):
+        # 빈 메모(placeholder)는 paint/레이아웃 자체를 생략
+        # 편집 중에는 커서가 보여야 하므로 항상 그린다 (캐시도 끔)
+        editing = bool(
+            self.textInteractionFlags() & Qt.TextInteractionFlag.TextEditorInteraction
+        )
+        empty = not editing and not self.toPlainText().strip()
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemHasNoContents, empty)
+        self.setCacheMode(
+            QGraphicsItem.CacheMode.NoCache if (empty or editing)
+            else QGraphicsItem.CacheMode.DeviceCoordinateCache
+        )
+
+    def _flush_text_change(self):
+        self._dirty_timer.stop()
+
         # geometry가 바뀔 수 있으므로
         self.prepareGeometryChange()
+        self._bump_geom_version()
 
         # ID 라벨 위치 즉시 재계산
         self._update_defect_label_pos()
@@ -1114,7 +1556,19 @@ class PlanView(QGraphicsView):
     def __init__(self, owner):
         super().__init__(owner.scene)
         self.owner = owner
-       
+
+        # 마우스 이동마다 dirty 영역 계산하지 않고 viewport 전체 갱신
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing, True)
+        owner.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+
+    def tune_item_index(self):
+        # BSP 깊이를 도형 개수(log2)에 맞춘다
+        count = len(self.scene().items())
+        depth = max(1, min(16, math.ceil(math.log2(count)))) if count > 1 else 0
+        self.scene().setBspTreeDepth(depth)
+
     def keyPressEvent(self, event):
         super().keyPressEvent(event)
         
@@ -1127,9 +1581,11 @@ class PlanView(QGraphicsView):
             # 최초 fit scale 저장
             self.owner._base_view_scale = self.transform().m11()
             self.owner._current_view_scale = self.owner._base_view_scale
+            self.owner._cached_anchor_radius_scene = None
             self.owner._fitted = True
             
     def mousePressEvent(self, event):
+        self.owner._maybe_hide_detail(event)
         handled = self.owner._on_mouse_press(event)
         if handled:
             event.accept()
@@ -1193,6 +1649,7 @@ class PlanView(QGraphicsView):
             # 편집 세션 시작 (한 번만)
             if not getattr(self.owner, "_editing", False):
                 self.owner._begin_edit()
+            self.owner._edit_dirty = True
 
             for item in items:
                 item.setTransformOriginPoint(item.boundingRect().center())
@@ -1209,6 +1666,7 @@ class PlanView(QGraphicsView):
             factor = 1.15 if delta > 0 else 1 / 1.15
             self.scale(factor, factor)
             self.owner._current_view_scale *= factor
+            self.owner._cached_anchor_radius_scene = None
 
             if hasattr(self.owner.parent(), "status_bar"):
                 self.owner.parent().status_bar.set_zoom(
@@ -1223,6 +1681,48 @@ class PlanView(QGraphicsView):
 # =====================================================
 # QFrame for editor of detail
 # =====================================================
+# 상세 패널 스타일 (패널에 한 번만 지정, objectName으로 범위 한정)
+_DEFECT_PANEL_QSS = """
+    QFrame#DefectDetailPanel, #DefectDetailPanel QFrame {
+        background: #F9F9F9;
+        border-top: 1px solid #999;
+    }
+    #DefectDetailPanel QLabel { font-weight: 600; color: #333; }
+    #DefectDetailPanel QLineEdit, #DefectDetailPanel QPlainTextEdit {
+        background: white;
+        border: 1px solid #BBB;
+        padding: 4px;
+    }
+"""
+
+# 도형 목록: 아래에 구분선을 그릴 행 표시 (item.data)
+DIVIDER_ROLE = Qt.ItemDataRole.UserRole + 1
+DIVIDER_COLOR = QColor("#999")
+
+class ShapeListDelegate(QStyledItemDelegate):
+    """구분선은 별도 행 대신 해당 행 하단에 1px 선으로 직접 그린다 (모든 행 높이 동일)"""
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        if index.data(DIVIDER_ROLE):
+            rect = option.rect
+            painter.fillRect(rect.left() + 8, rect.bottom(), rect.width() - 16, 1, DIVIDER_COLOR)
+
+class _OptionalNumberMixin:
+    """빈 칸도 올바른 입력으로 취급 (빈 값 = 미측정, 기본 검증기는 Intermediate로 봐서
+    editingFinished가 오지 않음 → 지운 값을 반영할 수 없었음)"""
+
+    def validate(self, text, pos):
+        if not text:
+            return QValidator.State.Acceptable, text, pos
+        return super().validate(text, pos)
+
+class _OptionalDoubleValidator(_OptionalNumberMixin, QDoubleValidator):
+    pass
+
+class _OptionalIntValidator(_OptionalNumberMixin, QIntValidator):
+    pass
+
 class DefectDetailPanel(QFrame):
     """
     하단 상세정보 입력 패널(모달 아님).
@@ -1231,20 +1731,31 @@ class DefectDetailPanel(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._circle = None
+        self._last_info: dict = {}
+        self._loading = False
+        self._built = False
+
+        # 라벨/dirty 갱신 묶음 처리 (_flush)
+        self._pending_label = False
+        self._pending_dirty = False
+        self._flush_scheduled = False
+
+        # show_for_circle 에서 한 번만 조회해 두는 도형 쪽 참조
+        self._info: dict | None = None
+        self._update_label = None
+        self._mark_dirty_fn = None
 
+        self.setObjectName("DefectDetailPanel")
         self.setFixedHeight(210)
-        self.setStyleSheet("""
-            QFrame {
-                background: #F9F9F9;
-                border-top: 1px solid #999;
-            }
-            QLabel { font-weight: 600; color: #333; }
-            QLineEdit, QTextEdit {
-                background: white;
-                border: 1px solid #BBB;
-                padding: 4px;
-            }
-        """)
+        # 위젯 트리는 처음 show_for_circle 때 만든다 (_build_ui)
+        self.hide()
+
+    _NO_SIZE: dict = {}   # 읽기 전용 (절대 쓰지 않음)
+
+    def _build_ui(self):
+        self._built = True
+        # 자식을 만들기 전에 지정 → 자식 위젯이 처음부터 이 스타일로 polish 됨
+        self.setStyleSheet(_DEFECT_PANEL_QSS)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 10, 12, 10)
@@ -1277,6 +1788,15 @@ class DefectDetailPanel(QFrame):
         self.count_edit = QLineEdit()
         self.count_edit.setPlaceholderText("EA")
 
+        # 숫자 필드는 입력 단계에서 걸러서 저장 시엔 숫자로 보관 (빈 칸 = 미측정 허용)
+        width_validator = _OptionalDoubleValidator(0.0, 9999.0, 2, self)
+        width_validator.setNotation(QDoubleValidator.Notation.StandardNotation)
+        self.width_edit.setValidator(width_validator)
+        length_validator = _OptionalDoubleValidator(0.0, 9999.0, 2, self)
+        length_validator.setNotation(QDoubleValidator.Notation.StandardNotation)
+        self.length_edit.setValidator(length_validator)
+        self.count_edit.setValidator(_OptionalIntValidator(0, 99999, self))
+
         row2.addWidget(QLabel("유형"))
         row2.addWidget(self.type_edit, 3)
         row2.addSpacing(12)
@@ -1295,7 +1815,7 @@ class DefectDetailPanel(QFrame):
         row3.addStretch(1)
 
         # --- Remark ---
-        self.remark_edit = QTextEdit()
+        self.remark_edit = QPlainTextEdit()
         self.remark_edit.setFixedHeight(70)
 
         layout.addLayout(row1)
@@ -1304,102 +1824,292 @@ class DefectDetailPanel(QFrame):
         layout.addWidget(QLabel("비고"))
         layout.addWidget(self.remark_edit)
 
-        # 입력 즉시 반영
-        self.member_edit.textChanged.connect(self._commit)
-        self.location_edit.textChanged.connect(self._commit)
-        self.type_edit.textChanged.connect(self._commit)
-        self.width_edit.textChanged.connect(self._commit)
-        self.length_edit.textChanged.connect(self._commit)
-        self.count_edit.textChanged.connect(self._commit)
-        self.progress_check.toggled.connect(self._commit)
-        self.remark_edit.textChanged.connect(self._commit)
-
-        self.hide()
+        # 부재는 도면 옆 라벨에 보이므로 입력 중에도 반영 (멈춘 뒤 200ms)
+        self._commit_timer = QTimer(self)
+        self._commit_timer.setSingleShot(True)
+        self._commit_timer.setInterval(200)
+        self._commit_timer.timeout.connect(self._on_member_changed)
+        self._schedule_commit = self._commit_timer.start
+        self.member_edit.textChanged.connect(self._schedule_commit)
+
+        # 나머지는 입력이 끝났을 때(Enter/포커스 이탈) 해당 필드만 반영
+        self.member_edit.editingFinished.connect(self._on_member_changed)
+        self.location_edit.editingFinished.connect(self._on_location_changed)
+        self.type_edit.editingFinished.connect(self._on_type_changed)
+        self.width_edit.editingFinished.connect(self._on_width_changed)
+        self.length_edit.editingFinished.connect(self._on_length_changed)
+        self.count_edit.editingFinished.connect(self._on_count_changed)
+        self.remark_edit.installEventFilter(self)   # QPlainTextEdit은 editingFinished 없음 → FocusOut
+        # 체크박스는 단발 이벤트 → 즉시 반영
+        self.progress_check.toggled.connect(self._on_progress_changed)
 
     def show_for_circle(self, circle):
+        if not self._built:
+            self._build_ui()
+
+        # 이전 도형에 대기 중인 입력은 먼저 반영하고 타이머 정리
+        self.flush_pending()
+
         self._circle = circle
-        info = getattr(circle, "defect_info", {}) or {}
-
-        blockers = [
-            QSignalBlocker(self.member_edit),
-            QSignalBlocker(self.location_edit),
-            QSignalBlocker(self.type_edit),
-            QSignalBlocker(self.width_edit),
-            QSignalBlocker(self.length_edit),
-            QSignalBlocker(self.count_edit),
-            QSignalBlocker(self.progress_check),
-            QSignalBlocker(self.remark_edit),
-        ]
+        # 도형이 바뀔 때만 조회하고 입력 처리 중에는 캐시 사용
+        info = getattr(circle, "defect_info", None)
+        self._info = info if isinstance(info, dict) else None
+        self._update_label = getattr(circle, "update_defect_label", None)
+        self._mark_dirty_fn = getattr(circle, "_mark_dirty", None)
+        if self._info is None:
+            info = {}
+
+        # 로딩 중에는 필드 반영 슬롯이 바로 return (위젯별 signal block 대신)
+        self._loading = True
 
         self.member_edit.setText(info.get("member", ""))
         self.location_edit.setText(info.get("location", ""))
 
         self.type_edit.setText(info.get("defect_type", ""))
 
-        size = info.get("size", {}) or {}
-        self.width_edit.setText(size.get("width_mm", ""))
-        self.length_edit.setText(size.get("length_m", ""))
-        self.count_edit.setText(size.get("count_ea", ""))
+        # 읽기 전용 조회 → 없으면 공용 빈 dict (매번 새 dict를 만들지 않음)
+        size = info.get("size")
+        if not isinstance(size, dict):
+            size = self._NO_SIZE
+        width = self._to_number(size.get("width_mm", ""), float)
+        length = self._to_number(size.get("length_m", ""), float)
+        count = self._to_number(size.get("count_ea", ""), int)
+        self.width_edit.setText(self._number_text(width))
+        self.length_edit.setText(self._number_text(length))
+        self.count_edit.setText(self._number_text(count))
 
         self.progress_check.setChecked(bool(info.get("progress", False)))
         self.remark_edit.setPlainText(info.get("remark", ""))
 
-        # blockers 리스트를 scope에 유지해야 해서 그냥 둠(함수 끝날 때 해제됨)
+        # 마지막 반영 값 (변경 없는 focus in/out 등은 무시하기 위한 기준)
+        self._last_info = {
+            "member": info.get("member", ""),
+            "location": info.get("location", ""),
+            "defect_type": info.get("defect_type", ""),
+            "width_mm": width,
+            "length_m": length,
+            "count_ea": count,
+            "progress": bool(info.get("progress", False)),
+            "remark": info.get("remark", ""),
+        }
+
+        # setText로 시작된 부재 타이머는 버린다
+        self._commit_timer.stop()
+        self._loading = False
+
         self.show()
 
-        # UX: 처음 열릴 때 커서를 “가장 먼저 채워야 할 곳”으로
-        if not self.member_edit.text().strip():
-            self.member_edit.setFocus()
-        elif not self.location_edit.text().strip():
-            self.location_edit.setFocus()
-        elif not self.type_edit.text().strip():
-            self.type_edit.setFocus()
+        # UX: 처음 열릴 때 커서를 “가장 먼저 채워야 할 곳”으로 (방금 읽은 값 재사용)
+        last = self._last_info
+        focus_targets = (
+            (self.member_edit, last["member"]),
+            (self.location_edit, last["location"]),
+            (self.type_edit, last["defect_type"]),
+        )
+        target = next((w for w, v in focus_targets if not v.strip()), None)
+        if target is not None:
+            target.setFocus()
+
+    def flush_pending(self):
+        """포커스가 남아 있는 필드(editingFinished 전)와 부재 타이머까지 지금 도형에 반영하고
+        라벨/dirty도 바로 갱신. 저장/닫기 직전에 호출 → dirty 확인과 스냅샷이 방금 입력한 값까지 포함
+        (값이 그대로인 필드는 _write_field에서 걸러짐)
+        """
+        if not self._built:
+            return
+        self._on_member_changed()   # 타이머도 여기서 멈춤
+        self._on_location_changed()
+        self._on_type_changed()
+        self._on_width_changed()
+        self._on_length_changed()
+        self._on_count_changed()
+        self._on_remark_changed()
+        self._flush()
+
+    def hideEvent(self, event):
+        # 닫히기 전에 대기 중인 입력 반영
+        self.flush_pending()
+        super().hideEvent(event)
 
-    def _commit(self):
-        if not self._circle:
+    def eventFilter(self, obj, event):
+        if obj is self.remark_edit and event.type() == QEvent.Type.FocusOut:
+            self._on_remark_changed()
+        return super().eventFilter(obj, event)
+
+    def _circle_info(self) -> dict:
+        # defect_info는 처음 기록할 때 만든다
+        if self._info is None:
+            self._info = self._circle.defect_info = {}
+        return self._info
+
+    def _write_field(self, key: str, value, in_size: bool = False) -> bool:
+        """필드 하나만 기록. 값이 그대로면 False (dirty 마킹 생략)"""
+        if self._loading or not self._circle:
+            return False
+
+        # 마지막 반영 값과 같으면 아무 것도 하지 않음 (라벨/dirty 갱신 생략)
+        if self._last_info.get(key) == value:
+            return False
+        self._last_info[key] = value
+
+        target = self._circle_info()
+        if in_size:
+            # size dict은 도형당 한 번만 만들고 이후엔 제자리 갱신
+            size = target.get("size")
+            if not isinstance(size, dict):
+                size = target["size"] = {}
+            target = size
+
+        target[key] = value
+
+        self._pending_dirty = True
+        self._schedule_flush()
+        return True
+
+    def _schedule_flush(self):
+        # 같은 이벤트 루프 턴의 변경들을 한 번의 라벨/dirty 갱신으로 묶는다
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush)
+
+    def _flush(self):
+        self._flush_scheduled = False
+        circle = self._circle
+        pending_label, self._pending_label = self._pending_label, False
+        pending_dirty, self._pending_dirty = self._pending_dirty, False
+        if not circle:
             return
 
-        info = getattr(self._circle, "defect_info", None)
-        if info is None:
-            self._circle.defect_info = {}
-            info = self._circle.defect_info
+        # 도면 옆 텍스트(부재)
+        if pending_label and self._update_label:
+            self._update_label(self._last_info.get("member", ""))
 
-        info["member"] = self.member_edit.text()
-        info["location"] = self.location_edit.text()
-        info["defect_type"] = self.type_edit.text()
+        if pending_dirty and self._mark_dirty_fn:
+            self._mark_dirty_fn()
 
-        info["size"] = {
-            "width_mm": self.width_edit.text(),
-            "length_m": self.length_edit.text(),
-            "count_ea": self.count_edit.text(),
-        }
+    def _on_member_changed(self):
+        self._commit_timer.stop()
+        if self._write_field("member", self.member_edit.text()):
+            self._pending_label = True
 
-        # 진행성: False = X(기본), True = O
-        info["progress"] = self.progress_check.isChecked()
-        info["remark"] = self.remark_edit.toPlainText()
+    def _on_location_changed(self):
+        self._write_field("location", self.location_edit.text())
 
-        # 도면 옆 텍스트(부재)는 즉시 반영
-        if hasattr(self._circle, "update_defect_label"):
-            self._circle.update_defect_label(info["member"])
+    def _on_type_changed(self):
+        self._write_field("defect_type", self.type_edit.text())
 
-        if hasattr(self._circle, "_mark_dirty"):
-            self._circle._mark_dirty()
+    @staticmethod
+    def _to_number(value, cast):
+        """숫자 필드 값 → float/int (빈 값은 "", 예전 파일의 숫자 문자열도 변환)"""
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return cast(value)
+        text = str(value or "").strip()
+        if not text:
+            return ""
+        try:
+            return cast(float(text)) if cast is int else cast(text)
+        except ValueError:
+            return text
+
+    @staticmethod
+    def _number_text(value) -> str:
+        if value == "":
+            return ""
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return str(value)
+
+    def _write_number(self, key: str, edit: QLineEdit, cast):
+        # 반영 시점에 검증: 입력 중간 상태("." 등)는 기록하지 않음 (flush_pending 경로 포함)
+        if not edit.hasAcceptableInput():
+            return
+        self._write_field(key, self._to_number(edit.text(), cast), in_size=True)
+
+    def _on_width_changed(self):
+        self._write_number("width_mm", self.width_edit, float)
+
+    def _on_length_changed(self):
+        self._write_number("length_m", self.length_edit, float)
+
+    def _on_count_changed(self):
+        self._write_number("count_ea", self.count_edit, int)
+
+    def _on_progress_changed(self, checked: bool):
+        # 진행성: False = X(기본), True = O
+        self._write_field("progress", checked)
+
+    def _on_remark_changed(self):
+        self._write_field("remark", self.remark_edit.toPlainText())
 
 # =====================================================
 # Widget for editor (핵심 control)
 # =====================================================
+# 도형 패널 스타일 (패널에 한 번만 지정)
+# 같은 우선순위(id 1 + 타입 1)끼리는 뒤 규칙이 이김 → 패널 < 외곽 frame < 헤더 < 목록 순서 유지
+_SHAPE_PANEL_QSS = """
+    #ShapePanel, #ShapePanel QWidget {
+        background: white;
+        border: none;
+    }
+    #ShapePanel QFrame#ShapeFrame, #ShapeFrame QFrame {
+        background: white;
+        border: 1px solid #444;
+    }
+    #ShapePanel QWidget#ShapeHeader, #ShapeHeader QWidget {
+        background: transparent;
+        border: none;
+        border-bottom: 1px solid #444;
+    }
+    QListWidget#ShapeList {
+        background: transparent;
+        border: none;
+        padding: 0px;
+        margin: 0px;
+        outline: 0;
+    }
+    QListWidget#ShapeList::viewport {
+        padding-top: -2px;   /* 핵심 */
+        margin: 0px;
+    }
+    QListWidget#ShapeList::item {
+        margin: 0px;
+        padding: 2px 4px;
+    }
+"""
+
+# 복원된 CircleMark의 defect_info 기본값 (읽기 전용 템플릿)
+_CIRCLE_DEFECT_DEFAULT = {
+    "member": "",
+    "location": "",
+    "defect_type": "",
+    "size": {"width_mm": "", "length_m": "", "count_ea": ""},
+    "progress": False,
+    "remark": "",
+}
+
 class FaultEditorWidget(QWidget):
     dirtyChanged = pyqtSignal()
 
+    UNDO_LIMIT = 200
+    BULK_RESTORE_MIN = 32   # 이 개수 이상 복원할 때만 인덱스 끄고 일괄 추가
+
     def __init__(self, parent=None):
         super().__init__(parent)
         
         # ===== Undo / Redo =====
-        self._undo_stack: list[dict] = []
-        self._redo_stack: list[dict] = []
+        # 스택에는 장면 전체가 아니라 변경분 [(key, 이전, 이후)] 만 쌓는다
+        # 오래된 기록은 자동으로 버려 긴 작업에서도 메모리가 일정
+        self._undo_stack: deque[list] = deque(maxlen=self.UNDO_LIMIT)
+        self._redo_stack: deque[list] = deque(maxlen=self.UNDO_LIMIT)
         self._undo_block = False   # undo/redo 중 재기록 방지       
 
-        self._baseline_snapshot: dict | None = None        
+        self._state: dict[str, bytes] = {}                  # 마지막 확정 상태
+        self._live_items: dict[str, QGraphicsItem] = {}     # undo key -> 장면 항목
+        self._state_digest: bytes | None = None             # _state 전체의 blake2b
+        self._snapshot_digest: bytes | None = None          # 마지막 _make_snapshot 결과의 blake2b
+        self._undo_key_seq = 0
+        self._baseline_snapshot: dict[str, bytes] | None = None
+        self._snapshot_marks: list[dict] = []   # 마지막 _make_snapshot의 도형 to_dict 목록
         
         self.scene = QGraphicsScene(self)
         self.scene.selectionChanged.connect(self._on_scene_selection_changed)
@@ -1417,9 +2127,17 @@ class FaultEditorWidget(QWidget):
         self.current_tool = "circle"
         self.bg_item = None
 
-        self._build_shape_panel()
+        # 도형 패널은 첫 open_png_from_path 때 생성 (그 전엔 보이지 않음)
+        self.shape_panel: QWidget | None = None
 
         self._next_defect_index = 1
+        self._used_ids: set[int] = set()   # 사용 중인 하자 번호 (다음 번호 계산용)
+        self._circles: list[CircleMark] = []   # 장면의 CircleMark (생성 순)
+        self._memos: list[QGraphicsItem] = []  # 장면의 MemoLine / MemoFreePath (undo 스냅샷용)
+        self._marks: dict[QGraphicsItem, None] = {}   # 저장 대상 도형 (추가 순, 순서 있는 set)
+        self._anchored_items: set[QGraphicsItem] = set()   # 실선(_attached_line)이 붙은 도형
+        self._anchor_positions: list | None = None   # [(x, y, item)] hover 검색용 캐시
+        self._dirty_flagged: set[QGraphicsItem] = set()   # _*_dirty_once 플래그가 세워진 항목
         self._next_elbow_arrow_index = 1  # ElbowArrow 번호 카운터
         
         self._fitted = False      
@@ -1435,8 +2153,21 @@ class FaultEditorWidget(QWidget):
         self._panel_pending_pos = None
         self._panel_move_timer = QTimer(self)
         self._panel_move_timer.setSingleShot(True)
-        self._panel_move_timer.timeout.connect(self._apply_pending_panel_move)
+        self._panel_move_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._panel_move_timer.timeout.connect(self._on_panel_move_timeout)
+
+        # 창 크기 조절 중 패널 재배치 묶기 (약 60fps)
+        self._reposition_timer = QTimer(self)
+        self._reposition_timer.setSingleShot(True)
+        self._reposition_timer.setInterval(16)
+        self._reposition_timer.timeout.connect(self._reposition_shape_panel)
               
+        # ===== CREATE 드래그 이동 묶기 =====
+        self._pending_drag_scene_pos = None
+        self._drag_move_timer = QTimer(self)
+        self._drag_move_timer.setSingleShot(True)
+        self._drag_move_timer.timeout.connect(self._apply_pending_drag_move)
+
         self._press_timer = QTimer(self)
         self._press_timer.setSingleShot(True)
         self._press_timer.timeout.connect(self._begin_drag_create)
@@ -1445,8 +2176,8 @@ class FaultEditorWidget(QWidget):
         self._pressing = False               
         
         self._anchor_handle = QGraphicsEllipseItem(-4, -4, 8, 8)
-        self._anchor_handle.setBrush(QBrush(Qt.GlobalColor.white))
-        self._anchor_handle.setPen(QPen(Qt.GlobalColor.red, 2))
+        self._anchor_handle.setBrush(WHITE_BRUSH)
+        self._anchor_handle.setPen(RED_PEN_2)
         self._anchor_handle.setZValue(999)
         self._anchor_handle.setVisible(False)
         self._anchor_handle.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIgnoresTransformations, True)
@@ -1455,13 +2186,15 @@ class FaultEditorWidget(QWidget):
 
         self._anchor_handle_target = None
         self._anchor_handle_radius_px = 10
+        self._cached_anchor_radius_scene: float | None = None   # 줌 변경 시 None
         
         # ===== 연속 편집 묶기용 타이머 =====
         self._edit_end_timer = QTimer(self)
         self._edit_end_timer.setSingleShot(True)
         self._edit_end_timer.timeout.connect(self._end_edit)
-        
-        self.view.viewport().installEventFilter(self)
+        self._edit_dirty = True   # False면 _end_edit에서 스냅샷 생략 (이동 없이 끝난 클릭)
+        self._edit_start_pos = None
+        self._edit_summary = None
                      
     def _apply_pending_panel_move(self):
         if self._panel_pending_pos is None:
@@ -1473,25 +2206,31 @@ class FaultEditorWidget(QWidget):
         self.shape_panel.setUpdatesEnabled(True)
 
         self._panel_pending_pos = None
-                     
-    def eventFilter(self, obj, event):
-        if event.type() == QEvent.Type.MouseButtonPress:
-            if not self.detail_panel.isHidden():
-                # 클릭 위치 (FaultEditorWidget 좌표계)
-                pos = event.position().toPoint()
-
-                # 상세 패널 영역
-                panel_rect = self.detail_panel.geometry()
-
-                # 패널 바깥 클릭 → 닫기
-                if not panel_rect.contains(pos):
-                    self._hide_detail_panel()
 
-        return super().eventFilter(obj, event)
+    def _on_panel_move_timeout(self):
+        # 구간 동안 모인 마지막 위치 반영, 반영했으면 다음 16ms 구간도 묶는다
+        if self._panel_pending_pos is None:
+            return
+        self._apply_pending_panel_move()
+        self._panel_move_timer.start(16)
+                     
+    def _maybe_hide_detail(self, event):
+        # PlanView.mousePressEvent에서 직접 호출 (viewport 이벤트 필터 대신)
+        if not self.detail_panel.isHidden():
+            # 클릭 위치 (FaultEditorWidget 좌표계)
+            pos = event.position().toPoint()
+
+            # 상세 패널 영역
+            panel_rect = self.detail_panel.geometry()
+
+            # 패널 바깥 클릭 → 닫기
+            if not panel_rect.contains(pos):
+                self._hide_detail_panel()
                      
     def _hide_detail_panel(self):
-        self.detail_panel._circle = None
+        # hide() 중 대기 입력을 현재 도형에 반영한 뒤 연결 해제
         self.detail_panel.hide()
+        self.detail_panel._circle = None
 
     def _show_detail_for_circle(self, circle: CircleMark):
         # 패널 표시 + 포커스/선택 상태를 일관되게
@@ -1518,20 +2257,37 @@ class FaultEditorWidget(QWidget):
             pass
         item.requestOpenDefectDetail.connect(self._on_open_defect_detail)
                         
-    def _begin_edit(self):
+    def _begin_edit(self, dirty=True):
         if self._undo_block:
             return
         self._editing = True
+        # 이동 세션은 실제로 움직였을 때만 dirty로 바뀐다
+        self._edit_dirty = dirty
+        self._edit_summary = None if dirty else self._quick_summary()
 
     def _end_edit(self):
         if self._undo_block:
             return
         if not getattr(self, "_editing", False):
             return
+        if not self._edit_dirty and self._quick_summary() == self._edit_summary:
+            # 아무것도 안 바뀐 세션 → 스냅샷 생략
+            # (도형 개수가 달라졌으면 세션 중 생성/삭제가 끼어든 것 → 전체 비교)
+            self._editing = False
+            return
 
+        # 직전 확정 상태와 비교해 바뀐 항목만 undo 기록 (장면 전체 저장 X)
         snapshot = self._make_snapshot()
-        if not self._undo_stack or self._undo_stack[-1] != snapshot:
-            self._undo_stack.append(snapshot)
+        digest = self._snapshot_digest
+        # 전체 digest가 같으면 항목별 비교 생략 (클릭만 하고 끝난 경우 등)
+        if digest == self._state_digest:
+            patch = []
+        else:
+            patch = self._diff_snapshot(self._state, snapshot)
+        self._state = snapshot
+        self._state_digest = digest
+        if patch:
+            self._undo_stack.append(patch)
             self._redo_stack.clear()
 
             # 핵심 추가
@@ -1540,100 +2296,238 @@ class FaultEditorWidget(QWidget):
                 parent.mark_dirty()
 
         self._editing = False
+
+    def _quick_summary(self):
+        # 스냅샷 전에 보는 값싼 요약 (도형 생성/삭제 감지용)
+        return len(self._marks), len(self._memos)
+
+    def reset_undo_history(self):
+        """현재 장면을 undo 기준 상태로 삼고 undo/redo 기록을 비운다"""
+        self._state = self._make_snapshot()
+        self._state_digest = self._snapshot_digest
+        self._baseline_snapshot = self._state
+        self._undo_stack.clear()
+        self._redo_stack.clear()
         
     def _renumber_circle_ids(self):
         """
         현재 씬에 존재하는 CircleMark들의 ID를
         1부터 연속 번호로 재정렬한다.
         """
-        circles = []
-
-        for item in self.scene.items():
-            if isinstance(item, CircleMark):
-                if isinstance(item.display_id, int):
-                    circles.append(item)
+        # 장면 전체가 아니라 관리 중인 원 목록만 본다
+        circles = [c for c in self._circles if isinstance(c.display_id, int)]
 
         # 기존 번호 순서대로 정렬
         circles.sort(key=lambda c: c.display_id)
 
-        # 1부터 다시 부여
-        for idx, circle in enumerate(circles, start=1):
-            if circle.display_id != idx:
-                circle.set_circle_id(idx)
-                circle.display_id = idx
+        # 1부터 다시 부여 (시그널은 묶어서 막고 화면 갱신은 마지막에 한 번)
+        used = self._used_ids
+        changed = False
+        self.scene.blockSignals(True)
+        try:
+            for idx, circle in enumerate(circles, start=1):
+                if circle.display_id != idx:
+                    used.discard(circle.display_id)
+                    circle.set_circle_id(idx)
+                    circle.display_id = idx
+                    used.add(idx)
+                    changed = True
+        finally:
+            self.scene.blockSignals(False)
+
+        if changed:
+            self.view.viewport().update()
+
+    def _undo_key(self, item) -> str:
+        # undo 기록에서 항목을 가리키는 고정 키 (도형은 internal_id, memo는 일련번호)
+        key = item.__dict__.get("_undo_key")
+        if key is None:
+            key = getattr(item, "internal_id", None)
+            if not key:
+                self._undo_key_seq += 1
+                key = f"~{self._undo_key_seq}"
+            item._undo_key = key
+        return key
                        
-    def _make_snapshot(self) -> dict:
-        parent = self.parent()
-        snap = parent.get_defects() if parent and hasattr(parent, "get_defects") else {"items": []}
-        snap["__version__"] = 1
-
-        # undo/redo 전용: memo만 별도 저장
-        memos = []
-        for it in self.scene.items():
-            if isinstance(it, MemoLine):
+    def _make_snapshot(self) -> dict[str, bytes]:
+        """
+        undo 단위 상태: {undo key: pickle된 항목 dict}
+        pickle 바이트로 보관하므로 도형과 공유되는 defect_info 등을 따로 복사할 필요가 없고,
+        비교도 bytes 비교(C)로 끝난다.
+        """
+        snap: dict[str, bytes] = {}
+        live: dict[str, QGraphicsItem] = {}
+        h = hashlib.blake2b(digest_size=16)
+
+        # 도형 to_dict 결과는 저장용(get_defects)으로도 재사용
+        marks = [it.to_dict() for it in self._marks]
+        for it, entry in zip(self._marks, marks):
+            self._add_snapshot_entry(snap, live, h, it, entry)
+        self._snapshot_marks = marks
+
+        # undo/redo 전용: memo도 함께 저장 (장면 전체를 다시 훑지 않고 목록만)
+        for it in self._memos:
+            if type(it) is MemoLine:
                 l = it.line()
-                memos.append({
+                entry = {
                     "type": "memo_line",
                     "p1": [l.p1().x(), l.p1().y()],
                     "p2": [l.p2().x(), l.p2().y()],
-                })
-            elif isinstance(it, MemoFreePath):
+                }
+            elif type(it) is MemoFreePath:
                 path = it.path()
                 pts = []
                 for i in range(path.elementCount()):
                     e = path.elementAt(i)
                     pts.append([e.x, e.y])
-                memos.append({
+                entry = {
                     "type": "memo_free",
                     "pts": pts
-                })
+                }
+            self._add_snapshot_entry(snap, live, h, it, entry)
 
-        snap["memos"] = memos
+        self._live_items = live
+        self._snapshot_digest = h.digest()
         return snap
-        
-    def _restore_snapshot(self, snapshot: dict):
-        version = snapshot.get("__version__", 0)
-        if version == 0:
-            # legacy 데이터 (초기 버전)
+
+    def _add_snapshot_entry(self, snap, live, h, it, entry):
+        key = self._undo_key(it)
+        blob = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        snap[key] = blob
+        live[key] = it
+        h.update(key.encode())
+        h.update(blob)
+
+    @staticmethod
+    def _diff_snapshot(old: dict[str, bytes], new: dict[str, bytes]) -> list[tuple[str, bytes | None, bytes | None]]:
+        """두 상태 사이의 변경분 [(key, 이전|None, 이후|None)]"""
+        patch = []
+        for key, entry in new.items():
+            prev = old.get(key)
+            if prev != entry:
+                patch.append((key, prev, entry))
+        for key, prev in old.items():
+            if key not in new:
+                patch.append((key, prev, None))
+        return patch
+
+    def _restore_snapshot(self, snapshot: dict[str, bytes]):
+        """snapshot 의 항목들을 장면에 다시 만든다 (키 유지)"""
+        with self._bulk_scene_update(len(snapshot)):
+            self._restore_snapshot_items(snapshot)
+
+        self._rebuild_used_ids()
+        self._next_defect_index = self._calc_next_defect_index()
+        self.view.tune_item_index()
+
+    @contextmanager
+    def _bulk_scene_update(self, count: int):
+        # 항목이 많으면 인덱스/화면 갱신/시그널을 멈추고 한꺼번에 추가 후 한 번만 재구성
+        # (적을 때는 BSP 전체 재구성이 오히려 비싸므로 그대로 추가)
+        if count < self.BULK_RESTORE_MIN:
+            yield
+            return
+        prev_index = self.scene.itemIndexMethod()
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        self.view.setUpdatesEnabled(False)
+        self.scene.blockSignals(True)
+        try:
+            yield
+        finally:
+            self.scene.blockSignals(False)
+            self.scene.setItemIndexMethod(prev_index)
+            self.view.setUpdatesEnabled(True)
+            self.scene.update()
+
+    def _restore_snapshot_items(self, snapshot: dict[str, bytes]):
+        for key, blob in snapshot.items():
+            # loads 결과는 매번 새 dict → undo 기록과 도형이 공유되지 않음
+            info = pickle.loads(blob)
+            kind = info.get("type")
+            if kind == "memo_line":
+                p1 = QPointF(*info["p1"])
+                p2 = QPointF(*info["p2"])
+                item = MemoLine(p1, p2)
+                self._add_memo(item)
+            elif kind == "memo_free":
+                pts = info.get("pts") or []
+                if not pts:
+                    continue
+                item = MemoFreePath(QPointF(*pts[0]))
+                item.simplify_epsilon = 0.0   # 저장된 점은 이미 단순화됨
+                item.set_points(pts)
+                self._add_memo(item)
+            else:
+                item = self._restore_item(info)
+                if item is None:
+                    continue
+
+            item._undo_key = key
+            self._live_items[key] = item
+
+    def _remove_live_item(self, key: str):
+        item = self._live_items.pop(key, None)
+        if item is None or item.scene() is not self.scene:
+            return
+        if self.detail_panel._circle is item:
+            self._hide_detail_panel()
+        line = getattr(item, "_attached_line", None)
+        if line is not None:
+            self.scene.removeItem(line)
+        if isinstance(item, CircleMark):
+            self._forget_circle(item)
+        elif type(item) in _MEMO_TYPES:
+            self._remove_memo(item)
+            return
+        self._marks.pop(item, None)
+        self._anchored_items.discard(item)
+        self._anchor_positions = None
+        self.scene.removeItem(item)
+
+    def _forget_circle(self, item):
+        try:
+            self._circles.remove(item)
+        except ValueError:
             pass
-        elif version == 1:
+
+    def _add_memo(self, item):
+        self.scene.addItem(item)
+        self._memos.append(item)
+
+    def _remove_memo(self, item):
+        self.scene.removeItem(item)
+        try:
+            self._memos.remove(item)
+        except ValueError:
             pass
-            
-        self.open_png_from_path(snapshot.get("image", self.bg_path))
-
-        for info in snapshot.get("items", []):
-            self._restore_item(info)
-
-        # memo 복원
-        for m in snapshot.get("memos", []):
-            if m.get("type") == "memo_line":
-                p1 = QPointF(*m["p1"])
-                p2 = QPointF(*m["p2"])
-                self.scene.addItem(MemoLine(p1, p2))
-            elif m.get("type") == "memo_free":
-                pts = m.get("pts") or []
-                if pts:
-                    item = MemoFreePath(QPointF(*pts[0]))
-                    for xy in pts[1:]:
-                        item.add_point(QPointF(*xy))
-                    self.scene.addItem(item)
 
-        self._next_defect_index = self._calc_next_defect_index()
+    def _apply_patch(self, patch, forward: bool):
+        # 바뀐 항목만 제거 후 목표 상태로 다시 생성
+        self._state_digest = None   # 다음 _end_edit는 항목별로 비교
+        self._anchor_handle_target = None
+        self._anchor_handle.setVisible(False)
+
+        targets: dict[str, bytes] = {}
+        for key, before, after in patch:
+            target = after if forward else before
+            self._remove_live_item(key)
+            if target is None:
+                self._state.pop(key, None)
+            else:
+                self._state[key] = target
+                targets[key] = target
+
+        self._restore_snapshot(targets)
         
     def undo(self):
-        # 기준 상태(최소 1개)는 남겨야 하므로 2개 이상일 때만 undo
-        if len(self._undo_stack) < 2:
+        if not self._undo_stack:
             return
 
         self._undo_block = True
 
-        # 현재 상태를 redo로 이동
-        current = self._undo_stack.pop()
-        self._redo_stack.append(current)
-
-        # 이전 상태 복원
-        snapshot = self._undo_stack[-1]
-        self._restore_snapshot(snapshot)
+        patch = self._undo_stack.pop()
+        self._apply_patch(patch, forward=False)
+        self._redo_stack.append(patch)
 
         self._undo_block = False
         self.mark_dirty()
@@ -1644,9 +2538,9 @@ class FaultEditorWidget(QWidget):
 
         self._undo_block = True
 
-        snapshot = self._redo_stack.pop()
-        self._undo_stack.append(snapshot)
-        self._restore_snapshot(snapshot)
+        patch = self._redo_stack.pop()
+        self._apply_patch(patch, forward=True)
+        self._undo_stack.append(patch)
 
         self._undo_block = False
         self.mark_dirty()
@@ -1669,61 +2563,82 @@ class FaultEditorWidget(QWidget):
         p1 = self.view.mapToScene(int(px), 0)
         return QLineF(p0, p1).length()
 
+    def _anchor_radius_scene(self) -> float:
+        # view 변환(줌)이 바뀔 때만 다시 계산 (None = 무효화됨)
+        radius = self._cached_anchor_radius_scene
+        if radius is None:
+            radius = self._scene_dist_from_view_px(self._anchor_handle_radius_px)
+            self._cached_anchor_radius_scene = radius
+        return radius
+
     def _on_hover_move(self, event):
         # 드래그 중이면 hover는 하지 않음
         if self._drag_mode in (DragMode.MOVE, DragMode.MOVE_ANCHOR, DragMode.CREATE):
             return
 
         scene_pos = self.view.mapToScene(event.position().toPoint())
-        radius_scene = self._scene_dist_from_view_px(self._anchor_handle_radius_px)
+        radius_scene = self._anchor_radius_scene()
 
         best_item = None
-        best_dist = 1e18
-        best_anchor = None
-
-        # line이 붙은 도형만 대상으로 anchor 근접 검사
-        for it in self.scene.items():
-            if not hasattr(it, "to_dict"):
-                continue
-            # line이 붙은 항목만
-            line = getattr(it, "_attached_line", None)
-            anchor = getattr(it, "_line_anchor_scene_pos", None)
-            if line is None or anchor is None:
-                continue
-
-            d = QLineF(scene_pos, anchor).length()
-            if d < radius_scene and d < best_dist:
+        best_x = best_y = 0.0
+        # 거리 비교는 제곱으로 (sqrt 생략)
+        best_d2 = radius_scene * radius_scene
+        sx, sy = scene_pos.x(), scene_pos.y()
+
+        # line이 붙은 도형의 anchor 좌표만 float로 훑는다 (Qt 호출 없음)
+        for ax, ay, it in self._anchor_positions_list():
+            dx = ax - sx
+            dy = ay - sy
+            d2 = dx * dx + dy * dy
+            if d2 < best_d2:
                 best_item = it
-                best_dist = d
-                best_anchor = anchor
+                best_d2 = d2
+                best_x, best_y = ax, ay
 
         if best_item:
             self._anchor_handle_target = best_item
-            self._anchor_handle.setPos(best_anchor)
+            self._anchor_handle.setPos(best_x, best_y)
             self._anchor_handle.setVisible(True)
         else:
             self._anchor_handle_target = None
             self._anchor_handle.setVisible(False)
         
-    def _calc_next_defect_index(self) -> int:
-        max_n = 0
-        for item in self.scene.items():
+    def _rebuild_used_ids(self):
+        """사용 중인 번호 집합을 장면에서 다시 만든다 (복원/로드 후 1회)"""
+        used = set()
+        for item in self._marks:
             if hasattr(item, "display_id"):
                 did = item.display_id
 
                 # Circle: display_id가 int
                 if isinstance(did, int):
-                    max_n = max(max_n, did)
+                    used.add(did)
 
                 # 기존 문자열 ID 호환
                 elif isinstance(did, str):
                     try:
-                        n = int(did.split("-")[-1])
-                        max_n = max(max_n, n)
+                        used.add(int(did.split("-")[-1]))
                     except:
                         pass
 
-        return max_n + 1
+        self._used_ids = used
+
+    def _anchor_positions_list(self) -> list[tuple[float, float, QGraphicsItem]]:
+        # anchor 생성/이동/삭제 시 None 으로 무효화 → hover 때 한 번만 다시 만든다
+        positions = self._anchor_positions
+        if positions is None:
+            positions = []
+            for it in self._anchored_items:
+                anchor = getattr(it, "_line_anchor_scene_pos", None)
+                if getattr(it, "_attached_line", None) is None or anchor is None:
+                    continue
+                positions.append((anchor.x(), anchor.y(), it))
+            self._anchor_positions = positions
+        return positions
+
+    def _calc_next_defect_index(self) -> int:
+        # 생성/삭제/재정렬 때 _used_ids를 갱신하므로 장면 순회 없음
+        return max(self._used_ids, default=0) + 1
 
         
     def _can_create_at(self, scene_pos: QPointF) -> bool:
@@ -1734,7 +2649,7 @@ class FaultEditorWidget(QWidget):
         hit = self.scene.itemAt(scene_pos, QTransform())
         block = hit
         while block is not None:
-            if hasattr(block, "to_dict"):
+            if _is_shape(block):
                 return False
             block = block.parentItem()
         return True
@@ -1743,10 +2658,13 @@ class FaultEditorWidget(QWidget):
         import uuid
 
         item.internal_id = str(uuid.uuid4())
+        self._marks[item] = None
 
         if isinstance(item, CircleMark):
             item.set_circle_id(self._next_defect_index)
+            self._used_ids.add(self._next_defect_index)
             self._next_defect_index += 1
+            self._circles.append(item)
 
             item.defect_info = {
                 "member": "벽체",
@@ -1764,6 +2682,7 @@ class FaultEditorWidget(QWidget):
         
     def reset_view_transform(self):
         self.view.resetTransform()
+        self._cached_anchor_radius_scene = None
 
         if hasattr(self, "_base_view_scale"):
             s = self._base_view_scale
@@ -1783,8 +2702,17 @@ class FaultEditorWidget(QWidget):
         self._begin_edit()
 
         for item in items:
+            if type(item) in _MEMO_TYPES:
+                self._remove_memo(item)
+                continue
             if hasattr(item, "_attached_line") and item._attached_line:
                 self.scene.removeItem(item._attached_line)
+            if isinstance(item, CircleMark):
+                self._used_ids.discard(item.display_id)
+                self._forget_circle(item)
+            self._marks.pop(item, None)
+            self._anchored_items.discard(item)
+            self._anchor_positions = None
             self.scene.removeItem(item)
 
         # 삭제 완료 후 Circle ID 재정렬
@@ -1797,70 +2725,76 @@ class FaultEditorWidget(QWidget):
         self._end_edit()
         self.mark_dirty()
         
-    def _add_shape(self, tool, label, pixmap):
-        item = QListWidgetItem(QIcon(pixmap), label)
+    def _add_shape(self, tool, label, icon):
+        item = QListWidgetItem(icon, label)
         item.setSizeHint(QSize(
             self.shape_list.iconSize().width() + 20,
             self._menu_item_height
         ))
         item.setData(Qt.ItemDataRole.UserRole, tool)
         self.shape_list.addItem(item)
+        self._shape_list_total_h += self._menu_item_height
 
     def _on_shape_selected(self, current, _):
         if current:
             self.current_tool = current.data(Qt.ItemDataRole.UserRole)
 
     # ---------- 아이콘 ----------
+    @_cached_icon
     def _icon_line(self):
         pix = QPixmap(48, 48)
         pix.fill(Qt.GlobalColor.transparent)
         p = QPainter(pix)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        p.setPen(QPen(Qt.GlobalColor.blue, 2))   # 굵기 ↓
+        p.setPen(BLUE_PEN_2)   # 굵기 ↓
         p.drawLine(14, 34, 34, 14)               # 여백 ↑
         p.end()
         return pix
 
+    @_cached_icon
     def _icon_free(self):
         pix = QPixmap(48, 48)
         pix.fill(Qt.GlobalColor.transparent)
         p = QPainter(pix)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        p.setPen(QPen(Qt.GlobalColor.blue, 2))
+        p.setPen(BLUE_PEN_2)
         path = QPainterPath(QPointF(14, 24))
         path.cubicTo(18, 14, 30, 34, 34, 24)
         p.drawPath(path)
         p.end()
         return pix
         
+    @_cached_icon
     def _icon_circle(self):
         pix = QPixmap(48, 48)
         pix.fill(Qt.GlobalColor.transparent)
         p = QPainter(pix)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        p.setPen(QPen(Qt.GlobalColor.red, 3))
+        p.setPen(RED_PEN_3)
         p.drawEllipse(12, 12, 24, 24)
         p.end()
         return pix
 
+    @_cached_icon
     def _icon_square(self):
         pix = QPixmap(48, 48)
         pix.fill(Qt.GlobalColor.transparent)
         p = QPainter(pix)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        p.setPen(QPen(Qt.GlobalColor.red, 1))
-        p.setBrush(QBrush(Qt.GlobalColor.red))
+        p.setPen(RED_PEN_1)
+        p.setBrush(RED_BRUSH)
         p.drawRect(11, 11, 26, 26)
         p.end()
         return pix
 
+    @_cached_icon
     def _icon_triangle(self):
         pix = QPixmap(48, 48)
         pix.fill(Qt.GlobalColor.transparent)
         p = QPainter(pix)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        p.setPen(QPen(Qt.GlobalColor.red, 1))
-        p.setBrush(QBrush(Qt.GlobalColor.red))
+        p.setPen(RED_PEN_1)
+        p.setBrush(RED_BRUSH)
         p.drawPolygon(QPolygonF([
             QPointF(24, 12),
             QPointF(12, 36),
@@ -1869,21 +2803,23 @@ class FaultEditorWidget(QWidget):
         p.end()
         return pix
 
+    @_cached_icon
     def _icon_s(self):
         pix = QPixmap(48, 48)
         pix.fill(Qt.GlobalColor.transparent)
         p = QPainter(pix)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        p.setPen(QPen(Qt.GlobalColor.red, 1))
+        p.setPen(RED_PEN_1)
         path = QPainterPath()
         path.moveTo(24, 6)
         path.cubicTo(12, 16, 36, 32, 24, 42)
         p.drawPath(path)
-        p.setBrush(QBrush(Qt.GlobalColor.red))
+        p.setBrush(RED_BRUSH)
         p.drawEllipse(QPointF(24, 24), 3, 3)
         p.end()
         return pix
 
+    @_cached_icon
     def _icon_text(self):
         pix = QPixmap(48, 48)
         pix.fill(Qt.GlobalColor.transparent)
@@ -1894,12 +2830,13 @@ class FaultEditorWidget(QWidget):
         p.end()
         return pix
 
+    @_cached_icon
     def _icon_elbow_arrow(self):
         pix = QPixmap(48, 48)
         pix.fill(Qt.GlobalColor.transparent)
         p = QPainter(pix)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        p.setPen(QPen(Qt.GlobalColor.red, 2))
+        p.setPen(RED_PEN_2)
         
         # L자 형태 그리기
         path = QPainterPath(QPointF(14, 14))
@@ -1913,11 +2850,11 @@ class FaultEditorWidget(QWidget):
             QPointF(14, 20),
             QPointF(17, 17)
         ])
-        p.setBrush(QBrush(Qt.GlobalColor.red))
+        p.setBrush(RED_BRUSH)
         p.drawPolygon(arrow)
         
         # 끝점 동그라미
-        p.setBrush(QBrush(Qt.GlobalColor.white))
+        p.setBrush(WHITE_BRUSH)
         p.drawEllipse(QPointF(34, 30), 6, 6)
         
         # 숫자
@@ -1927,12 +2864,13 @@ class FaultEditorWidget(QWidget):
         p.end()
         return pix
 
+    @_cached_icon
     def _icon_elbow_arrow_horizontal(self):
         pix = QPixmap(48, 48)
         pix.fill(Qt.GlobalColor.transparent)
         p = QPainter(pix)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        p.setPen(QPen(Qt.GlobalColor.red, 2))
+        p.setPen(RED_PEN_2)
         
         # ㄱ자 형태 그리기 (수평 먼저)
         path = QPainterPath(QPointF(14, 14))
@@ -1946,11 +2884,11 @@ class FaultEditorWidget(QWidget):
             QPointF(20, 14),
             QPointF(17, 11)
         ])
-        p.setBrush(QBrush(Qt.GlobalColor.red))
+        p.setBrush(RED_BRUSH)
         p.drawPolygon(arrow)
         
         # 끝점 동그라미
-        p.setBrush(QBrush(Qt.GlobalColor.white))
+        p.setBrush(WHITE_BRUSH)
         p.drawEllipse(QPointF(30, 34), 6, 6)
         
         # 숫자
@@ -1960,12 +2898,13 @@ class FaultEditorWidget(QWidget):
         p.end()
         return pix
 
+    @_cached_icon
     def _icon_funnel_arrow(self):
         pix = QPixmap(48, 48)
         pix.fill(Qt.GlobalColor.transparent)
         p = QPainter(pix)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        p.setPen(QPen(Qt.GlobalColor.red, 2))
+        p.setPen(RED_PEN_2)
         
         # 역삼각형 (깔때기)
         triangle = QPolygonF([
@@ -1983,7 +2922,7 @@ class FaultEditorWidget(QWidget):
         p.drawLine(24, 30, 36, 30)  # 수평
         
         # 끝점 동그라미
-        p.setBrush(QBrush(Qt.GlobalColor.white))
+        p.setBrush(WHITE_BRUSH)
         p.drawEllipse(QPointF(36, 30), 5, 5)
         
         # 숫자
@@ -1993,12 +2932,13 @@ class FaultEditorWidget(QWidget):
         p.end()
         return pix
 
+    @_cached_icon
     def _icon_funnel_arrow_horizontal(self):
         pix = QPixmap(48, 48)
         pix.fill(Qt.GlobalColor.transparent)
         p = QPainter(pix)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        p.setPen(QPen(Qt.GlobalColor.red, 2))
+        p.setPen(RED_PEN_2)
         
         # 역삼각형 (깔때기) - 오른쪽 향함
         triangle = QPolygonF([
@@ -2016,7 +2956,7 @@ class FaultEditorWidget(QWidget):
         p.drawLine(30, 24, 30, 36)  # 수직
         
         # 끝점 동그라미
-        p.setBrush(QBrush(Qt.GlobalColor.white))
+        p.setBrush(WHITE_BRUSH)
         p.drawEllipse(QPointF(30, 36), 5, 5)
         
         # 숫자
@@ -2041,6 +2981,8 @@ class FaultEditorWidget(QWidget):
             # anchor는 오직 이 모드에서만 변경
             item._line_anchor_scene_pos = scene_pos
             item._update_attached_line_geometry()
+            self._anchor_positions = None
+            self._edit_dirty = True
 
             self._anchor_handle_target = item
             self._anchor_handle.setPos(scene_pos)
@@ -2049,6 +2991,7 @@ class FaultEditorWidget(QWidget):
     
         if self._drag_mode == DragMode.MOVE and self._drag_item:
             item = self._drag_item
+            self._mark_moved(item)
 
             # 핵심: MOVE 중 실시간 leader line 갱신 (old 방식)
             if hasattr(item, "_update_attached_line_geometry"):
@@ -2057,47 +3000,56 @@ class FaultEditorWidget(QWidget):
             item._update_defect_label_pos()
             return
                        
-        # ===== CREATE: memo 전용 =====
-        if self._drag_mode == DragMode.CREATE and isinstance(self._drag_item, MemoLine):
-            scene_pos = self.view.mapToScene(event.position().toPoint())
-            self._drag_item.setLine(QLineF(self._press_pos, scene_pos))
+        if self._drag_mode != DragMode.CREATE or self._drag_item is None:
             return
 
-        if self._drag_mode == DragMode.CREATE and isinstance(self._drag_item, MemoFreePath):
+        # ===== CREATE: 자유곡선은 모든 점이 필요 (add_point 자체가 묶어서 반영) =====
+        if type(self._drag_item) is MemoFreePath:
             scene_pos = self.view.mapToScene(event.position().toPoint())
             self._drag_item.add_point(scene_pos)
             return
 
-        if self._drag_mode == DragMode.CREATE and isinstance(self._drag_item, ElbowArrow):
-            scene_pos = self.view.mapToScene(event.position().toPoint())
-            self._drag_item.set_end(scene_pos)
+        # ===== CREATE: Circle은 버튼 누른 채 leader line이 있을 때만 =====
+        if type(self._drag_item) is CircleMark and not (
+            self._drag_line and (event.buttons() & Qt.MouseButton.LeftButton)
+        ):
             return
 
-        if self._drag_mode == DragMode.CREATE and isinstance(self._drag_item, ElbowArrowHorizontal):
-            scene_pos = self.view.mapToScene(event.position().toPoint())
-            self._drag_item.set_end(scene_pos)
+        # 나머지는 마지막 위치만 모아서 반영 (약 120Hz, 도형 패널 드래그와 같은 방식)
+        self._pending_drag_scene_pos = self.view.mapToScene(event.position().toPoint())
+        if not self._drag_move_timer.isActive():
+            self._drag_move_timer.start(8)
+
+    def _mark_moved(self, item):
+        # press 위치에서 0.5px 넘게 움직였을 때만 편집 세션을 dirty로
+        if self._edit_dirty or self._edit_start_pos is None:
             return
+        delta = item.pos() - self._edit_start_pos
+        if delta.x() * delta.x() + delta.y() * delta.y() > 0.25:
+            self._edit_dirty = True
 
-        if self._drag_mode == DragMode.CREATE and isinstance(self._drag_item, FunnelArrow):
-            scene_pos = self.view.mapToScene(event.position().toPoint())
-            self._drag_item.set_end(scene_pos)
+    def _apply_pending_drag_move(self):
+        scene_pos = self._pending_drag_scene_pos
+        if scene_pos is None:
             return
+        self._pending_drag_scene_pos = None
 
-        if self._drag_mode == DragMode.CREATE and isinstance(self._drag_item, FunnelArrowHorizontal):
-            scene_pos = self.view.mapToScene(event.position().toPoint())
-            self._drag_item.set_end(scene_pos)
+        item = self._drag_item
+        if self._drag_mode != DragMode.CREATE or item is None:
             return
 
-        # ===== CREATE: Circle + leader line (old 방식) =====
-        if (
-            self._drag_mode == DragMode.CREATE
-            and isinstance(self._drag_item, CircleMark)
-            and self._drag_line
-            and (event.buttons() & Qt.MouseButton.LeftButton)
-        ):
-            scene_pos = self.view.mapToScene(event.position().toPoint())
-            item = self._drag_item
+        # ===== CREATE: memo 전용 =====
+        kind = type(item)
+        if kind is MemoLine:
+            item.setLine(QLineF(self._press_pos, scene_pos))
+            return
+
+        if kind in _ARROW_TYPES:
+            item.set_end(scene_pos)
+            return
 
+        # ===== CREATE: Circle + leader line (old 방식) =====
+        if kind is CircleMark:
             item.setPos(scene_pos)
             item.setVisible(True)
 
@@ -2107,33 +3059,40 @@ class FaultEditorWidget(QWidget):
             # ID 실시간 표시 + 중앙 정렬
             if hasattr(item, "display_id"):
                 item.set_circle_id(item.display_id)
-            return
 
     def _on_mouse_release(self, event):
         MIN_MEMO_LINE_LEN = 8.0
         MIN_MEMO_PATH_SIZE = 6.0
         if event.button() != Qt.MouseButton.LeftButton:
             return
-              
-        if isinstance(self._drag_item, MemoLine):
+
+        # 타이머에 남은 마지막 이동은 즉시 반영 (마무리 튐 방지)
+        if self._drag_move_timer.isActive():
+            self._drag_move_timer.stop()
+        self._apply_pending_drag_move()
+
+        kind = type(self._drag_item)
+        if kind is MemoLine:
             line = self._drag_item.line()
             if line.length() < MIN_MEMO_LINE_LEN:
                 # 너무 짧으면 취소
-                self.scene.removeItem(self._drag_item)
+                self._remove_memo(self._drag_item)
                 self._end_edit()
                 self._reset_mouse_drag()
                 return
                 
-        if isinstance(self._drag_item, MemoFreePath):
+        if kind is MemoFreePath:
+            # 아직 반영 안 된 점까지 확정 (+ 마지막 구간 단순화)
+            self._drag_item.finish()
             rect = self._drag_item.path().boundingRect()
             if rect.width() < MIN_MEMO_PATH_SIZE and rect.height() < MIN_MEMO_PATH_SIZE:
                 # 점처럼 찍힌 경우 → 취소
-                self.scene.removeItem(self._drag_item)
+                self._remove_memo(self._drag_item)
                 self._end_edit()
                 self._reset_mouse_drag()
                 return
 
-        if isinstance(self._drag_item, ElbowArrow):
+        if kind is ElbowArrow:
             # 끝점 설정 (이미 마우스 이동 중 업데이트됨)
             path_rect = self._drag_item.path().boundingRect()
             if path_rect.width() < MIN_MEMO_LINE_LEN and path_rect.height() < MIN_MEMO_LINE_LEN:
@@ -2142,7 +3101,7 @@ class FaultEditorWidget(QWidget):
                 self._reset_mouse_drag()
                 return
 
-        if isinstance(self._drag_item, ElbowArrowHorizontal):
+        if kind is ElbowArrowHorizontal:
             # 끝점 설정 (이미 마우스 이동 중 업데이트됨)
             path_rect = self._drag_item.path().boundingRect()
             if path_rect.width() < MIN_MEMO_LINE_LEN and path_rect.height() < MIN_MEMO_LINE_LEN:
@@ -2151,7 +3110,7 @@ class FaultEditorWidget(QWidget):
                 self._reset_mouse_drag()
                 return
 
-        if isinstance(self._drag_item, (FunnelArrow, FunnelArrowHorizontal)):
+        if kind is FunnelArrow or kind is FunnelArrowHorizontal:
             # 끝점 설정 (이미 마우스 이동 중 업데이트됨)
             path_rect = self._drag_item.path().boundingRect()
             if path_rect.width() < MIN_MEMO_LINE_LEN and path_rect.height() < MIN_MEMO_LINE_LEN:
@@ -2163,6 +3122,9 @@ class FaultEditorWidget(QWidget):
         if self._drag_mode in (DragMode.MOVE, DragMode.MOVE_ANCHOR):
             item = self._drag_item
 
+            if self._drag_mode == DragMode.MOVE and item:
+                self._mark_moved(item)
+
             if (
                 self._drag_mode == DragMode.MOVE
                 and item
@@ -2182,7 +3144,7 @@ class FaultEditorWidget(QWidget):
         self._pending_press_pos = None
 
         # memo CREATE 종료 먼저 처리
-        if self._drag_mode == DragMode.CREATE and isinstance(self._drag_item, (MemoLine, MemoFreePath, ElbowArrow, ElbowArrowHorizontal, FunnelArrow, FunnelArrowHorizontal)):
+        if self._drag_mode == DragMode.CREATE and kind in _DRAW_TYPES:
             self._end_edit()
             self._reset_mouse_drag()
             self.mark_dirty()
@@ -2206,6 +3168,9 @@ class FaultEditorWidget(QWidget):
             item.setPos(end_pos)
             item.setVisible(True)
             item.confirm_attach()
+            if item._attached_line is not None:
+                self._anchored_items.add(item)
+                self._anchor_positions = None
             
             # 핵심: 드래그 생성 후에도 초기화 반드시 수행
             self._init_defect_for_item(item)
@@ -2227,16 +3192,16 @@ class FaultEditorWidget(QWidget):
             anchor = getattr(self._anchor_handle_target, "_line_anchor_scene_pos", None)
 
             if anchor is not None:
-                radius_scene = self._scene_dist_from_view_px(self._anchor_handle_radius_px)
+                radius_scene = self._anchor_radius_scene()
                 if QLineF(scene_pos, anchor).length() <= radius_scene:
-                    self._begin_edit()
+                    self._begin_edit(dirty=False)
                     self._drag_mode = DragMode.MOVE_ANCHOR
                     self._drag_item = self._anchor_handle_target
                     return True
                     
         # ... _on_mouse_press 내부, scene_pos 만든 직후에 추가
         raw = self.scene.itemAt(scene_pos, QTransform())
-        if isinstance(raw, (MemoLine, MemoFreePath, ElbowArrow, ElbowArrowHorizontal, FunnelArrow, FunnelArrowHorizontal)):
+        if type(raw) in _DRAW_TYPES:
             mods = event.modifiers()
 
             # 단일 선택 동작 (Ctrl/Shift 없으면 기존 선택 해제 후 선택)
@@ -2252,17 +3217,18 @@ class FaultEditorWidget(QWidget):
 
         hit = self._find_shape_at(scene_pos)
         # memo 도형은 Qt 기본 선택 처리에 맡긴다
-        if isinstance(hit, (MemoLine, MemoFreePath, ElbowArrow, ElbowArrowHorizontal, FunnelArrow, FunnelArrowHorizontal)):
+        if type(hit) in _DRAW_TYPES:
             return False        
         # ---- 단일 선택 강제 (영역선택 모드가 아닐 때) ----
         if self._edit_mode != EditMode.AREA_SELECT:
             self.scene.clearSelection()
 
         if hit and self._edit_mode == EditMode.SELECT:
-            # ⭐ MOVE 시작 → 편집 세션 시작
-            self._begin_edit()
+            # ⭐ MOVE 시작 → 편집 세션 시작 (실제 이동 전까지는 dirty 아님)
+            self._begin_edit(dirty=False)
             self._drag_mode = DragMode.MOVE
             self._drag_item = hit
+            self._edit_start_pos = hit.pos()
                            
             return False   # Qt 이동은 그대로 사용
         
@@ -2278,7 +3244,7 @@ class FaultEditorWidget(QWidget):
                 self._press_pos = scene_pos
                 self._drag_item = MemoLine(scene_pos, scene_pos)
                 self._drag_line = None
-                self.scene.addItem(self._drag_item)
+                self._add_memo(self._drag_item)
                 return True
 
             if self.current_tool == "memo_free":
@@ -2290,8 +3256,11 @@ class FaultEditorWidget(QWidget):
                 self._drag_mode = DragMode.CREATE
                 self._press_pos = scene_pos
                 self._drag_item = MemoFreePath(scene_pos)
+                # 화면 1px 이내의 굴곡은 단순화, 화면 2px 이내의 점은 버림 (줌 대응)
+                self._drag_item.simplify_epsilon = self._scene_dist_from_view_px(1)
+                self._drag_item.min_point_gap = self._scene_dist_from_view_px(MemoFreePath.MIN_POINT_GAP)
                 self._drag_line = None
-                self.scene.addItem(self._drag_item)
+                self._add_memo(self._drag_item)
                 return True
 
             if self.current_tool == "elbow_arrow":
@@ -2446,15 +3415,14 @@ class FaultEditorWidget(QWidget):
         self._drag_line = item._attached_line
               
     def _min_line_length_for_item(self, item) -> float:
-        rect = item.boundingRect()
-        base = max(rect.width(), rect.height())
+        base = item.min_base_size()
         return base + 10.0 # 10 마진
                       
     def _find_shape_at(self, scene_pos):
         for hit in self.scene.items(scene_pos):
             it = hit
             while it is not None:
-                if hasattr(it, "to_dict"):
+                if _is_shape(it):
                     return it
                 it = it.parentItem()
         return None
@@ -2466,18 +3434,24 @@ class FaultEditorWidget(QWidget):
         self._drag_item = None
         self._drag_line = None
           
-        # once 플래그 리셋 (position + transform 모두)
-        for item in self.scene.items():
-            if hasattr(item, "_position_dirty_once"):
-                item._position_dirty_once = False
-            if hasattr(item, "_transform_dirty_once"):
-                item._transform_dirty_once = False
-            if hasattr(item, "_scale_dirty_once"):
-                item._scale_dirty_once = False
+        # once 플래그 리셋 (position + transform 모두) - 플래그를 세운 항목만
+        for item in self._dirty_flagged:
+            item._position_dirty_once = False
+            item._transform_dirty_once = False
+            item._scale_dirty_once = False
+        self._dirty_flagged.clear()
+
+    def _flag_dirty_once(self, item, name: str):
+        """_*_dirty_once 플래그는 이 함수로만 세운다 (_reset_mouse_drag에서 일괄 해제)"""
+        setattr(item, name, True)
+        self._dirty_flagged.add(item)
               
     # ---------- 메뉴 패널 ----------    
     def _build_shape_panel(self):
         self.shape_panel = QWidget(self)
+        self.shape_panel.setObjectName("ShapePanel")
+        # 패널 전체 스타일은 한 장으로 한 번만 (자식 생성 전에 지정 → 생성 시 한 번씩만 polish)
+        self.shape_panel.setStyleSheet(_SHAPE_PANEL_QSS)
         self.shape_panel.raise_()
         
         # 이동 중 깜빡임/리페인트 비용 감소
@@ -2486,12 +3460,7 @@ class FaultEditorWidget(QWidget):
         
         # ---------- Frame (외곽 테두리용) ----------
         self.shape_frame = QFrame(self.shape_panel)
-        self.shape_frame.setStyleSheet("""
-            QFrame {
-                background: white;
-                border: 1px solid #444;
-            }
-        """)
+        self.shape_frame.setObjectName("ShapeFrame")
         
         self._menu_item_height = 36 # 핵심 (32~38 취향 조절 가능)
         
@@ -2502,23 +3471,11 @@ class FaultEditorWidget(QWidget):
         )
         
         self.shape_panel.setMouseTracking(True)
-        self.shape_panel.setStyleSheet("""
-            QWidget {
-                background: white;
-                border: none;
-            }
-        """)
         
         # ---------- Header (Drag Handle) ----------
         self.shape_header = QWidget(self.shape_panel)
+        self.shape_header.setObjectName("ShapeHeader")
         self.shape_header.setFixedHeight(18)   # 22 → 18
-        self.shape_header.setStyleSheet("""
-            QWidget {
-                background: transparent;
-                border: none;
-                border-bottom: 1px solid #444;
-            }
-        """)
       
         header_layout = QHBoxLayout(self.shape_header)
         header_layout.setContentsMargins(8, 0, 8, 0)  # 위/아래 여백 제거
@@ -2526,18 +3483,18 @@ class FaultEditorWidget(QWidget):
 
         header_label = QLabel("도형 선택")
         header_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        header_label.setStyleSheet("""
-            QLabel {
-                font-weight: bold;
-                font-size: 12px;
-            }
-        """)
+        # 글꼴만 바꾸므로 QSS 대신 QFont 직접 지정 (스타일시트 파싱/polish 생략)
+        header_font = QFont(header_label.font())
+        header_font.setBold(True)
+        header_font.setPixelSize(12)
+        header_label.setFont(header_font)
 
         header_layout.addStretch(1)
         header_layout.addWidget(header_label)
         header_layout.addStretch(1)
 
         self.shape_list = QListWidget(self.shape_panel)
+        self.shape_list.setObjectName("ShapeList")
         # 핵심 3종 세트
         self.shape_list.setViewportMargins(0, 0, 0, 0)
         self.shape_list.viewport().setContentsMargins(0, 0, 0, 0)
@@ -2546,23 +3503,11 @@ class FaultEditorWidget(QWidget):
         self.shape_list.setIconSize(QSize(28, 28))
         self.shape_list.setFrameShape(QFrame.Shape.NoFrame)
         self.shape_list.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        self.shape_list.setStyleSheet("""
-            QListWidget {
-                background: transparent;
-                border: none;
-                padding: 0px;
-                margin: 0px;
-                outline: 0;
-            }
-            QListWidget::viewport {
-                padding-top: -2px;   /* 핵심 */
-                margin: 0px;
-            }
-            QListWidget::item {
-                margin: 0px;
-                padding: 2px 4px;
-            }
-        """)
+        self.shape_list.setItemDelegate(ShapeListDelegate(self.shape_list))
+        # 모든 행 높이가 같으므로 행마다 sizeHint를 묻지 않게
+        self.shape_list.setUniformItemSizes(True)
+        self.shape_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.shape_list.setBatchSize(16)
 
         # frame 내부 레이아웃
         frame_layout = QVBoxLayout(self.shape_frame)
@@ -2578,6 +3523,9 @@ class FaultEditorWidget(QWidget):
         outer.setSpacing(0)
         outer.addWidget(self.shape_frame)
 
+        # 행 높이 합 (추가하면서 누적 → 나중에 item마다 sizeHint 다시 묻지 않음)
+        self._shape_list_total_h = 0
+
         # ===== 메모 / 드로잉 =====
         self._add_shape("memo_line", "직선", self._icon_line())
         self._add_shape("memo_free", "자유곡선", self._icon_free())
@@ -2586,12 +3534,12 @@ class FaultEditorWidget(QWidget):
         self._add_shape("funnel_arrow", "깔때기(세로)", self._icon_funnel_arrow())
         self._add_shape("funnel_arrow_h", "깔때기(가로)", self._icon_funnel_arrow_horizontal())
 
-        self._add_divider_item()
+        self._add_divider_below_last()
 
         # ===== 하자 포인트 (핵심) =====
         self._add_shape("circle", "동그라미", self._icon_circle())
 
-        self._add_divider_item()
+        self._add_divider_below_last()
 
         # ===== 범례 / 표시용 =====
         self._add_shape("rect", "정사각형", self._icon_square())
@@ -2606,11 +3554,7 @@ class FaultEditorWidget(QWidget):
         self.shape_list.setFixedWidth(140)
         
         # 메뉴 수직 길이
-        list_height = 0
-        for i in range(self.shape_list.count()):
-            item = self.shape_list.item(i)
-            hint = item.sizeHint()
-            list_height += hint.height()
+        list_height = self._shape_list_total_h
 
         # spacing 보정
         list_height += self.shape_list.spacing() * max(0, self.shape_list.count() - 1)
@@ -2624,25 +3568,19 @@ class FaultEditorWidget(QWidget):
 
         self.shape_panel.hide()
         
-    def _add_divider_item(self, height=1):
-        item = QListWidgetItem()
-        item.setFlags(Qt.ItemFlag.NoItemFlags)  # 선택 불가
-        item.setSizeHint(QSize(self.shape_list.width(), height + 2))
-
-        frame = QFrame()
-        frame.setFixedHeight(height)
-        frame.setStyleSheet("background: #999; margin-left: 8px; margin-right: 8px;")
-
-        self.shape_list.addItem(item)
-        self.shape_list.setItemWidget(item, frame)
+    def _add_divider_below_last(self):
+        # 구분선은 마지막 행 하단에 ShapeListDelegate가 그린다 (별도 행/위젯 X)
+        item = self.shape_list.item(self.shape_list.count() - 1)
+        item.setData(DIVIDER_ROLE, True)
                         
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        # 패널 위치는 항상 재계산
-        self._reposition_shape_panel()
+        # 패널 위치는 항상 재계산 (연속 resize는 타이머로 한 번에)
+        if not self._reposition_timer.isActive():
+            self._reposition_timer.start()
         
     def _reposition_shape_panel(self):
-        if not self.shape_panel.isVisible():
+        if self.shape_panel is None or not self.shape_panel.isVisible():
             return
 
         panel_size = self.shape_panel.size()        
@@ -2676,11 +3614,13 @@ class FaultEditorWidget(QWidget):
             - self._panel_drag_offset
         )
 
-        # 바로 move하지 말고 "대기 위치"만 갱신한다 (throttle)
+        # "대기 위치"만 갱신한다 (throttle)
         self._panel_pending_pos = new_pos
 
         # 60fps 정도로만 이동 적용(16ms)
+        # 구간의 첫 이벤트는 바로 반영 → 드래그 시작이 한 프레임 늦지 않게
         if not self._panel_move_timer.isActive():
+            self._apply_pending_panel_move()
             self._panel_move_timer.start(16)
 
         event.accept()
@@ -2696,16 +3636,21 @@ class FaultEditorWidget(QWidget):
         event.accept()
         
     def open_png_from_path(self, path: str):
-        pix = QPixmap(path)
+        pix = _load_plan_pixmap(path)
         if pix.isNull():
             return
 
         self.scene.clear()
+        self._circles.clear()
+        self._memos.clear()
+        self._marks.clear()
+        self._anchored_items.clear()
+        self._anchor_positions = None
 
         # 기존 anchor_handle은 C++에서 삭제됨
         self._anchor_handle = QGraphicsEllipseItem(-4, -4, 8, 8)
-        self._anchor_handle.setBrush(QBrush(Qt.GlobalColor.white))
-        self._anchor_handle.setPen(QPen(Qt.GlobalColor.red, 2))
+        self._anchor_handle.setBrush(WHITE_BRUSH)
+        self._anchor_handle.setPen(RED_PEN_2)
         self._anchor_handle.setZValue(999)
         self._anchor_handle.setVisible(False)
         self._anchor_handle.setFlag(
@@ -2723,8 +3668,11 @@ class FaultEditorWidget(QWidget):
 
         self.scene.setSceneRect(QRectF(pix.rect()))
         self.view.resetTransform()
+        self._cached_anchor_radius_scene = None
         self._fitted = False
 
+        if self.shape_panel is None:
+            self._build_shape_panel()
         self.shape_panel.show()
         self.shape_panel.adjustSize()
         
@@ -2750,6 +3698,7 @@ class FaultEditorWidget(QWidget):
 
         # 위치/형태 복원 후
         self.scene.addItem(item)
+        self._marks[item] = None
         item.setScale(info.get("scale", 1.0))
         item.setRotation(info.get("rotation", 0))
 
@@ -2759,17 +3708,17 @@ class FaultEditorWidget(QWidget):
         item.defect_info = info.get("defect_info", {})
         
         if isinstance(item, CircleMark):
-            di = item.defect_info or {}
-            di.setdefault("member", "")
-            di.setdefault("location", "")
-            di.setdefault("defect_type", "")
-            di.setdefault("size", {"width_mm": "", "length_m": "", "count_ea": ""})
-            di.setdefault("progress", False)
-            di.setdefault("remark", "")
+            # 빠진 키만 기본값으로. size는 상세 패널이 제자리 수정하므로 항상 복사
+            # → 저장된 defects(복사된 점검과 공유될 수 있음)는 편집 중에 바뀌지 않음
+            di = dict(_CIRCLE_DEFECT_DEFAULT)
+            di.update(item.defect_info or {})
+            size = di["size"]
+            di["size"] = dict(size) if isinstance(size, dict) else dict(_CIRCLE_DEFECT_DEFAULT["size"])
             item.defect_info = di
 
             # 시그널 연결(복원된 아이템도 연결 필요)
             self._safe_connect_open_detail(item)
+            self._circles.append(item)
 
         if isinstance(item, CircleMark) and item.display_id:
             # 원 안 숫자 복원
@@ -2788,7 +3737,7 @@ class FaultEditorWidget(QWidget):
             p2 = QPointF(*line_data["p2"])
 
             line = QGraphicsLineItem(QLineF(p1, p2))
-            line.setPen(QPen(Qt.GlobalColor.red, 2))
+            line.setPen(RED_PEN_2)
             line.setAcceptedMouseButtons(Qt.MouseButton.NoButton)
             line.setZValue(-1)
             self.scene.addItem(line)
@@ -2796,6 +3745,10 @@ class FaultEditorWidget(QWidget):
             item._attached_line = line
             item._line_anchor_scene_pos = p1
             item._update_attached_line_geometry()
+            self._anchored_items.add(item)
+            self._anchor_positions = None
+
+        return item
 
 # =====================================================
 # QWidget for status bar
@@ -2861,6 +3814,7 @@ class FaultEditorDialog(QDialog):
         super().__init__(parent)
              
         self._base_title = "하자 편집"
+        self._update_edit_actions_pending = False
         self.setWindowTitle(self._base_title)
         self.resize(1400, 900)
         
@@ -2966,12 +3920,6 @@ class FaultEditorDialog(QDialog):
 
         # 이미지 로드
         self.editor.open_png_from_path(image_path)
-        
-        snap = self.editor._make_snapshot()
-        self.editor._baseline_snapshot = snap
-        self.editor._undo_stack.clear()
-        self.editor._redo_stack.clear()
-        self.editor._undo_stack.append(snap)
                      
         self.status_bar.set_dirty(False)
         self.status_bar.set_zoom(1.0)
@@ -2982,7 +3930,7 @@ class FaultEditorDialog(QDialog):
             self._update_edit_actions()
         else:
             # 빈 문서도 baseline으로 설정
-            self.editor._baseline_snapshot = self.editor._make_snapshot()
+            self.editor.reset_undo_history()
                 
         self._dirty = False
         self._update_title()
@@ -2996,6 +3944,19 @@ class FaultEditorDialog(QDialog):
         self.setWindowTitle(self._base_title)
         
     def _update_edit_actions(self):
+        # 영역선택 등으로 selectionChanged가 연달아 와도 이벤트 루프 한 바퀴에 한 번만 갱신
+        if self._update_edit_actions_pending:
+            return
+        self._update_edit_actions_pending = True
+        QTimer.singleShot(0, self._flush_update_edit_actions)
+
+    def _flush_update_edit_actions(self):
+        if not self._update_edit_actions_pending:
+            return
+        self._update_edit_actions_pending = False
+        self._update_edit_actions_real()
+
+    def _update_edit_actions_real(self):
         has_selection = bool(self.editor.scene.selectedItems())
         self.act_delete_selected.setEnabled(has_selection)
     
@@ -3005,18 +3966,15 @@ class FaultEditorDialog(QDialog):
             self.status_bar.set_dirty(True)    
   
     def save_if_dirty(self):
+        # 입력 중인 상세정보를 먼저 반영해야 dirty/스냅샷에 포함됨
+        self.editor.detail_panel.flush_pending()
         if not self._dirty:
             QMessageBox.information(self, "저장", "변경된 내용이 없습니다.")
             return
 
-        defects = self.get_defects()
-
-        # 저장 완료 후: undo 기준점을 "저장본"으로 리셋
-        snap = self.editor._make_snapshot()
-        self.editor._baseline_snapshot = snap
-        self.editor._undo_stack.clear()
-        self.editor._redo_stack.clear()
-        self.editor._undo_stack.append(snap)
+        # undo 기준점을 "저장본"으로 리셋 (같은 스냅샷의 to_dict 결과를 저장에 사용)
+        self.editor.reset_undo_history()
+        defects = {"items": self.editor._snapshot_marks}
 
         self.saveRequested.emit(defects)  # 실제 저장 요청
         self._dirty = False
@@ -3032,35 +3990,37 @@ class FaultEditorDialog(QDialog):
             "image": self.editor.bg_path,
             "items": defects.get("items", [])
         }
-        self.editor.scene.clear()
-        self.editor.open_png_from_path(data["image"])
+        editor = self.editor
+        # __init__에서 연 새 편집기에서만 호출됨 → 도면은 이미 열려 있으면 다시 열지 않음
+        if editor.bg_item is None:
+            editor.open_png_from_path(data["image"])
 
-        for info in data["items"]:
-            self.editor._restore_item(info)  # 아래에서 추가할 helper
+        items = data["items"]
+        with editor._bulk_scene_update(len(items)):
+            for info in items:
+                editor._restore_item(info)  # 아래에서 추가할 helper
         
+        self.editor._rebuild_used_ids()
         self.editor._next_defect_index = self.editor._calc_next_defect_index()
+        self.editor.view.tune_item_index()
         self._dirty = False
         self._update_title()
-        self._last_saved = self.get_defects()
         
-        # ===== baseline 설정 =====
-        self.editor._baseline_snapshot = self.get_defects()
-        self.editor._undo_stack.clear()
-        self.editor._redo_stack.clear()        
-        self.editor._undo_stack.append(self.editor._baseline_snapshot)
+        # ===== baseline 설정 ===== (저장본 비교용 목록도 같은 스냅샷에서)
+        self.editor.reset_undo_history()
+        self._last_saved = {"items": self.editor._snapshot_marks}
 
     def get_defects(self) -> dict:
-        items = []
-        for item in self.editor.scene.items():
-            if hasattr(item, "to_dict"):
-                items.append(item.to_dict())
-        return {"items": items}
+        # scene.items()의 z 정렬 대신 편집기가 유지하는 도형 목록 (추가 순)
+        return {"items": [item.to_dict() for item in self.editor._marks]}
                
     def accept(self):
+        self.editor.detail_panel.flush_pending()
         self._accepted = True
         super().accept()
 
     def reject(self):
+        self.editor.detail_panel.flush_pending()
         if self._dirty:
             ok = QMessageBox.question(
                 self,
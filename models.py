@@ -1,11 +1,12 @@
 from __future__ import annotations
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from typing import List, Dict, Any
-import uuid
-import copy
+import pickle
+import secrets
 
 def new_id(prefix: str) -> str:
-    return f"{prefix}_{uuid.uuid4().hex[:10]}"
+    # 10자리 hex (uuid 문자열을 만들어 자르지 않고 5바이트 난수를 바로 사용)
+    return f"{prefix}_{secrets.token_hex(5)}"
 
 @dataclass
 class BuildingInfo:
@@ -43,7 +44,35 @@ class Project:
         return Project(id=new_id("proj"))
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # asdict는 트리 전체(defects 포함)를 deepcopy → 저장(json.dump) 용도로는 낭비
+        # inspections는 복사하지 않고 그대로 참조하므로 결과를 수정하지 말 것
+        b = self.building
+        return {
+            "id": self.id,
+            "building": {
+                "name": b.name,
+                "address": b.address,
+                "location": b.location,
+                "memo": b.memo,
+                "photos": list(b.photos),
+            },
+            "parts": [
+                {
+                    "id": p.id,
+                    "name": p.name,
+                    "subparts": [
+                        {
+                            "id": sp.id,
+                            "name": sp.name,
+                            "image_path": sp.image_path,
+                            "inspections": sp.inspections,
+                        }
+                        for sp in p.subparts
+                    ],
+                }
+                for p in self.parts
+            ],
+        }
 
     @staticmethod
     def from_dict(d: Dict[str, Any]) -> "Project":
@@ -56,49 +85,19 @@ class Project:
             photos=list(b.get("photos", []) or []),
         )
 
-        parts: List[Part] = []
-
-        for p in (d.get("parts", []) or []):
-            subparts: List[SubPart] = []
-
-            # 신규 구조 (subparts 있음)
-            if "subparts" in p:
-                for sp in p.get("subparts", []):
-                    subpart = SubPart(
-                        id=sp.get("id", new_id("subpart")),
-                        name=sp.get("name", ""),
-                        image_path=sp.get("image_path", ""),
-                        inspections=dict(sp.get("inspections", {}) or {}),
-                    )
-
-                    # 구버전: subpart 안에 defects가 있으면 DEFAULT로 이관
-                    legacy_defects = sp.get("defects", None)
-                    if legacy_defects is not None and not subpart.inspections:
-                        subpart.inspections = {
-                            "DEFAULT": {"defects": dict(legacy_defects or {})}
-                        }
-
-                    # 혹시 inspections 안에 defects 키가 없는 경우 보정
-                    normalize_subpart_inspections(subpart)
-
-                    subparts.append(subpart)
-            else:
-                # 더 구버전: part 자체가 도면/defects를 들고 있던 경우
-                legacy_defects = dict(p.get("defects", {}) or {})
-                subpart = SubPart(
-                    id=new_id("subpart"),
-                    name=p.get("name", ""),
-                    image_path=p.get("image_path", ""),
-                    inspections={"DEFAULT": {"defects": legacy_defects}},
-                )
-                normalize_subpart_inspections(subpart)
-                subparts.append(subpart)
-
-            parts.append(Part(
+        parts = [
+            Part(
                 id=p.get("id", new_id("part")),
                 name=p.get("name", ""),
-                subparts=subparts,
-            ))
+                # 신규 구조 (subparts 있음) / 더 구버전: part 자체가 도면/defects를 들고 있던 경우
+                subparts=(
+                    [_subpart_from_dict(sp) for sp in p.get("subparts", [])]
+                    if "subparts" in p
+                    else [_subpart_from_legacy_part(p)]
+                ),
+            )
+            for p in (d.get("parts", []) or [])
+        ]
 
         return Project(
             id=d.get("id", new_id("proj")),
@@ -107,6 +106,37 @@ class Project:
         )
 
 
+def _subpart_from_dict(sp: Dict[str, Any]) -> SubPart:
+    subpart = SubPart(
+        id=sp.get("id", new_id("subpart")),
+        name=sp.get("name", ""),
+        image_path=sp.get("image_path", ""),
+        inspections=dict(sp.get("inspections", {}) or {}),
+    )
+
+    # 구버전: subpart 안에 defects가 있으면 DEFAULT로 이관 (이미 정규 형태 → 보정 불필요)
+    legacy_defects = sp.get("defects", None)
+    if legacy_defects is not None and not subpart.inspections:
+        subpart.inspections = {
+            "DEFAULT": {"defects": dict(legacy_defects or {})}
+        }
+        return subpart
+
+    # 혹시 inspections 안에 defects 키가 없는 경우 보정
+    normalize_subpart_inspections(subpart)
+    return subpart
+
+
+def _subpart_from_legacy_part(p: Dict[str, Any]) -> SubPart:
+    # 새로 만든 {"DEFAULT": {"defects": {...}}} 는 이미 정규 형태
+    return SubPart(
+        id=new_id("subpart"),
+        name=p.get("name", ""),
+        image_path=p.get("image_path", ""),
+        inspections={"DEFAULT": {"defects": dict(p.get("defects", {}) or {})}},
+    )
+
+
 # -----------------------
 # Inspection helpers
 # -----------------------
@@ -139,7 +169,14 @@ def ensure_inspection(sp: SubPart, key: str) -> None:
 def list_inspections(sp: SubPart) -> List[str]:
     if not sp.inspections:
         return []
-    return sorted(sp.inspections.keys())
+    # 정렬 결과를 SubPart에 캐시 (dataclass 필드가 아니므로 저장 대상 아님)
+    # inspections는 part_manager 등에서 직접 바뀌기도 하므로 키 집합이 같은지 먼저 확인 (정렬 없이 O(k))
+    insp = sp.inspections
+    cached = getattr(sp, "_sorted_inspection_keys", None)
+    if cached is None or len(cached) != len(insp) or not all(k in insp for k in cached):
+        cached = sorted(insp.keys())
+        sp._sorted_inspection_keys = cached
+    return list(cached)
 
 
 def get_defects(sp: SubPart, key: str) -> Dict[str, Any]:
@@ -156,5 +193,9 @@ def copy_inspection(sp: SubPart, src: str, dst: str) -> None:
     ensure_inspection(sp, src)
     if dst in (sp.inspections or {}):
         raise ValueError(f"inspection already exists: {dst}")
-    sp.inspections[dst] = copy.deepcopy(sp.inspections[src])
-    normalize_subpart_inspections(sp)
+    # JSON 형태(dict/list/기본형)만 들어 있으므로 deepcopy(memo 추적) 대신
+    # pickle 왕복으로 통째 복사 (C 구현, 중첩 dict도 공유되지 않음)
+    # ensure_inspection에서 이미 정규화된 원본의 복사본이라 다시 정규화할 필요 없음
+    sp.inspections[dst] = pickle.loads(
+        pickle.dumps(sp.inspections[src], protocol=pickle.HIGHEST_PROTOCOL)
+    )
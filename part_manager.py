@@ -1,9 +1,16 @@
 from __future__ import annotations
 
-from PyQt6.QtCore import Qt, QDate, QTimer
+import pickle
+from datetime import date
+
+from PyQt6.QtCore import (
+    Qt, QDate, QTimer, QAbstractListModel, QModelIndex, QSignalBlocker,
+    QObject, QRunnable, QThreadPool, pyqtSignal
+)
+from PyQt6.QtGui import QPixmap, QPainter, QIcon, QFont
 from PyQt6.QtWidgets import (
     QDialog, QWidget, QVBoxLayout, QHBoxLayout,
-    QListWidget, QListWidgetItem, QPushButton, QLabel,
+    QListView, QPushButton, QLabel,
     QFileDialog, QMessageBox, QInputDialog,
     QDateEdit, QFormLayout, QLineEdit, QCheckBox,
     QSizePolicy
@@ -13,7 +20,20 @@ from models import Project, Part, SubPart, new_id
 from models import get_defects, set_defects
 import storage
 
-from fault_editor import FaultEditorDialog
+# 점검 날짜는 "yyyy-MM-dd" 문자열로 저장 → Qt 서식 문자열 파서 대신 ISO 변환 사용
+_PARSE_DATE = date.fromisoformat
+
+def _qdate_to_str(qd: QDate) -> str:
+    return date(qd.year(), qd.month(), qd.day()).isoformat()
+
+def _str_to_qdate(s: str | None) -> QDate | None:
+    if not s:
+        return None
+    try:
+        d = _PARSE_DATE(s)
+    except ValueError:
+        return None
+    return QDate(d.year, d.month, d.day)
 
 class InspectionCreateDialog(QDialog):
     def __init__(self, parent=None, title="점검 생성", default_name=""):
@@ -59,48 +79,206 @@ class InspectionCreateDialog(QDialog):
         btn_ok.clicked.connect(self.accept)
         btn_cancel.clicked.connect(self.reject)
 
+    def reset(self, title: str, default_name: str = "",
+              start: QDate | None = None, end: QDate | None = None):
+        """재사용 시 입력값을 처음 연 상태로 되돌림"""
+        today = QDate.currentDate()
+        self.setWindowTitle(title)
+        self.name_edit.setText(default_name)
+        self.start_date.setDate(start or today)
+        self.end_enabled.setChecked(end is not None)
+        self.end_date.setDate(end or today)
+        self.name_edit.setFocus()
+
     def get_data(self):
         name = self.name_edit.text().strip()
-        start = self.start_date.date().toString("yyyy-MM-dd")
-        end = self.end_date.date().toString("yyyy-MM-dd") if self.end_enabled.isChecked() else None
+        start = _qdate_to_str(self.start_date.date())
+        end = _qdate_to_str(self.end_date.date()) if self.end_enabled.isChecked() else None
         return {"name": name, "start_date": start, "end_date": end}
 
-class PartManagerDialog(QDialog):
-    TITLE_LABEL_STYLE = """
-    QLabel {
+class ElidedLabel(QLabel):
+    """긴 경로는 가운데를 …로 줄여 한 줄로 표시 (글자 길이 때문에 레이아웃이 넓어지지 않음)"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._full_text = ""
+        self.setTextFormat(Qt.TextFormat.PlainText)
+        # 너비는 레이아웃이 정하고 글자는 그 너비에 맞춰 줄임
+        self.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
+
+    def setFullText(self, text: str):
+        if text == self._full_text:
+            return
+        self._full_text = text
+        self._elide()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._elide()
+
+    def _elide(self):
+        elided = self.fontMetrics().elidedText(
+            self._full_text, Qt.TextElideMode.ElideMiddle, max(self.width(), 1)
+        )
+        if elided != self.text():
+            self.setText(elided)
+
+class RowListModel(QAbstractListModel):
+    """행마다 Python 객체 하나 (표시 문자열은 text_fn, 객체는 row_at으로 직접 꺼냄)
+    QListWidgetItem을 행마다 만들지 않고 목록 교체는 reset 한 번으로 끝낸다
+    """
+    def __init__(self, text_fn, parent=None):
+        super().__init__(parent)
+        self._rows: list = []
+        self._text_fn = text_fn
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        # 객체는 QVariant로 넘기지 않음 (선택 조회는 row_at → 파이썬 리스트 인덱싱)
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._text_fn(self._rows[index.row()])
+        return None
+
+    def reset(self, rows):
+        rows = list(rows)
+        # 빈 목록 → 빈 목록은 뷰 갱신 없이 끝
+        if not rows and not self._rows:
+            return
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def row_at(self, row: int):
+        return self._rows[row]
+
+    # ----- 한 행만 바뀔 때 (전체 reset 없이) -----
+    def append(self, obj):
+        n = len(self._rows)
+        self.beginInsertRows(QModelIndex(), n, n)
+        self._rows.append(obj)
+        self.endInsertRows()
+        return n
+
+    def remove_at(self, row: int):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+
+    def row_changed(self, row: int):
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx, [Qt.ItemDataRole.DisplayRole])
+
+class _SaveSignals(QObject):
+    failed = pyqtSignal(str)
+
+class SaveRunnable(QRunnable):
+    """프로젝트 스냅샷을 작업 스레드에서 json 직렬화 + 파일 쓰기"""
+    def __init__(self, snapshot: Project, path: str, signals: _SaveSignals):
+        super().__init__()
+        self._snapshot = snapshot
+        self._path = path
+        self._signals = signals
+
+    def run(self):
+        try:
+            storage.save_project_fast(self._snapshot, self._path)
+        except Exception as e:
+            # 작업 스레드에서는 UI를 건드리지 않고 시그널로만 알림
+            self._signals.failed.emit(str(e))
+
+_PRINT_ICON: QIcon | None = None
+
+def _print_icon() -> QIcon:
+    """보고서 출력 버튼 아이콘: 이모지 글리프를 한 번만 그려 모든 다이얼로그가 공유 (QApplication 이후 생성)"""
+    global _PRINT_ICON
+    if _PRINT_ICON is None:
+        pix = QPixmap(40, 40)
+        pix.fill(Qt.GlobalColor.transparent)
+        p = QPainter(pix)
+        font = QFont()
+        font.setPixelSize(28)
+        p.setFont(font)
+        p.drawText(pix.rect(), Qt.AlignmentFlag.AlignCenter, "🖨")
+        p.end()
+        _PRINT_ICON = QIcon(pix)
+    return _PRINT_ICON
+
+# 다이얼로그 전체에 한 번만 적용 (위젯별 setStyleSheet 대신 objectName 선택자)
+_PART_MANAGER_QSS = """
+    QLabel#ListTitle {
         font-size: 14px;
         font-weight: 600;
         color: #333333;
     }
-    """    
-    TEXT_ONLY_STYLE = """
-    QLabel {
+    QLabel#SectionTitle {
+        font-weight: 700;
+    }
+    QWidget#InfoBox {
+        border: 1px solid #C8C8C8;
+        border-radius: 4px;
+        background-color: #FAFAFA;
+    }
+    QLabel#InfoText {
         border: none;
         background: transparent;
         padding: 0px;
     }
-    """
+"""
+
+class PartManagerDialog(QDialog):
     def __init__(self, parent, project: Project, project_path: str):
         super().__init__(parent)
         self.setWindowTitle("파트 관리")
         self.resize(900, 600)
+        self.setStyleSheet(_PART_MANAGER_QSS)
+        # 위젯 구성/목록 채우기 동안 생기는 다시 그리기 요청은 마지막에 한 번만
+        self.setUpdatesEnabled(False)
 
         self.project = project
         self.project_path = project_path
 
+        # 연속 편집 시 저장을 한 번으로 모으기 위한 타이머
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._do_save)
+
+        # 저장 전용 스레드 1개 → 쓰기 순서가 그대로 유지되고 서로 겹치지 않음
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        self._save_signals = _SaveSignals(self)
+        self._save_signals.failed.connect(self._on_save_failed)
+        # 한 번이라도 저장했는지 → 닫은 뒤 호출 측이 새로고침 여부를 판단
+        self.saved = False
+        # 저장을 시작한 횟수 → 그 사이에 저장이 있었는지 비교용
+        self._save_count = 0
+
+        # 마지막으로 버튼에 반영한 (파트, 소분류, 점검) 선택 여부
+        self._btn_state: tuple[bool, bool, bool] | None = None
+
+        # 점검 생성/복사/수정 다이얼로그는 처음 열 때 한 번만 만들고 재사용
+        self._insp_dialog_cache: InspectionCreateDialog | None = None
+
         root = QHBoxLayout(self)
 
         # -------- Left: Part list --------
         left = QVBoxLayout()
 
-        self.part_list = QListWidget()  # 대분류
+        self.part_list = QListView()  # 대분류
+        self._part_model = RowListModel(lambda p: p.name, self)
+        self.part_list.setModel(self._part_model)
 
         # 타이틀 + 프린터 아이콘 (한 번만 생성)
         self.lbl_major_title = QLabel("대분류(동) 목록")
-        self.lbl_major_title.setStyleSheet(self.TITLE_LABEL_STYLE)
+        self.lbl_major_title.setObjectName("ListTitle")
         self.lbl_major_title.setFixedHeight(28)
 
-        self.btn_print_report = QPushButton("🖨")
+        # 이모지는 텍스트로 두면 폰트 대체 탐색/셰이핑을 매번 거치므로 미리 그린 아이콘 사용
+        self.btn_print_report = QPushButton()
+        self.btn_print_report.setIcon(_print_icon())
         self.btn_print_report.setToolTip("보고서 출력")
         self.btn_print_report.setFixedSize(28, 28)
         self.btn_print_report.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
@@ -116,10 +294,12 @@ class PartManagerDialog(QDialog):
         left.addLayout(major_title_row)
         left.addWidget(self.part_list, 1)   # 리스트는 여기 1번만
         
-        self.subpart_list = QListWidget()  # 소분류
+        self.subpart_list = QListView()  # 소분류
+        self._sub_model = RowListModel(lambda sp: sp.name, self)
+        self.subpart_list.setModel(self._sub_model)
         mid = QVBoxLayout()
         self.lbl_sub_title = QLabel("소분류(층/구간) 목록")
-        self.lbl_sub_title.setStyleSheet(self.TITLE_LABEL_STYLE)
+        self.lbl_sub_title.setObjectName("ListTitle")
         self.lbl_sub_title.setFixedHeight(28)
         mid.addWidget(self.lbl_sub_title)
         mid.addWidget(self.subpart_list, 1)
@@ -136,9 +316,13 @@ class PartManagerDialog(QDialog):
         root.addLayout(left, 2)
         root.addLayout(mid, 2)      
         
-        self.inspection_list = QListWidget()
+        self.inspection_list = QListView()
+        # 행 = (insp_id, info)
+        self._insp_model = RowListModel(lambda row: row[1]["name"], self)
+        self.inspection_list.setModel(self._insp_model)
+        self._insp_row_by_id: dict[str, int] = {}
         self.lbl_insp_title = QLabel("점검(inspection) 목록")
-        self.lbl_insp_title.setStyleSheet(self.TITLE_LABEL_STYLE)
+        self.lbl_insp_title.setObjectName("ListTitle")
 
         self.btn_add_insp = QPushButton("점검 생성")
         self.btn_copy_insp = QPushButton("점검 복사")
@@ -168,83 +352,16 @@ class PartManagerDialog(QDialog):
         right = QVBoxLayout()
 
         self.lbl_part_title = QLabel("선택 파트 정보")
-        self.lbl_part_title.setStyleSheet(self.TITLE_LABEL_STYLE)
+        self.lbl_part_title.setObjectName("ListTitle")
         right.addWidget(self.lbl_part_title)
 
-        # ===== 기본정보 섹션 =====
-        self.part_info_widget = QWidget()
-        part_info_outer = QVBoxLayout(self.part_info_widget)
-        part_info_outer.setContentsMargins(0, 0, 0, 0)
-        part_info_outer.setSpacing(6)
-
-        self.lbl_basic_title = QLabel("기본정보")
-        self.lbl_basic_title.setStyleSheet("font-weight: 700;")
-
-        # 네모 박스
-        self.part_info_box = QWidget()
-        self.part_info_box.setStyleSheet("""
-        QWidget {
-            border: 1px solid #C8C8C8;
-            border-radius: 4px;
-            background-color: #FAFAFA;
-        }
-        """)
-
-        box_layout = QVBoxLayout(self.part_info_box)
-        box_layout.setContentsMargins(8, 8, 8, 8)
-        box_layout.setSpacing(6)
-
-        self.lbl_part_major = QLabel("")
-        self.lbl_part_minor = QLabel("")
-        self.lbl_part_image = QLabel("")
-
-        self.lbl_part_major.setStyleSheet(self.TEXT_ONLY_STYLE)
-        self.lbl_part_minor.setStyleSheet(self.TEXT_ONLY_STYLE)
-        self.lbl_part_image.setStyleSheet(self.TEXT_ONLY_STYLE)
-
-        box_layout.addWidget(self.lbl_part_major)
-        box_layout.addWidget(self.lbl_part_minor)
-        box_layout.addWidget(self.lbl_part_image)
-
-        part_info_outer.addWidget(self.lbl_basic_title)
-        part_info_outer.addWidget(self.part_info_box)
-
-        right.addWidget(self.part_info_widget)
-        
-        # ===== 점검정보 섹션 =====
-        self.insp_info_widget = QWidget()
-        insp_outer = QVBoxLayout(self.insp_info_widget)
-        insp_outer.setContentsMargins(0, 0, 0, 0)
-        insp_outer.setSpacing(6)
-
-        self.lbl_insp_info_title = QLabel("점검정보")
-        self.lbl_insp_info_title.setStyleSheet("font-weight: 700;")
-
-        self.insp_info_box = QWidget()
-        self.insp_info_box.setStyleSheet("""
-        QWidget {
-            border: 1px solid #C8C8C8;
-            border-radius: 4px;
-            background-color: #FAFAFA;
-        }
-        """)
-        insp_box_layout = QVBoxLayout(self.insp_info_box)
-        insp_box_layout.setContentsMargins(8, 8, 8, 8)
-        insp_box_layout.setSpacing(6)
-
-        self.lbl_insp_name = QLabel("")
-        self.lbl_insp_start = QLabel("")
-        self.lbl_insp_end = QLabel("")
-
-        for w in (self.lbl_insp_name, self.lbl_insp_start, self.lbl_insp_end):
-            w.setStyleSheet(self.TEXT_ONLY_STYLE)
-            insp_box_layout.addWidget(w)
-
-        insp_outer.addWidget(self.lbl_insp_info_title)
-        insp_outer.addWidget(self.insp_info_box)
-        right.addWidget(self.insp_info_widget)
-
-        self.insp_info_widget.hide()        
+        # 기본정보/점검정보 섹션은 처음 표시할 때 만든다 (_ensure_*_built)
+        self._right_layout = right
+        self.part_info_widget: QWidget | None = None
+        self.insp_info_widget: QWidget | None = None
+        # 마지막으로 표시한 문구 (같은 내용이면 setText 생략)
+        self._part_info_texts: tuple = ()
+        self._insp_info_texts: tuple = ()
 
         right.addStretch(1)
 
@@ -254,23 +371,20 @@ class PartManagerDialog(QDialog):
 
         root.addLayout(right, 3)
 
-        # 초기에는 숨김
-        self.part_info_widget.hide()
-
         # signals
         self.btn_add.clicked.connect(self.add_part)
         self.btn_rename.clicked.connect(self.rename_part)
         self.btn_delete.clicked.connect(self.delete_part)
         self.btn_edit_defects.clicked.connect(self.edit_defects)
         self.btn_print_report.clicked.connect(self.export_reports)
-        self.part_list.itemSelectionChanged.connect(self._on_part_selected)
-        self.subpart_list.itemSelectionChanged.connect(self._on_subpart_selected)
+        self.part_list.selectionModel().selectionChanged.connect(self._on_part_selected)
+        self.subpart_list.selectionModel().selectionChanged.connect(self._on_subpart_selected)
 
         self.btn_add_sub.clicked.connect(self.add_subpart)
         self.btn_rename_sub.clicked.connect(self.rename_subpart)
         self.btn_delete_sub.clicked.connect(self.delete_subpart)
         
-        self.inspection_list.itemSelectionChanged.connect(self._on_inspection_selected)
+        self.inspection_list.selectionModel().selectionChanged.connect(self._on_inspection_selected)
         self.btn_add_insp.clicked.connect(self.add_inspection)
         self.btn_copy_insp.clicked.connect(self.copy_inspection)
         self.btn_edit_insp.clicked.connect(self.edit_inspection)
@@ -295,55 +409,62 @@ class PartManagerDialog(QDialog):
 
         for btn in ACTION_BTNS:
             btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-            
+
+        self.setUpdatesEnabled(True)
         QTimer.singleShot(0, self._init_focus)
 
     def _init_focus(self):
-        if self.part_list.count() > 0:
-            self.part_list.setCurrentRow(0)   # ⭐ 핵심
+        if self._part_model.rowCount() > 0:
+            self.part_list.setCurrentIndex(self._part_model.index(0))   # ⭐ 핵심
             self.part_list.setFocus()
         else:
             self.btn_add.setFocus()
         
     # ---------- helpers ----------
-    def _selected_part(self) -> Part | None:
-        items = self.part_list.selectedItems()
-        if not items:
+    @staticmethod
+    def _selected_row(view: QListView):
+        rows = view.selectionModel().selectedRows()
+        if not rows:
             return None
-        return items[0].data(Qt.ItemDataRole.UserRole)
+        return view.model().row_at(rows[0].row())
+
+    @staticmethod
+    def _selected_row_index(view: QListView) -> int:
+        rows = view.selectionModel().selectedRows()
+        return rows[0].row() if rows else -1
+
+    @staticmethod
+    def _remove_at_row(items: list, row: int, obj):
+        # 목록 모델의 행 순서 = 원본 리스트 순서 → 행 번호로 바로 삭제 (새 리스트 생성/전체 순회 없음)
+        if 0 <= row < len(items) and items[row] is obj:
+            del items[row]
+        else:
+            items[:] = [x for x in items if x.id != obj.id]
+
+    def _selected_part(self) -> Part | None:
+        return self._selected_row(self.part_list)
 
     def _selected_subpart(self) -> SubPart | None:
-        items = self.subpart_list.selectedItems()
-        if not items:
-            return None
-        return items[0].data(Qt.ItemDataRole.UserRole)
+        return self._selected_row(self.subpart_list)
     
     def _refresh_part_list(self):
-        self.part_list.clear()
-        for p in self.project.parts:
-            item = QListWidgetItem(p.name)
-            item.setData(Qt.ItemDataRole.UserRole, p)
-            self.part_list.addItem(item)
+        self._part_model.reset(self.project.parts)
 
     def _on_part_selected(self):
         part = self._selected_part()
-        self.subpart_list.clear()
-
-        # 파트 바뀌면 점검 UI도 먼저 초기화
-        self.inspection_list.clear()
-        self.insp_info_widget.hide()
-        self.btn_edit_defects.setEnabled(False)
-
-        if not part:
-            self._set_buttons()
-            return
-
-        for sp in part.subparts:
-            item = QListWidgetItem(sp.name)
-            item.setData(Qt.ItemDataRole.UserRole, sp)
-            self.subpart_list.addItem(item)
-
-        self._set_buttons()
+        # 하위 목록 교체 중 선택 변경 핸들러가 연쇄 호출되지 않도록 막고
+        # 필요한 정리는 여기서 한 번에 처리
+        with QSignalBlocker(self.subpart_list.selectionModel()), \
+                QSignalBlocker(self.inspection_list.selectionModel()):
+            # 소분류 목록은 한 번만 교체 (비웠다가 다시 채우지 않음)
+            self._sub_model.reset(part.subparts if part else [])
+            # 파트 바뀌면 점검 UI도 먼저 초기화
+            self._insp_model.reset([])
+
+        self._hide_part_info()
+        self._hide_insp_info()
+        # 하위 목록은 방금 비웠으므로 소분류/점검 선택은 없음
+        self._set_buttons(part is not None, False, False)
             
     def _on_subpart_selected(self):
         part = self._selected_part()
@@ -352,59 +473,108 @@ class PartManagerDialog(QDialog):
         if part and sub:
             self._update_part_info(part, sub)
         else:
-            self.part_info_widget.hide()
+            self._hide_part_info()
 
-        if sub:
-            self._refresh_inspection_list(sub)
-            self.insp_info_widget.hide()
-        else:
-            self.inspection_list.clear()
-            self.insp_info_widget.hide()
+        with QSignalBlocker(self.inspection_list.selectionModel()):
+            if sub:
+                self._refresh_inspection_list(sub)
+            else:
+                self._insp_model.reset([])
+        self._hide_insp_info()
 
-        self._set_buttons()
+        self._set_buttons(part is not None, sub is not None, False)
            
     def _on_inspection_selected(self):
         sp = self._selected_subpart()
         insp_id = self._selected_inspection()
 
+        has_sub = sp is not None
         if not sp or not insp_id:
-            self.insp_info_widget.hide()
-            self._set_buttons()
+            self._hide_insp_info()
+            self._set_buttons(has_sub=has_sub, has_insp=insp_id is not None)
             return
 
         info = sp.inspections.get(insp_id)
         if not info:
-            self.insp_info_widget.hide()
-            self._set_buttons()
+            self._hide_insp_info()
+            self._set_buttons(has_sub=has_sub, has_insp=True)
             return
 
-        self.lbl_insp_name.setText(f"검진명: {info.get('name','')}")
-        self.lbl_insp_start.setText(f"시작일: {info.get('start_date','')}")
-        self.lbl_insp_end.setText(f"종료일: {info.get('end_date') or '-'}")
+        self._ensure_insp_info_built()
+        texts = (
+            f"검진명: {info.get('name','')}",
+            f"시작일: {info.get('start_date','')}",
+            f"종료일: {info.get('end_date') or '-'}",
+        )
+        if texts != self._insp_info_texts:
+            self._insp_info_texts = texts
+            self._set_label_texts((self.lbl_insp_name, self.lbl_insp_start, self.lbl_insp_end), texts)
 
         self.insp_info_widget.show()
-        self._set_buttons()
+        self._set_buttons(has_sub=has_sub, has_insp=True)
            
-    def _set_buttons(self):
-        has_part = self._selected_part() is not None
-        has_sub = self._selected_subpart() is not None
-        has_insp = self._selected_inspection() is not None
+    def _set_buttons(self, has_part: bool | None = None,
+                     has_sub: bool | None = None, has_insp: bool | None = None):
+        # 선택 핸들러가 이미 구한 값은 넘겨받고, 모르는 것만 다시 조회
+        if has_part is None:
+            has_part = self._selected_part() is not None
+        if has_sub is None:
+            has_sub = self._selected_subpart() is not None
+        if has_insp is None:
+            has_insp = self._selected_inspection() is not None
+
+        # 선택 상태가 그대로면 버튼도 그대로 → 바뀐 묶음만 반영
+        state = (has_part, has_sub, has_sub and has_insp)
+        prev = self._btn_state
+        if state == prev:
+            return
+        self._btn_state = state
 
-        self.btn_rename.setEnabled(has_part)
-        self.btn_delete.setEnabled(has_part)
+        if prev is None or prev[0] != state[0]:
+            self.btn_rename.setEnabled(has_part)
+            self.btn_delete.setEnabled(has_part)
 
-        self.btn_rename_sub.setEnabled(has_sub)
-        self.btn_delete_sub.setEnabled(has_sub)
+        if prev is None or prev[1] != state[1]:
+            self.btn_rename_sub.setEnabled(has_sub)
+            self.btn_delete_sub.setEnabled(has_sub)
+            self.btn_add_insp.setEnabled(has_sub)
 
-        self.btn_add_insp.setEnabled(has_sub)
-        self.btn_copy_insp.setEnabled(has_sub and has_insp)
-        self.btn_edit_insp.setEnabled(has_sub and has_insp)
-        self.btn_delete_insp.setEnabled(has_sub and has_insp)
-        
-        self.btn_edit_defects.setEnabled(has_sub and has_insp)
+        if prev is None or prev[2] != state[2]:
+            self.btn_copy_insp.setEnabled(state[2])
+            self.btn_edit_insp.setEnabled(state[2])
+            self.btn_delete_insp.setEnabled(state[2])
+            self.btn_edit_defects.setEnabled(state[2])
 
     def _save_project(self):
-        storage.save_project(self.project, self.project_path)
+        # 편집마다 바로 쓰지 않고 250ms 동안 들어온 변경을 모아서 한 번 저장
+        self._save_timer.start()
+
+    def _do_save(self):
+        self._save_timer.stop()
+        self.saved = True
+        self._save_count += 1
+        # to_dict는 inspections를 복사하지 않으므로 작업 스레드에는 통째 복사본을 넘김
+        # (pickle 왕복은 C 구현이라 json 직렬화보다 훨씬 빠름)
+        snapshot = pickle.loads(
+            pickle.dumps(self.project, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+        self._save_pool.start(
+            SaveRunnable(snapshot, self.project_path, self._save_signals)
+        )
+
+    def _flush_save(self):
+        # 대기 중인 저장을 바로 시작하고 파일 쓰기가 끝날 때까지 기다림
+        if self._save_timer.isActive():
+            self._do_save()
+        self._save_pool.waitForDone()
+
+    def _on_save_failed(self, msg: str):
+        QMessageBox.warning(self, "저장 실패", f"프로젝트를 저장하지 못했습니다.\n{msg}")
+
+    def done(self, result):
+        # 닫기(X)/Esc/accept 모두 done()을 거치므로 여기서 남은 저장을 마무리
+        self._flush_save()
+        super().done(result)
 
     # ---------- actions ----------
     def add_part(self):
@@ -419,7 +589,7 @@ class PartManagerDialog(QDialog):
         )
         self.project.parts.append(part)
         self._save_project()
-        self._refresh_part_list()
+        self._part_model.append(part)
 
     def rename_part(self):
         p = self._selected_part()
@@ -434,7 +604,10 @@ class PartManagerDialog(QDialog):
 
         p.name = name.strip()
         self._save_project()
-        self._refresh_part_list()
+        self._part_model.row_changed(self._selected_row_index(self.part_list))
+        sub = self._selected_subpart()
+        if sub:
+            self._update_part_info(p, sub)
 
     def delete_part(self):
         p = self._selected_part()
@@ -449,11 +622,12 @@ class PartManagerDialog(QDialog):
         if ok != QMessageBox.StandardButton.Yes:
             return
 
-        self.project.parts = [x for x in self.project.parts if x.id != p.id]
+        row = self._selected_row_index(self.part_list)
+        self._remove_at_row(self.project.parts, row, p)
         self._save_project()
-        self._refresh_part_list()
-        self.subpart_list.clear()
-        self.btn_edit_defects.setEnabled(False)
+        # 선택 해제 → selectionChanged → _on_part_selected 가 하위 목록 정리
+        self.part_list.clearSelection()
+        self._part_model.remove_at(row)
 
     def add_subpart(self):
         part = self._selected_part()
@@ -465,6 +639,20 @@ class PartManagerDialog(QDialog):
         if not ok or not name.strip():
             return
 
+        sub = SubPart(
+            id=new_id("subpart"),
+            name=name.strip(),
+            image_path="",
+            inspections={}
+        )
+
+        # 목록에 먼저 보여주고, (느린) 파일 선택 창은 다음 이벤트 루프에서 연다
+        part.subparts.append(sub)
+        self._sub_model.append(sub)   # 소분류 리스트 갱신 (한 행만 추가)
+        saves_before = self._save_count
+        QTimer.singleShot(0, lambda: self._pick_image_for(part, sub, saves_before))
+
+    def _pick_image_for(self, part: Part, sub: SubPart, saves_before: int):
         image_path, _ = QFileDialog.getOpenFileName(
             self,
             "도면 이미지 선택",
@@ -472,19 +660,21 @@ class PartManagerDialog(QDialog):
             "Images (*.png *.jpg *.jpeg)"
         )
         if not image_path:
+            # 도면 없는 소분류는 만들지 않음 → 임시로 넣은 행 제거
+            if sub in part.subparts:
+                part.subparts.remove(sub)
+            for row in range(self._sub_model.rowCount()):
+                if self._sub_model.row_at(row) is sub:
+                    self._sub_model.remove_at(row)
+                    break
+            # 임시 행을 넣은 뒤 저장이 돌았으면 파일에도 들어갔으므로 다시 저장 (아니면 파일은 그대로)
+            if self._save_count != saves_before:
+                self._save_project()
             return
 
-        sub = SubPart(
-            id=new_id("subpart"),
-            name=name.strip(),
-            image_path=image_path,
-            inspections={}
-        )
-
-        part.subparts.append(sub)
+        sub.image_path = image_path
         self._save_project()
-        self._on_part_selected()   # 소분류 리스트 갱신
-        
+
     def rename_subpart(self):
         sp = self._selected_subpart()
         if not sp:
@@ -501,7 +691,10 @@ class PartManagerDialog(QDialog):
 
         sp.name = name.strip()
         self._save_project()
-        self._on_part_selected()
+        self._sub_model.row_changed(self._selected_row_index(self.subpart_list))
+        part = self._selected_part()
+        if part:
+            self._update_part_info(part, sp)
         
     def delete_subpart(self):
         part = self._selected_part()
@@ -518,30 +711,135 @@ class PartManagerDialog(QDialog):
         if ok != QMessageBox.StandardButton.Yes:
             return
 
-        part.subparts = [x for x in part.subparts if x.id != sp.id]
+        row = self._selected_row_index(self.subpart_list)
+        self._remove_at_row(part.subparts, row, sp)
         self._save_project()      
-        self._on_part_selected()
+        # 선택 해제 → selectionChanged → _on_subpart_selected 가 점검 목록 정리
+        self.subpart_list.clearSelection()
+        self._sub_model.remove_at(row)
         self._set_buttons()
         
+    # ---------- 오른쪽 정보 섹션 (지연 생성) ----------
+    def _ensure_part_info_built(self):
+        if self.part_info_widget is not None:
+            return
+        self.part_info_widget = QWidget()
+        part_info_outer = QVBoxLayout(self.part_info_widget)
+        part_info_outer.setContentsMargins(0, 0, 0, 0)
+        part_info_outer.setSpacing(6)
+
+        self.lbl_basic_title = QLabel("기본정보")
+        self.lbl_basic_title.setObjectName("SectionTitle")
+
+        # 네모 박스
+        self.part_info_box = QWidget()
+        self.part_info_box.setObjectName("InfoBox")
+        self.part_info_box.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+
+        box_layout = QVBoxLayout(self.part_info_box)
+        box_layout.setContentsMargins(8, 8, 8, 8)
+        box_layout.setSpacing(6)
+
+        self.lbl_part_major = self._add_info_label(box_layout)
+        self.lbl_part_minor = self._add_info_label(box_layout)
+        self.lbl_part_image = self._add_info_label(box_layout, ElidedLabel)
+
+        part_info_outer.addWidget(self.lbl_basic_title)
+        part_info_outer.addWidget(self.part_info_box)
+
+        # 제목 바로 아래 (점검정보보다 위)
+        self._right_layout.insertWidget(1, self.part_info_widget)
+
+    def _ensure_insp_info_built(self):
+        if self.insp_info_widget is not None:
+            return
+        self.insp_info_widget = QWidget()
+        insp_outer = QVBoxLayout(self.insp_info_widget)
+        insp_outer.setContentsMargins(0, 0, 0, 0)
+        insp_outer.setSpacing(6)
+
+        self.lbl_insp_info_title = QLabel("점검정보")
+        self.lbl_insp_info_title.setObjectName("SectionTitle")
+
+        self.insp_info_box = QWidget()
+        self.insp_info_box.setObjectName("InfoBox")
+        self.insp_info_box.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        insp_box_layout = QVBoxLayout(self.insp_info_box)
+        insp_box_layout.setContentsMargins(8, 8, 8, 8)
+        insp_box_layout.setSpacing(6)
+
+        self.lbl_insp_name = self._add_info_label(insp_box_layout)
+        self.lbl_insp_start = self._add_info_label(insp_box_layout)
+        self.lbl_insp_end = self._add_info_label(insp_box_layout)
+
+        insp_outer.addWidget(self.lbl_insp_info_title)
+        insp_outer.addWidget(self.insp_info_box)
+
+        # 기본정보 섹션 아래
+        pos = 2 if self.part_info_widget is not None else 1
+        self._right_layout.insertWidget(pos, self.insp_info_widget)
+
+    @staticmethod
+    def _add_info_label(layout, cls=QLabel) -> QLabel:
+        # 스타일은 다이얼로그 스타일시트의 QLabel#InfoText 한 곳에서 적용
+        lbl = cls()
+        lbl.setObjectName("InfoText")
+        # 사용자 입력 문자열 → 서식 문자열 여부 판별 생략
+        lbl.setTextFormat(Qt.TextFormat.PlainText)
+        layout.addWidget(lbl)
+        return lbl
+
+    def _hide_part_info(self):
+        if self.part_info_widget is not None:
+            self.part_info_widget.hide()
+
+    def _hide_insp_info(self):
+        if self.insp_info_widget is not None:
+            self.insp_info_widget.hide()
+
+    @staticmethod
+    def _set_label_texts(labels, texts):
+        # 바뀐 라벨만 setText (레이아웃 재계산/텍스트 배치 최소화)
+        for lbl, text in zip(labels, texts):
+            if lbl.text() != text:
+                lbl.setText(text)
+
     def _update_part_info(self, part: Part, subpart: SubPart):
-        self.lbl_part_major.setText(f"대분류: {part.name}")
-        self.lbl_part_minor.setText(f"소분류: {subpart.name}")
-        self.lbl_part_image.setText(f"도면: {subpart.image_path}")
+        self._ensure_part_info_built()
+        texts = (
+            f"대분류: {part.name}",
+            f"소분류: {subpart.name}",
+            f"도면: {subpart.image_path}",
+        )
+        if texts != self._part_info_texts:
+            self._part_info_texts = texts
+            self._set_label_texts((self.lbl_part_major, self.lbl_part_minor), texts[:2])
+            # 도면 경로는 줄여서 표시하고 전체 경로는 툴팁으로
+            self.lbl_part_image.setFullText(texts[2])
+            self.lbl_part_image.setToolTip(subpart.image_path)
 
         self.part_info_widget.show()
         
+    def _get_insp_dialog(self, title: str, default_name: str = "",
+                         start: QDate | None = None, end: QDate | None = None) -> InspectionCreateDialog:
+        if self._insp_dialog_cache is None:
+            self._insp_dialog_cache = InspectionCreateDialog(self)
+        dlg = self._insp_dialog_cache
+        dlg.reset(title, default_name, start, end)
+        return dlg
+
     def _selected_inspection(self) -> str | None:
-        items = self.inspection_list.selectedItems()
-        if not items:
+        row = self._selected_row(self.inspection_list)
+        if row is None:
             return None
-        return items[0].data(Qt.ItemDataRole.UserRole)
+        return row[0]
         
     def add_inspection(self):
         sp = self._selected_subpart()
         if not sp:
             return
 
-        dlg = InspectionCreateDialog(self, title="점검 생성")
+        dlg = self._get_insp_dialog("점검 생성")
         if dlg.exec() != QDialog.DialogCode.Accepted:
             return
 
@@ -559,13 +857,10 @@ class PartManagerDialog(QDialog):
         }
 
         self._save_project()
-        self._refresh_inspection_list(sp)
+        self._append_inspection_row(insp_id, sp.inspections[insp_id])
 
         # 생성된 점검 자동 선택
-        for i in range(self.inspection_list.count()):
-            if self.inspection_list.item(i).data(Qt.ItemDataRole.UserRole) == insp_id:
-                self.inspection_list.setCurrentRow(i)
-                break
+        self._select_inspection(insp_id)
         
     def copy_inspection(self):
         sp = self._selected_subpart()
@@ -573,7 +868,7 @@ class PartManagerDialog(QDialog):
         if not sp or not src:
             return
 
-        dlg = InspectionCreateDialog(self, title="점검 복사(신규 생성)")
+        dlg = self._get_insp_dialog("점검 복사(신규 생성)")
         if dlg.exec() != QDialog.DialogCode.Accepted:
             return
 
@@ -587,16 +882,15 @@ class PartManagerDialog(QDialog):
             "name": data["name"],
             "start_date": data["start_date"],
             "end_date": data["end_date"],
-            "defects": dict(sp.inspections[src].get("defects", {}))
+            # 하자 편집기는 defects를 제자리 수정하지 않고 저장 시 통째로 교체(on_save)
+            # → 처음 편집할 때까지 원본과 같은 객체를 공유 (copy-on-write)
+            "defects": sp.inspections[src].get("defects", {})
         }
 
         self._save_project()
-        self._refresh_inspection_list(sp)
+        self._append_inspection_row(new_id_, sp.inspections[new_id_])
 
-        for i in range(self.inspection_list.count()):
-            if self.inspection_list.item(i).data(Qt.ItemDataRole.UserRole) == new_id_:
-                self.inspection_list.setCurrentRow(i)
-                break
+        self._select_inspection(new_id_)
     def edit_inspection(self):
         sp = self._selected_subpart()
         insp_id = self._selected_inspection()
@@ -607,18 +901,13 @@ class PartManagerDialog(QDialog):
         if not info:
             return
 
-        dlg = InspectionCreateDialog(
-            self,
-            title="점검 수정",
-            default_name=info.get("name", "")
+        dlg = self._get_insp_dialog(
+            "점검 수정",
+            default_name=info.get("name", ""),
+            start=_str_to_qdate(info.get("start_date")),
+            end=_str_to_qdate(info.get("end_date"))
         )
 
-        dlg.start_date.setDate(QDate.fromString(info["start_date"], "yyyy-MM-dd"))
-
-        if info.get("end_date"):
-            dlg.end_enabled.setChecked(True)
-            dlg.end_date.setDate(QDate.fromString(info["end_date"], "yyyy-MM-dd"))
-
         if dlg.exec() != QDialog.DialogCode.Accepted:
             return
 
@@ -632,13 +921,12 @@ class PartManagerDialog(QDialog):
         info["end_date"] = data["end_date"]
 
         self._save_project()
-        self._refresh_inspection_list(sp)
 
-        # 수정 후 다시 선택 유지
-        for i in range(self.inspection_list.count()):
-            if self.inspection_list.item(i).data(Qt.ItemDataRole.UserRole) == insp_id:
-                self.inspection_list.setCurrentRow(i)
-                break
+        # 같은 행의 이름만 갱신 (선택은 그대로 유지) + 점검정보 표시 갱신
+        row = self._insp_row_by_id.get(insp_id)
+        if row is not None:
+            self._insp_model.row_changed(row)
+        self._on_inspection_selected()
                 
     def delete_inspection(self):
         sp = self._selected_subpart()
@@ -664,11 +952,17 @@ class PartManagerDialog(QDialog):
         del sp.inspections[insp_id]
 
         self._save_project()
-        self._refresh_inspection_list(sp)
-        self.insp_info_widget.hide()
-
-        if self.inspection_list.count() > 0:
-            self.inspection_list.setCurrentRow(0)
+        row = self._insp_row_by_id.get(insp_id)
+        with QSignalBlocker(self.inspection_list.selectionModel()):
+            if row is None:
+                self._refresh_inspection_list(sp)
+            else:
+                self._insp_model.remove_at(row)
+                self._insp_row_by_id = {k: i for i, k in enumerate(sp.inspections)}
+        self._hide_insp_info()
+
+        if self._insp_model.rowCount() > 0:
+            self.inspection_list.setCurrentIndex(self._insp_model.index(0))
 
         self._set_buttons()
         
@@ -686,6 +980,9 @@ class PartManagerDialog(QDialog):
 
         defects = sp.inspections[insp].get("defects", {})
 
+        # 편집기 모듈은 실제로 열 때만 로드 (보고서 출력과 같은 방식)
+        from fault_editor import FaultEditorDialog
+
         dlg = FaultEditorDialog(
             image_path=sp.image_path,
             defects=defects,
@@ -693,6 +990,7 @@ class PartManagerDialog(QDialog):
         )
 
         def on_save(new_defects):
+            # 복사된 점검과 공유 중일 수 있으므로 기존 dict를 고치지 말고 항상 새 dict로 교체
             sp.inspections[insp]["defects"] = new_defects
             self._save_project()
 
@@ -700,12 +998,18 @@ class PartManagerDialog(QDialog):
         dlg.exec()
                 
     def _refresh_inspection_list(self, sp: SubPart):
-        self.inspection_list.clear()
-        
-        for insp_id, info in sp.inspections.items():
-            item = QListWidgetItem(info["name"])
-            item.setData(Qt.ItemDataRole.UserRole, insp_id)
-            self.inspection_list.addItem(item)
+        self._insp_model.reset(sp.inspections.items())
+        # 생성/수정 직후 다시 선택할 행을 목록 순회 없이 찾기 위한 색인
+        self._insp_row_by_id = {insp_id: i for i, insp_id in enumerate(sp.inspections)}
+
+    def _append_inspection_row(self, insp_id: str, info: dict):
+        # 새 점검은 dict 끝에 추가되므로 목록 끝에 한 행만 추가
+        self._insp_row_by_id[insp_id] = self._insp_model.append((insp_id, info))
+
+    def _select_inspection(self, insp_id: str):
+        row = self._insp_row_by_id.get(insp_id)
+        if row is not None and row < self._insp_model.rowCount():
+            self.inspection_list.setCurrentIndex(self._insp_model.index(row))
 
     def export_reports(self):
         part = self._selected_part()
@@ -719,16 +1023,12 @@ class PartManagerDialog(QDialog):
             )
             return
 
-        from report_exporter_hwpx import ReportExporter
+        # 보고서는 디스크의 프로젝트를 기준으로 하므로 대기 중인 저장을 먼저 반영
+        self._flush_save()
 
-        exporter = ReportExporter(
-            project=self.project,
-            part=part,
-            subpart=sub,
-            project_path=self.project_path
-        )
+        from report_exporter_hwpx import export_all
 
-        exporter.export_visual_inspection()
-        exporter.export_defect_drawing()
+        # 두 보고서를 동시에 생성
+        export_all(self.project, [(part, sub)], self.project_path)
 
         QMessageBox.information(self, "완료", "보고서가 생성되었습니다.")
@@ -1,19 +1,20 @@
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QListWidget, QListWidgetItem, QPushButton, QLabel, QMessageBox,
+    QListView, QPushButton, QLabel, QMessageBox,
     QDialog, QFormLayout, QLineEdit, QTextEdit, QFileDialog
 )
 
 from models import Project
 import storage
 
-from part_manager import PartManagerDialog
+from part_manager import PartManagerDialog, RowListModel
 
 APP_DIR = Path.home() / ".fault_app"
 INDEX_PATH = str(APP_DIR / "projects_index.json")
@@ -81,8 +82,17 @@ class ProjectManagerWindow(QMainWindow):
         self.setWindowTitle("프로젝트 관리")
         self.resize(900, 600)
 
-        self.index = storage.load_index(INDEX_PATH)  # id -> file path
-        self.projects: dict[str, Project] = {}       # id -> Project (lazy load)
+        self.index = storage.load_index(INDEX_PATH)  # id -> {"path", "name"}
+        # id -> (파일 mtime_ns, Project) (lazy load, 파일이 바뀌었으면 다시 읽음)
+        self.projects: dict[str, tuple[int | None, Project]] = {}
+        self._pid_to_row: dict[str, int] = {}        # id -> 목록 행 (_refresh_list에서 채움)
+
+        # 인덱스 저장은 연속 변경을 모아 한 번에 (종료 시에는 즉시 기록)
+        self._index_dirty = False
+        self._index_save_timer = QTimer(self)
+        self._index_save_timer.setSingleShot(True)
+        self._index_save_timer.setInterval(200)
+        self._index_save_timer.timeout.connect(self._flush_index)
 
         root = QWidget()
         self.setCentralWidget(root)
@@ -90,8 +100,13 @@ class ProjectManagerWindow(QMainWindow):
 
         # 왼쪽: 리스트
         left = QVBoxLayout()
-        self.listw = QListWidget()
-        self.listw.itemSelectionChanged.connect(self._on_select)
+        # 행 = 프로젝트 id, 표시 이름은 인덱스에서 바로 조회 (이름 변경 시 해당 행만 갱신)
+        self.listw = QListView()
+        self._list_model = RowListModel(
+            lambda pid: self._list_title(self.index[pid].get("name")), self
+        )
+        self.listw.setModel(self._list_model)
+        self.listw.selectionModel().selectionChanged.connect(self._on_select)
         self.lbl_project_list_title = QLabel("프로젝트 목록")
         self.lbl_project_list_title.setStyleSheet(self.TITLE_LABEL_STYLE)
         left.addWidget(self.lbl_project_list_title)
@@ -223,36 +238,93 @@ class ProjectManagerWindow(QMainWindow):
 
     # ---------- helpers ----------
     def _selected_project_id(self) -> str | None:
-        items = self.listw.selectedItems()
-        if not items:
+        rows = self.listw.selectionModel().selectedRows()
+        if not rows:
+            return None
+        return self._list_model.row_at(rows[0].row())
+
+    def _project_path(self, pid: str) -> str:
+        entry = self.index.get(pid)
+        return entry["path"] if entry else ""
+
+    def _set_index_entry(self, pid: str, path: str, proj: Project):
+        # 목록은 인덱스의 이름만으로 그리므로 저장할 때마다 이름도 함께 갱신
+        self.index[pid] = {"path": path, "name": proj.building.name}
+
+    @staticmethod
+    def _file_mtime(path: str) -> int | None:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
             return None
-        return items[0].data(Qt.ItemDataRole.UserRole)
+
+    def _cache_project(self, pid: str, proj: Project):
+        # 방금 저장했거나 메모리에서 최신인 객체 → 현재 파일 mtime과 함께 보관
+        self.projects[pid] = (self._file_mtime(self._project_path(pid)), proj)
 
     def _load_project_if_needed(self, pid: str) -> Project | None:
-        if pid in self.projects:
-            return self.projects[pid]
-        path = self.index.get(pid)
+        path = self._project_path(pid)
+        cached = self.projects.get(pid)
+        mtime = self._file_mtime(path) if path else None
+        # 파일이 그대로면(또는 파일이 없어졌으면) 캐시 사용, 밖에서 고쳐졌으면 다시 읽음
+        if cached and (mtime is None or cached[0] == mtime):
+            return cached[1]
         if not path:
             return None
         try:
             proj = storage.load_project(path)
-            self.projects[pid] = proj
+            self.projects[pid] = (mtime, proj)
             return proj
         except Exception as e:
             QMessageBox.critical(self, "로드 실패", f"프로젝트 파일을 읽지 못했습니다.\n{path}\n\n{e}")
             return None
 
+    def _schedule_index_save(self):
+        self._index_dirty = True
+        self._index_save_timer.start()
+
+    def _flush_index(self):
+        self._index_save_timer.stop()
+        if not self._index_dirty:
+            return
+        self._index_dirty = False
+        storage.save_index(self.index, INDEX_PATH)
+
+    def closeEvent(self, event):
+        self._flush_index()
+        super().closeEvent(event)
+
     def _default_project_path(self, pid: str) -> str:
         return str(APP_DIR / f"{pid}.json")
 
+    @staticmethod
+    def _list_title(name: str | None) -> str:
+        return name or "(이름 없음)"
+
     def _refresh_list(self):
-        self.listw.clear()
-        for pid, path in self.index.items():
-            proj = self._load_project_if_needed(pid)
-            title = proj.building.name if proj and proj.building.name else "(이름 없음)"
-            item = QListWidgetItem(title)
-            item.setData(Qt.ItemDataRole.UserRole, pid)
-            self.listw.addItem(item)
+        # 프로젝트 파일은 읽지 않고 인덱스에 저장된 이름으로 목록 구성 (전체 로드는 선택 시)
+        migrated = False
+        for pid, entry in self.index.items():
+            if entry.get("name") is None:
+                # 구버전 인덱스: 이름이 없으므로 이번 한 번만 파일을 읽어 채움
+                proj = self._load_project_if_needed(pid)
+                if proj:
+                    entry["name"] = proj.building.name
+                    migrated = True
+        if migrated:
+            self._schedule_index_save()
+
+        # 행 N개를 하나씩 추가하지 않고 모델 reset 한 번으로 교체
+        pids = list(self.index)
+        self._list_model.reset(pids)
+        self._pid_to_row = {pid: row for row, pid in enumerate(pids)}
+        # reset은 선택 변경 시그널 없이 선택을 지우므로 정보 영역/버튼을 직접 맞춤
+        self._on_select()
+
+    def _select_project(self, pid: str):
+        row = self._pid_to_row.get(pid)
+        if row is not None:
+            self.listw.setCurrentIndex(self._list_model.index(row))
 
     def _on_select(self):
         pid = self._selected_project_id()
@@ -308,16 +380,13 @@ class ProjectManagerWindow(QMainWindow):
         path = self._default_project_path(proj.id)
         storage.save_project(proj, path)
 
-        self.index[proj.id] = path
-        storage.save_index(self.index, INDEX_PATH)
-        self.projects[proj.id] = proj
+        self._set_index_entry(proj.id, path, proj)
+        self._schedule_index_save()
+        self._cache_project(proj.id, proj)
 
         self._refresh_list()
         # 방금 생성한 것 선택
-        for i in range(self.listw.count()):
-            if self.listw.item(i).data(Qt.ItemDataRole.UserRole) == proj.id:
-                self.listw.setCurrentRow(i)
-                break
+        self._select_project(proj.id)
 
     def edit_project(self):
         pid = self._selected_project_id()
@@ -332,15 +401,22 @@ class ProjectManagerWindow(QMainWindow):
             return
 
         proj = dlg.project()
-        storage.save_project(proj, self.index[pid])
-        self.projects[pid] = proj
+        path = self._project_path(pid)
+        storage.save_project(proj, path)
+        self._cache_project(pid, proj)
+        if self.index[pid].get("name") != proj.building.name:
+            self._set_index_entry(pid, path, proj)
+            self._schedule_index_save()
+            row = self._pid_to_row.get(pid)
+            if row is not None:
+                self._list_model.row_changed(row)
         self._show_project(pid)
 
     def delete_project(self):
         pid = self._selected_project_id()
         if not pid:
             return
-        path = self.index.get(pid, "")
+        path = self._project_path(pid)
 
         ok = QMessageBox.question(
             self, "삭제 확인",
@@ -350,16 +426,16 @@ class ProjectManagerWindow(QMainWindow):
         if ok != QMessageBox.StandardButton.Yes:
             return
 
-        # 파일 삭제 시도
+        # 파일 삭제 시도 (없으면 그냥 넘어감 → 존재 확인 없이 한 번에)
         try:
-            if path and Path(path).exists():
-                Path(path).unlink()
+            if path:
+                Path(path).unlink(missing_ok=True)
         except Exception:
             pass
 
         self.index.pop(pid, None)
         self.projects.pop(pid, None)
-        storage.save_index(self.index, INDEX_PATH)
+        self._schedule_index_save()
 
         self._refresh_list()
         self._show_project(None)
@@ -376,9 +452,9 @@ class ProjectManagerWindow(QMainWindow):
             return
 
         # 인덱스에 등록 (원본 경로 그대로 사용)
-        self.index[proj.id] = path
-        self.projects[proj.id] = proj
-        storage.save_index(self.index, INDEX_PATH)
+        self._set_index_entry(proj.id, path, proj)
+        self._cache_project(proj.id, proj)
+        self._schedule_index_save()
         self._refresh_list()
 
     def export_project_as(self):
@@ -404,11 +480,16 @@ class ProjectManagerWindow(QMainWindow):
         dlg = PartManagerDialog(
             self,
             project=proj,
-            project_path=self.index[pid]
+            project_path=self._project_path(pid)
         )
         dlg.exec()
 
+        # 편집은 닫는 방식(확인/취소)과 상관없이 자동 저장되므로
+        # 결과 코드 대신 실제 저장 여부로 판단 → 바뀐 게 없으면 그대로 둠
+        if not dlg.saved:
+            return
+
         # Part Manager에서 변경된 내용 반영
-        self.projects[pid] = proj
+        self._cache_project(pid, proj)
         self._show_project(pid)
         
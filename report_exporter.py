@@ -1,8 +1,14 @@
 import win32com.client
-import win32clipboard
 import os
+import atexit
+import threading
+from contextlib import contextmanager
 
 class ReportExporter:
+    # 한글 프로세스 기동이 수 초 걸리므로 한 번 띄운 인스턴스를 모든 출력에서 재사용
+    _hwp = None
+    _hwp_lock = threading.Lock()   # 인스턴스 하나를 동시에 두 출력이 쓰지 않도록
+
     def __init__(self, project, part, subpart, project_path):
         self.project = project
         self.part = part
@@ -28,13 +34,47 @@ class ReportExporter:
         hwp.HAction.Run("FileNew")
         return hwp
 
-    def _insert_text(self, hwp, text: str):
-        win32clipboard.OpenClipboard()
-        win32clipboard.EmptyClipboard()
-        win32clipboard.SetClipboardText(text)
-        win32clipboard.CloseClipboard()
+    @contextmanager
+    def _hwp_session(self):
+        """공유 한글 인스턴스를 빌려 쓰고, 끝나면 문서만 비움 (프로세스는 유지)"""
+        cls = ReportExporter
+        with cls._hwp_lock:
+            if cls._hwp is None:
+                cls._hwp = self._create_hwp()
+                atexit.register(cls.shutdown)
+            hwp = cls._hwp
+            try:
+                yield hwp
+            finally:
+                try:
+                    # 저장 여부 묻지 않고 현재 문서를 비움 → 다음 출력은 빈 문서에서 시작
+                    hwp.Clear(1)
+                except Exception:
+                    # 한글이 닫혔거나 COM 연결이 끊어진 경우 → 다음 출력에서 새로 띄움
+                    cls._hwp = None
+
+    @classmethod
+    def shutdown(cls):
+        # 앱 종료 시 한 번만 한글 프로세스 종료
+        with cls._hwp_lock:
+            hwp, cls._hwp = cls._hwp, None
+        if hwp is not None:
+            try:
+                hwp.Quit()
+            except Exception:
+                pass
 
-        hwp.HAction.Run("Paste")
+    def _insert_text(self, hwp, text: str):
+        # 클립보드를 거치지 않고 InsertText 액션으로 직접 입력 (사용자 클립보드 보존)
+        # 줄바꿈은 InsertText로 넣지 않고 문단 나누기(BreakPara)로 처리
+        ins = hwp.HParameterSet.HInsertText
+        for i, line in enumerate(text.split("\n")):
+            if i:
+                hwp.HAction.Run("BreakPara")
+            if line:
+                hwp.HAction.GetDefault("InsertText", ins.HSet)
+                ins.Text = line
+                hwp.HAction.Execute("InsertText", ins.HSet)
         
     def _save_hwp(self, hwp, path: str):
         ps = hwp.CreateSet("HFileSaveAs")
@@ -49,9 +89,7 @@ class ReportExporter:
             pass
     
     def export_visual_inspection(self):
-        hwp = self._create_hwp()
-
-        try:
+        with self._hwp_session() as hwp:
             hwp.HAction.Run("MoveDocBegin")
             self._insert_text(hwp, "육안조사활동현황\n")
 
@@ -62,13 +100,8 @@ class ReportExporter:
 
             self._save_hwp(hwp, path)
 
-        finally:
-            hwp.Quit()
-
     def export_defect_drawing(self):
-        hwp = self._create_hwp()
-
-        try:
+        with self._hwp_session() as hwp:
             hwp.HAction.Run("MoveDocBegin")
             self._insert_text(hwp, "하자도면\n")
             self._write_defect_drawings(hwp)
@@ -80,9 +113,6 @@ class ReportExporter:
 
             self._save_hwp(hwp, path)
 
-        finally:
-            hwp.Quit()
-
     def _write_visual_table(self, hwp):
         ps = hwp.CreateSet("HTableCreation")
         ps.SetItem("Rows", 12)
@@ -94,8 +124,9 @@ class ReportExporter:
             "폭(mm)","길이(m)","개수","진행","비고"
         ]
 
-        for i, text in enumerate(headers):
-            hwp.PutFieldText(f"A1{i+1}", text)
+        # PutFieldText는 필드 이름/값을 \x02 로 이어 붙이면 한 번의 호출로 여러 필드를 채움
+        fields = "\x02".join(f"A1{i+1}" for i in range(len(headers)))
+        hwp.PutFieldText(fields, "\x02".join(headers))
 
     def _write_defect_drawings(self, hwp):
         hwp.HAction.Run("MoveDocBegin")
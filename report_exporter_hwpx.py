@@ -31,7 +31,9 @@ report_exporter.py (HWP -> HWPX)
 
 현재 구현은:
 - 템플릿 zip(hwpx) 열기
-- Contents/section0.xml 내부의 텍스트 노드에서 플레이스홀더를 찾아 치환
+- Contents/section0.xml 에서 플레이스홀더를 바이트 그대로 치환
+  (XML 파싱/재직렬화를 하지 않으므로 네임스페이스 접두어·선언이 원본 그대로 유지됨
+   → 한컴오피스에서 열리지 않는 문제 방지. 값은 XML 이스케이프 후 삽입)
 - 새 hwpx로 저장
 
 다음 단계(원하시면 이어서 구현):
@@ -41,12 +43,17 @@ report_exporter.py (HWP -> HWPX)
 
 from __future__ import annotations
 
+import io
 import os
+import re
 import json
+import shutil
 import zipfile
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
-from xml.etree import ElementTree as ET
+from xml.sax.saxutils import escape as _sax_escape
 
 from models import SubPart, Part, Project  # fileciteturn0file1L1-L38
 
@@ -77,15 +84,22 @@ def _pick_inspection_key(sub: SubPart) -> Optional[str]:
     if not sub.inspections:
         return None
 
-    items = list(sub.inspections.items())
-
     def sort_key(kv):
         _k, v = kv
         # 날짜 문자열 "yyyy-mm-dd" 형태면 그대로 비교 가능
         return v.get("start_date") or "", _k
 
-    items.sort(key=sort_key)
-    return items[-1][0]
+    # 마지막 하나만 필요 → 전체 정렬 대신 한 번 훑기
+    return max(sub.inspections.items(), key=sort_key)[0]
+
+
+def _lookup(d: Dict[str, Any], keys: Tuple[str, ...], default: Any) -> Any:
+    # 앞의 키가 있으면 (빈 값이어도) 그 값 → d.get(k1, d.get(k2, default)) 와 같은 우선순위,
+    # 다만 뒤 후보는 필요할 때만 조회
+    for k in keys:
+        if k in d:
+            return d[k]
+    return default
 
 
 def _extract_defect_rows(defects: Dict[str, Any]) -> List[DefectRow]:
@@ -93,31 +107,22 @@ def _extract_defect_rows(defects: Dict[str, Any]) -> List[DefectRow]:
 
     # defects 는 {id: {...}} 형태를 기대 (FaultEditorDialog가 저장)
     # 키 이름은 프로젝트마다 다를 수 있으므로 최대한 유연하게 매핑
-    i = 1
-    for _id, d in (defects or {}).items():
-        location = str(d.get("location", "") or d.get("부위", "") or "")
-        member = str(d.get("member", "") or d.get("부재", "") or "")
-        defect_type = str(d.get("type", "") or d.get("유형", "") or d.get("유형 및 형상", "") or "")
-        width_mm = float(d.get("width_mm", d.get("폭(mm)", d.get("폭", 0.0))) or 0.0)
-        length_m = float(d.get("length_m", d.get("길이(m)", d.get("길이", 0.0))) or 0.0)
-        count = int(d.get("count", d.get("개소(EA)", d.get("개수", 1))) or 1)
-        cause = str(d.get("cause", d.get("비고", "")) or "")
-        progress = str(d.get("progress", d.get("진행", "X")) or "X")
+    for i, d in enumerate((defects or {}).values(), 1):
+        progress = str(_lookup(d, ("progress", "진행"), "X") or "X")
 
         rows.append(
             DefectRow(
                 no=i,
-                location=location,
-                member=member,
-                defect_type=defect_type,
-                width_mm=width_mm,
-                length_m=length_m,
-                count=count,
+                location=str(d.get("location") or d.get("부위") or ""),
+                member=str(d.get("member") or d.get("부재") or ""),
+                defect_type=str(d.get("type") or d.get("유형") or d.get("유형 및 형상") or ""),
+                width_mm=float(_lookup(d, ("width_mm", "폭(mm)", "폭"), 0.0) or 0.0),
+                length_m=float(_lookup(d, ("length_m", "길이(m)", "길이"), 0.0) or 0.0),
+                count=int(_lookup(d, ("count", "개소(EA)", "개수"), 1) or 1),
                 progress=progress if progress in ("O", "X") else "X",
-                note=cause,
+                note=str(_lookup(d, ("cause", "비고"), "") or ""),
             )
         )
-        i += 1
 
     return rows
 
@@ -126,6 +131,29 @@ def _extract_defect_rows(defects: Dict[str, Any]) -> List[DefectRow]:
 # HWPX template engine
 # -------------------------
 
+# 이미 압축된 형식 → 다시 deflate 해도 크기 이득은 거의 없고 CPU만 씀
+_STORED_EXTS = (".png", ".jpg", ".jpeg", ".gif", ".bmp")
+_XML_COMPRESSLEVEL = 1
+
+
+def _is_stored_entry(item: zipfile.ZipInfo) -> bool:
+    # mimetype 처럼 템플릿에서 무압축인 항목은 그대로 (HWPX/ODF 규칙)
+    return item.compress_type == zipfile.ZIP_STORED or item.filename.lower().endswith(_STORED_EXTS)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_template_bytes(path: str, mtime: float) -> bytes:
+    # 여러 소분류를 연달아 출력할 때 같은 템플릿을 매번 디스크에서 읽지 않음
+    # (mtime이 키에 포함 → 템플릿을 고치면 새로 읽음)
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _xml_escape(value: str) -> str:
+    # 텍스트/속성값 어느 쪽에 들어가도 안전하도록 & < > " 이스케이프
+    return _sax_escape(value, {'"': "&quot;"})
+
+
 class HwpxTemplateEngine:
     """HWPX(=zip) 템플릿을 열어 section0.xml의 텍스트 노드를 치환한다."""
 
@@ -139,32 +167,57 @@ class HwpxTemplateEngine:
                 "templates 폴더에 템플릿 hwpx를 준비하세요."
             )
 
-        with zipfile.ZipFile(self.template_path, "r") as zin:
-            with zipfile.ZipFile(out_path, "w", compression=zipfile.ZIP_DEFLATED) as zout:
-                for item in zin.infolist():
-                    data = zin.read(item.filename)
+        template = _load_template_bytes(self.template_path, os.path.getmtime(self.template_path))
 
+        with zipfile.ZipFile(io.BytesIO(template), "r") as zin:
+            with zipfile.ZipFile(out_path, "w", compression=zipfile.ZIP_DEFLATED,
+                                 compresslevel=_XML_COMPRESSLEVEL) as zout:
+                for item in zin.infolist():
+                    # 압축 방식은 원본 항목을 읽은(연) 다음에 바꿔야 함 (읽기는 원래 방식으로 풀어야 하므로)
                     if item.filename.lower().endswith("contents/section0.xml"):
-                        data = self._replace_text_in_section0(data, replacements)
-
-                    zout.writestr(item, data)
+                        data = self._replace_text_in_section0(zin.read(item), replacements)
+                    elif _is_stored_entry(item):
+                        # 이미지 등 큰 무압축 항목은 통째로 읽지 않고 64KB씩 복사 (압축 수준 불필요)
+                        with zin.open(item, "r") as src:
+                            item.compress_type = zipfile.ZIP_STORED
+                            with zout.open(item, "w") as dst:
+                                shutil.copyfileobj(src, dst, 64 * 1024)
+                        continue
+                    else:
+                        data = zin.read(item)
+
+                    # XML 등: 원본 항목 정보(시각/속성)는 유지하고 압축 수준은 공개 API로 지정
+                    item.compress_type = zipfile.ZIP_DEFLATED
+                    zout.writestr(item, data, compresslevel=_XML_COMPRESSLEVEL)
 
     def _replace_text_in_section0(self, xml_bytes: bytes, replacements: Dict[str, str]) -> bytes:
         # HWPX는 보통 UTF-8 XML
-        root = ET.fromstring(xml_bytes)
+        # 플레이스홀더(__TITLE__ 등)는 XML 문법과 겹치지 않는 ASCII 토큰이므로
+        # DOM 파싱/재직렬화 없이 바이트 그대로 치환 (네임스페이스 접두어/선언도 원본 유지)
+        if not replacements:
+            return xml_bytes
+        raw = {k.encode("utf-8"): v for k, v in replacements.items()}
+
+        # 모든 키를 한 패턴으로 묶어 버퍼를 한 번만 훑음 (키마다 전체 스캔 X)
+        # 긴 키를 앞에 둬서 접두어가 겹치는 키도 가장 긴 것으로 일치, 치환된 값은 다시 치환되지 않음
+        # (같은 키 조합이면 re 모듈 내부 캐시로 컴파일은 한 번)
+        pattern = re.compile(b"|".join(re.escape(k) for k in sorted(raw, key=len, reverse=True)))
 
-        # 모든 텍스트 노드 순회하며 플레이스홀더 치환
-        for elem in root.iter():
-            if elem.text:
-                for k, v in replacements.items():
-                    if k in elem.text:
-                        elem.text = elem.text.replace(k, v)
-            if elem.tail:
-                for k, v in replacements.items():
-                    if k in elem.tail:
-                        elem.tail = elem.tail.replace(k, v)
+        # 플레이스홀더가 하나도 없으면 원본 그대로 (값 이스케이프/인코딩도 하지 않음)
+        if pattern.search(xml_bytes) is None:
+            return xml_bytes
 
-        return ET.tostring(root, encoding="utf-8", xml_declaration=True)
+        # 값(__TABLE_JSON__ 등은 클 수 있음)은 실제로 나온 키만 한 번씩 이스케이프
+        encoded: Dict[bytes, bytes] = {}
+
+        def _value(m: re.Match) -> bytes:
+            key = m.group()
+            v = encoded.get(key)
+            if v is None:
+                v = encoded[key] = _xml_escape(raw[key]).encode("utf-8")
+            return v
+
+        return pattern.sub(_value, xml_bytes)
 
 
 # -------------------------
@@ -254,3 +307,21 @@ class ReportExporter:
             },
         )
         return out_path
+
+
+def export_all(project: Project, subparts: List[Tuple[Part, SubPart]], project_path: str) -> List[str]:
+    """여러 소분류의 보고서(육안조사결함현황/하자도면)를 스레드로 동시에 생성.
+    각 작업은 템플릿(캐시)만 공유하고 출력 파일이 서로 달라 공유 상태가 없음.
+    zlib 압축/파일 쓰기 동안 GIL 이 풀리므로 스레드로 충분. 반환: 생성 경로(요청 순서)
+    """
+    tasks = []
+    for part, sub in subparts:
+        exporter = ReportExporter(project, part, sub, project_path)
+        tasks.append(exporter.export_visual_inspection)
+        tasks.append(exporter.export_defect_drawing)
+    if not tasks:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as pool:
+        futures = [pool.submit(task) for task in tasks]
+        return [f.result() for f in futures]
@@ -1,36 +1,83 @@
 from __future__ import annotations
 import json
+import os
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict
 from models import Project
 
+try:
+    import orjson   # 선택 의존성: 있으면 C 구현으로 읽기/쓰기, 없으면 표준 json
+except ImportError:
+    orjson = None
 
-def load_project(path: str) -> Project:
-    p = Path(path)
+
+def _read_json(p: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(p.read_bytes())
     with p.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+        return json.load(f)
+
+
+def _json_bytes(obj: Any, pretty: bool) -> bytes:
+    # 두 경로 모두 UTF-8 그대로 (ensure_ascii=False 와 같은 결과)
+    if orjson is not None:
+        # 문자열이 아닌 키도 json처럼 문자열로 변환 (없으면 orjson은 TypeError)
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        text = json.dumps(obj, ensure_ascii=False, indent=2)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
+
+
+# 이미 만든(확인한) 저장 폴더 → 저장할 때마다 mkdir 호출 생략
+_ensured_dirs: set[Path] = set()
+
+
+def _write_atomic(p: Path, data: bytes) -> None:
+    """임시 파일에 다 쓴 뒤 교체 → 쓰는 도중 종료돼도 기존 파일은 온전히 남음"""
+    parent = p.parent
+    if parent not in _ensured_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(parent)
+    tmp = p.with_name(p.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, p)
+
+
+def load_project(path: str) -> Project:
+    data = _read_json(Path(path))
     proj = Project.from_dict(data)
     return proj
 
 
 def save_project(project: Project, path: str) -> None:
-    p = Path(path)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    with p.open("w", encoding="utf-8") as f:
-        json.dump(project.to_dict(), f, ensure_ascii=False, indent=2)
+    _write_atomic(Path(path), _json_bytes(project.to_dict(), pretty=True))
 
 
-def load_index(index_path: str) -> Dict[str, str]:
-    """id -> project_file_path"""
-    p = Path(index_path)
-    if not p.exists():
+def save_project_fast(project: Project, path: str) -> None:
+    """편집 중 잦은 자동 저장용: 들여쓰기 없이 한 번에 직렬화
+    (orjson, 또는 indent 없는 json.dumps → C 인코더를 통째로 사용, load_project로 그대로 읽힘)
+    """
+    _write_atomic(Path(path), _json_bytes(project.to_dict(), pretty=False))
+
+
+def load_index(index_path: str) -> Dict[str, Dict[str, Any]]:
+    """id -> {"path": project_file_path, "name": 목록 표시용 건축물명}
+    구버전 인덱스(id -> project_file_path)는 name=None 으로 읽음 (호출 측에서 한 번 채움)
+    """
+    try:
+        raw = _read_json(Path(index_path))
+    except FileNotFoundError:
         return {}
-    with p.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return {
+        pid: v if isinstance(v, dict) else {"path": v, "name": None}
+        for pid, v in raw.items()
+    }
 
 
-def save_index(index: Dict[str, str], index_path: str) -> None:
-    p = Path(index_path)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    with p.open("w", encoding="utf-8") as f:
-        json.dump(index, f, ensure_ascii=False, indent=2)
+def save_index(index: Dict[str, Dict[str, Any]], index_path: str) -> None:
+    _write_atomic(Path(index_path), _json_bytes(index, pretty=True))